@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 from . import views
@@ -7,7 +8,7 @@ urlpatterns = [
     path('register/', views.register, name='register'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('logout/', views.logout, name='logout'),
-    path('profile/', views.profile, name='profile'),
+    path('profile/', views.async_profile if settings.ASYNC_READ_VIEWS else views.profile, name='profile'),
     path('delete/', views.delete_user, name='delete_user'),
     path('update/', views.update_profile, name='update_profile'),
 ]
\ No newline at end of file
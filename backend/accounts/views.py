@@ -8,6 +8,7 @@ from rest_framework_simplejwt.exceptions import TokenError
 from django.contrib.auth import authenticate, get_user_model
 from django.db.models import Q
 from django.db import IntegrityError
+from training.utils.async_utils import async_read_view, json_response
 from .serializers import UserRegistrationSerializer, UserSerializer, UserUpdateSerializer
 
 User = get_user_model()
@@ -136,6 +137,11 @@ def profile(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@async_read_view()
+async def async_profile(request):
+    """Async twin of profile for ASGI deployments (settings.ASYNC_READ_VIEWS)"""
+    return json_response(UserSerializer(request.user).data)
+
 @api_view(['DELETE'])
 @permission_classes([IsAuthenticated])
 def delete_user(request):
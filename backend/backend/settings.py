@@ -1,5 +1,6 @@
 from datetime import timedelta
 import os
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -27,6 +28,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'training.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -54,11 +56,55 @@ TEMPLATES = [
     },
 ]
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Database: DB_ENGINE=sqlite (default, single node) or DB_ENGINE=postgres
+def env_flag(name, default=False):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',  # needs psycopg2
+            'NAME': os.environ.get('POSTGRES_DB', 'mobile_app'),
+            'USER': os.environ.get('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            # Keep connections open between requests; check them before reuse
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': env_flag('DB_CONN_HEALTH_CHECKS', True),
+            # pgbouncer in transaction pooling mode can't keep server-side cursors
+            # open across transactions
+            'DISABLE_SERVER_SIDE_CURSORS': env_flag('DB_PGBOUNCER'),
+        }
     }
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+            # Seconds a writer waits for the lock before "database is locked"
+            'OPTIONS': {'timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20))},
+            # On disk so threaded tests get real locking (in-memory shared cache fails fast instead of waiting)
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
+        }
+    }
+else:
+    raise ValueError(f"Unsupported DB_ENGINE {DB_ENGINE!r}; use 'sqlite' or 'postgres'")
+
+# @query_budget overruns raise instead of logging; on by default under `manage.py test`
+QUERY_BUDGET_STRICT = env_flag('QUERY_BUDGET_STRICT', sys.argv[1:2] == ['test'])
+
+# Serve the hot read endpoints with async views; for ASGI deployments (backend/asgi.py)
+ASYNC_READ_VIEWS = env_flag('ASYNC_READ_VIEWS')
+
+# Applied to every new SQLite connection (training/signals.py). WAL lets readers
+# run alongside the single writer; NORMAL sync is durable in WAL mode short of power loss.
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'wal'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'normal'),
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20)) * 1000,
 }
 
 AUTH_USER_MODEL = 'accounts.User'
@@ -70,6 +116,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed when installed; same JSON as DRF's JSONRenderer (see FastJSONRenderer for float formatting)
+    'DEFAULT_RENDERER_CLASSES': [
+        'training.utils.json_utils.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'training.utils.json_utils.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 SIMPLE_JWT = {
@@ -96,6 +152,21 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# Brotli/gzip for API responses (training/middleware.py); small bodies aren't worth the CPU
+RESPONSE_COMPRESSION = {
+    'MIN_SIZE': 1024,
+    'BROTLI_QUALITY': 5,
+    # HTML is left to Django's GZipMiddleware, which pads against BREACH
+    'CONTENT_TYPES': ('application/json',),
+}
+
+# Plan preview cache: in-process LRU, optionally shared through a CACHES alias
+PLAN_PREVIEW_CACHE = {
+    'MAX_ENTRIES': 256,
+    'BACKEND': None,  # e.g. 'default' to share entries across workers
+    'TIMEOUT': 3600,
+}
+
 # CORS settings
 if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True
@@ -109,6 +180,7 @@ else:
     ]
 
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['ETag', 'X-Sync-Cursor']
 
 # Internationalization
 LANGUAGE_CODE = 'en-us'
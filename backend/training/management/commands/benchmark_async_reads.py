@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import uuid
+from time import perf_counter
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.client import AsyncRequestFactory, RequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from training.management.commands.benchmark_db_writes import benchmark_plan
+from training.utils.benchmark_utils import add_output_argument, deleted_afterwards, percentiles, write_report
+from training.utils.logging_utils import current_week_start, get_or_materialize_week_log
+from training.utils.plan_generation_utils import save_generated_plans
+from training.views import async_views
+from training.views.generic_views import get_muscles
+from training.views.logging_views import get_week_log
+from training.views.plan_views import get_saved_plans
+
+ENDPOINTS = {
+    "week_log": (get_week_log, async_views.get_week_log),
+    "saved_plans": (get_saved_plans, async_views.get_saved_plans),
+    "muscles": (get_muscles, async_views.get_muscles),
+}
+
+class Command(BaseCommand):
+    help = (
+        'Compares read throughput of the sync views on a fixed thread pool (WSGI workers) with the '
+        'async views on one event loop (ASGI), with simulated slow clients. Its users are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20)
+        parser.add_argument('--requests', type=int, default=400, help='Requests per endpoint and model.')
+        parser.add_argument('--workers', type=int, default=4, help='Thread pool size for the sync model.')
+        parser.add_argument('--concurrency', type=int, default=64, help='In-flight requests for the async model.')
+        parser.add_argument('--client-delay-ms', type=float, default=20,
+                            help='Time each request holds its worker besides the view, e.g. a slow mobile upload.')
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        prefix = f"asyncbench-{uuid.uuid4().hex[:8]}"
+        with deleted_afterwards(prefix):
+            report = self.run(prefix, options)
+
+        write_report(self, report, options['output'])
+
+    def run(self, prefix, options):
+        User = get_user_model()
+        users = [
+            User.objects.create_user(username=f"{prefix}-{i}", email=f"{prefix}-{i}@example.com", password="benchmark")
+            for i in range(options['users'])
+        ]
+        save_generated_plans([(user, benchmark_plan()) for user in users])
+        week = current_week_start()
+        for user in users:
+            get_or_materialize_week_log(user, week)
+        tokens = [f"Bearer {RefreshToken.for_user(user).access_token}" for user in users]
+
+        delay = options['client_delay_ms'] / 1000
+        results = {}
+        for name, (sync_view, async_view) in ENDPOINTS.items():
+            results[name] = {
+                "wsgi_threads": self.measure_threads(sync_view, tokens, delay, options),
+                "asgi_event_loop": asyncio.run(self.measure_event_loop(async_view, tokens, delay, options)),
+            }
+        return {
+            "users": len(users),
+            "requests": options['requests'],
+            "workers": options['workers'],
+            "concurrency": options['concurrency'],
+            "client_delay_ms": options['client_delay_ms'],
+            "results": results,
+        }
+
+    def measure_threads(self, view, tokens, delay, options):
+        factory = RequestFactory()
+        latencies = []
+        lock = threading.Lock()
+        pending = iter(range(options['requests']))
+
+        def worker():
+            try:
+                while True:
+                    with lock:
+                        i = next(pending, None)
+                    if i is None:
+                        return
+                    started = perf_counter()
+                    time.sleep(delay)
+                    view(factory.get("/", HTTP_AUTHORIZATION=tokens[i % len(tokens)])).render()
+                    latencies.append((perf_counter() - started) * 1000)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(options['workers'])]
+        started = perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return self.summary(latencies, perf_counter() - started)
+
+    async def measure_event_loop(self, view, tokens, delay, options):
+        factory = AsyncRequestFactory()
+        latencies = []
+        slots = asyncio.Semaphore(options['concurrency'])
+
+        async def handle(i):
+            async with slots:
+                started = perf_counter()
+                await asyncio.sleep(delay)
+                await view(factory.get("/", headers={"Authorization": tokens[i % len(tokens)]}))
+                latencies.append((perf_counter() - started) * 1000)
+
+        started = perf_counter()
+        await asyncio.gather(*(handle(i) for i in range(options['requests'])))
+        return self.summary(latencies, perf_counter() - started)
+
+    def summary(self, latencies, elapsed):
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "requests_per_s": round(len(latencies) / elapsed, 1),
+            "latency_ms": percentiles(latencies),
+        }
@@ -0,0 +1,134 @@
+import threading
+import uuid
+from datetime import timedelta
+from time import perf_counter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, DatabaseError
+from training.models import ExerciseLog
+from training.utils.benchmark_utils import add_output_argument, deleted_afterwards, percentiles, write_report
+from training.utils.logging_utils import current_week_start, get_or_materialize_week_log, upsert_set_logs
+from training.utils.plan_generation_utils import save_generated_plans
+
+def benchmark_plan(days=4, exercises_per_day=5):
+    return {
+        "name": "Benchmark Plan",
+        "days_per_week": days,
+        "days": [
+            {"day_name": f"Day {day}", "exercises": [
+                {"exercise_name": f"Benchmark Exercise {day}.{ex}", "sets": 3, "start_reps": 8, "end_reps": 12, "skip": False}
+                for ex in range(exercises_per_day)
+            ]}
+            for day in range(days)
+        ],
+    }
+
+class Command(BaseCommand):
+    help = (
+        'Measures concurrent write throughput (set logging, week log creation) against the '
+        'configured database. Run once per DB_ENGINE to compare. Its users are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=50, help='Write requests per thread and phase.')
+        parser.add_argument('--sets-per-request', type=int, default=5)
+        parser.add_argument('--shared-user', action='store_true',
+                            help='All threads log sets for one user (row lock contention) instead of one user each.')
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        prefix = f"dbbench-{uuid.uuid4().hex[:8]}"
+        with deleted_afterwards(prefix):
+            report = self.run(prefix, options)
+
+        write_report(self, report, options['output'])
+
+    def run(self, prefix, options):
+        User = get_user_model()
+        threads = options['threads']
+        user_count = 1 if options['shared_user'] else threads
+        users = [
+            User.objects.create_user(username=f"{prefix}-{i}", email=f"{prefix}-{i}@example.com", password="benchmark")
+            for i in range(user_count)
+        ]
+        save_generated_plans([(user, benchmark_plan()) for user in users])
+        week = current_week_start()
+        exercises = {}
+        for user in users:
+            get_or_materialize_week_log(user, week)
+            exercises[user.pk] = list(
+                ExerciseLog.objects.filter(workout_day_log__workout_log__user=user, workout_day_log__workout_log__start_date=week)
+                .values_list("id", flat=True)
+            )
+
+        def log_sets(thread, i):
+            user = users[thread % user_count]
+            upsert_set_logs(user, [
+                {"exercise": exercises[user.pk][(i + n) % len(exercises[user.pk])], "client_key": f"{thread}-{i}-{n}",
+                 "set_number": n + 1, "weight": 100, "reps": 8, "rpe": 8}
+                for n in range(options['sets_per_request'])
+            ])
+
+        def create_week(thread, i):
+            # Every thread races for the same future weeks of its user, like parallel launch requests
+            get_or_materialize_week_log(users[thread % user_count], week + timedelta(weeks=i + 1))
+
+        return {
+            "database": self.describe_database(),
+            "threads": threads,
+            "users": user_count,
+            "requests_per_thread": options['requests'],
+            "results": {
+                "set_logging": self.measure(log_sets, threads, options['requests'], options['sets_per_request']),
+                "week_log_creation": self.measure(create_week, threads, options['requests'], 1),
+            },
+        }
+
+    def measure(self, func, threads, requests, rows_per_request):
+        latencies = []
+        errors = []
+        barrier = threading.Barrier(threads)
+
+        def worker(thread):
+            try:
+                barrier.wait()
+                for i in range(requests):
+                    started = perf_counter()
+                    try:
+                        func(thread, i)
+                    except DatabaseError as exc:  # e.g. "database is locked"
+                        errors.append(str(exc))
+                        continue
+                    latencies.append((perf_counter() - started) * 1000)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+        started = perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = perf_counter() - started
+
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "requests": len(latencies),
+            "rows": len(latencies) * rows_per_request,
+            "requests_per_s": round(len(latencies) / elapsed, 1),
+            "rows_per_s": round(len(latencies) * rows_per_request / elapsed, 1),
+            "latency_ms": percentiles(latencies) if latencies else None,
+            "errors": len(errors),
+            "first_error": errors[0] if errors else None,
+        }
+
+    def describe_database(self):
+        db = settings.DATABASES['default']
+        info = {"vendor": connection.vendor, "conn_max_age": db.get('CONN_MAX_AGE', 0)}
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                for pragma in ("journal_mode", "synchronous", "busy_timeout"):
+                    info[pragma] = cursor.execute(f"PRAGMA {pragma}").fetchone()[0]
+        return info
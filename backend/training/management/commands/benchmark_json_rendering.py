@@ -0,0 +1,123 @@
+from time import perf_counter, process_time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from training.management.commands.benchmark_db_writes import benchmark_plan
+from training.models import ExerciseLog, WorkoutLog, WorkoutPlan
+from training.serializers import WorkoutPlanSerializer
+from training.serializers.logging_serializers import WorkoutLogSerializer
+from training.utils.benchmark_utils import add_output_argument, percentiles, rolled_back, write_report
+from training.utils.compression_utils import brotli
+from training.utils.json_utils import FastJSONRenderer, orjson
+from training.utils.logging_utils import current_week_start, get_or_materialize_week_log, upsert_set_logs, week_log_queryset
+from training.utils.plan_generation_utils import save_generated_plans
+from training.utils.projection_utils import (
+    LOG_COLUMNS, assemble_saved_plans, assemble_week_log, project_saved_plans, project_week_log,
+    saved_plans_rows, week_log_rows,
+)
+
+class Command(BaseCommand):
+    help = (
+        'Measures serialization (ModelSerializer vs column projections) and JSON rendering CPU '
+        '(DRF stdlib vs orjson), and compressed sizes, for week log and saved plan payloads. '
+        'All data is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--plans', type=int, default=10, help='Saved plans in the plans payload.')
+        parser.add_argument('--days', type=int, default=6)
+        parser.add_argument('--exercises-per-day', type=int, default=6)
+        parser.add_argument('--sets-per-exercise', type=int, default=4)
+        parser.add_argument('--iterations', type=int, default=200)
+        parser.add_argument('--brotli-quality', type=int, default=5)
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        report = {}
+        with rolled_back():
+            report = self.run(options)
+
+        write_report(self, report, options['output'])
+
+    def run(self, options):
+        user = get_user_model().objects.create_user(
+            username='json_benchmark_user', email='json_benchmark@example.com', password='benchmark'
+        )
+        plan = benchmark_plan(options['days'], options['exercises_per_day'])
+        save_generated_plans([(user, plan)] * options['plans'])
+        week = current_week_start()
+        get_or_materialize_week_log(user, week)
+        exercise_ids = ExerciseLog.objects.filter(workout_day_log__workout_log__user=user).values_list("id", flat=True)
+        upsert_set_logs(user, [
+            {"exercise": exercise_id, "client_key": f"{exercise_id}-{n}", "set_number": n + 1,
+             "weight": 102.5, "reps": 8, "rpe": 8.5, "notes": "Paused reps, felt strong"}
+            for exercise_id in exercise_ids for n in range(options['sets_per_exercise'])
+        ])
+
+        log = week_log_queryset().get(user=user, start_date=week)
+        plans = WorkoutPlan.objects.filter(user=user).order_by("id").prefetch_related("days__exercises")
+        log_row = WorkoutLog.objects.filter(pk=log.pk).values_list(*LOG_COLUMNS).get()
+        week_rows = [list(rows) for rows in week_log_rows(log.pk)]
+        plan_rows = [list(rows) for rows in saved_plans_rows(user)]
+        # In-memory: serializer on prefetched instances vs assembly of fetched rows; then both including their queries
+        payloads = {
+            "week_log": (
+                lambda: WorkoutLogSerializer(log).data,
+                lambda: assemble_week_log(log_row, *week_rows)[0],
+                lambda: WorkoutLogSerializer(week_log_queryset().get(user=user, start_date=week)).data,
+                lambda: project_week_log(user, week)[0],
+            ),
+            "saved_plans": (
+                lambda: WorkoutPlanSerializer(list(plans), many=True).data,
+                lambda: assemble_saved_plans(*plan_rows),
+                lambda: WorkoutPlanSerializer(list(plans.all()), many=True).data,
+                lambda: project_saved_plans(user),
+            ),
+        }
+        return {
+            "orjson": orjson is not None,
+            "brotli": brotli is not None,
+            "plans": options['plans'],
+            "days": options['days'],
+            "exercises_per_day": options['exercises_per_day'],
+            "sets_per_exercise": options['sets_per_exercise'],
+            "iterations": options['iterations'],
+            "results": {name: self.measure(*builders, options) for name, builders in payloads.items()},
+        }
+
+    def measure(self, build, assemble, fetch_and_build, project, options):
+        iterations = options['iterations']
+        serialize = self.time(build, iterations)
+        data = build()
+        stdlib, fast = JSONRenderer(), FastJSONRenderer()
+        body = stdlib.render(data)
+        sizes = {"raw": len(body), "gzip": len(compress_string(body))}
+        compress = {"gzip": self.time(lambda: compress_string(body), iterations)}
+        if brotli is not None:
+            sizes["br"] = len(brotli.compress(body, quality=options['brotli_quality']))
+            compress["br"] = self.time(lambda: brotli.compress(body, quality=options['brotli_quality']), iterations)
+        return {
+            "serializer": serialize,
+            "projection": self.time(assemble, iterations),
+            "serializer_with_fetch": self.time(fetch_and_build, iterations),
+            "projection_with_fetch": self.time(project, iterations),
+            "projection_identical_bytes": fast.render(project()) == body,
+            "render_stdlib": self.time(lambda: stdlib.render(data), iterations),
+            "render_fast": self.time(lambda: fast.render(data), iterations),
+            "identical_bytes": fast.render(data) == body,
+            "bytes": sizes,
+            "compress": compress,
+        }
+
+    def time(self, func, iterations):
+        latencies = []
+        cpu_started = process_time()
+        for _ in range(iterations):
+            started = perf_counter()
+            func()
+            latencies.append((perf_counter() - started) * 1000)
+        return {
+            "latency_ms": percentiles(latencies),
+            "cpu_ms_per_call": round((process_time() - cpu_started) * 1000 / iterations, 4),
+        }
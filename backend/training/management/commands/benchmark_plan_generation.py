@@ -0,0 +1,180 @@
+import random
+import statistics
+import tracemalloc
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from training.models import (
+    Equipment,
+    Muscle,
+    ExerciseMovement,
+    ExercisePattern,
+    ExerciseType,
+    WorkoutSplitTemplate,
+    WorkoutDayTemplate,
+    DayPatternThrough,
+    SplitDayThrough
+)
+from training.utils.benchmark_utils import add_output_argument, percentiles, rolled_back, write_report
+from training.utils.catalog_utils import bump_catalog_version, get_catalog
+from training.utils.plan_generation_utils import generate_plan, save_generated_plan
+from training.utils.preview_cache_utils import preview_cache
+
+class Command(BaseCommand):
+    help = 'Benchmarks plan generation against a synthetic catalog. All data is rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--patterns', type=int, default=300)
+        parser.add_argument('--movements', type=int, default=10000)
+        parser.add_argument('--equipment', type=int, default=40)
+        parser.add_argument('--muscles', type=int, default=30)
+        parser.add_argument('--days', type=int, default=6)
+        parser.add_argument('--patterns-per-day', type=int, default=6)
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=0)
+        add_output_argument(parser)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        report = {}
+        try:
+            with rolled_back():
+                report = self.run(options)
+        finally:
+            bump_catalog_version()
+            preview_cache.clear()
+
+        write_report(self, report, options['output'])
+
+    def run(self, options):
+        started = perf_counter()
+        equipment_ids, muscle_ids = self.build_catalog(options)
+        build_seconds = perf_counter() - started
+
+        user = get_user_model().objects.create_user(
+            username='benchmark_user', email='benchmark@example.com', password='benchmark'
+        )
+        iterations = options['iterations']
+        available = self.rng.sample(equipment_ids, max(1, len(equipment_ids) // 3))
+        preferences = [
+            {"days_per_week": options['days'], "training_age": 1, "volume": "moderate",
+             "bodyweight_exercises": "weighted", "equipment": available, "seed": seed}
+            for seed in range(iterations)
+        ]
+
+        started = perf_counter()
+        get_catalog()
+        snapshot_seconds = perf_counter() - started
+
+        priority = self.rng.sample(muscle_ids, min(3, len(muscle_ids)))
+        coverage_preferences = [dict(p, mode="coverage", priority_muscles=priority) for p in preferences]
+
+        plans = []
+        results = {
+            "generate_plan": self.measure(lambda i: plans.append(generate_plan(preferences[i])), iterations),
+            "generate_plan_coverage": self.measure(lambda i: generate_plan(coverage_preferences[i]), iterations),
+            "save_generated_plan": self.measure(lambda i: save_generated_plan(user, plans[i]), iterations),
+        }
+
+        client = APIClient(SERVER_NAME='localhost')
+        client.force_authenticate(user)
+        preview_cache.clear()
+        results["preview_endpoint"] = self.measure(
+            lambda i: client.post('/api/plan/preview/', preferences[i], format='json'), iterations
+        )
+        results["preview_endpoint_cached"] = self.measure(
+            lambda i: client.post('/api/plan/preview/', preferences[i], format='json'), iterations
+        )
+
+        return {
+            "catalog": {
+                "patterns": options['patterns'],
+                "movements": options['movements'],
+                "equipment": options['equipment'],
+                "muscles": options['muscles'],
+                "days": options['days'],
+                "patterns_per_day": options['patterns_per_day'],
+                "build_seconds": round(build_seconds, 3),
+                "snapshot_load_ms": round(snapshot_seconds * 1000, 3),
+            },
+            "iterations": iterations,
+            "results": results,
+        }
+
+    def measure(self, func, iterations):
+        latencies = []
+        query_counts = []
+        for i in range(iterations):
+            with CaptureQueriesContext(connection) as ctx:
+                started = perf_counter()
+                func(i)
+                latencies.append((perf_counter() - started) * 1000)
+            query_counts.append(len(ctx.captured_queries))
+
+        # Separate pass: tracemalloc would otherwise inflate the latencies
+        tracemalloc.start()
+        func(0)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            "latency_ms": percentiles(latencies),
+            "queries": {"min": min(query_counts), "max": max(query_counts), "mean": round(statistics.fmean(query_counts), 2)},
+            "peak_memory_kb": round(peak / 1024, 1),
+        }
+
+    def build_catalog(self, options):
+        # Synthetic splits must be the only match for --days
+        WorkoutSplitTemplate.objects.filter(days_per_week=options['days']).delete()
+
+        equipment = Equipment.objects.bulk_create([
+            Equipment(name=f"Bench Equipment {i}") for i in range(options['equipment'])
+        ])
+        muscles = Muscle.objects.bulk_create([
+            Muscle(name=f"Bench Muscle {i}") for i in range(options['muscles'])
+        ])
+        patterns = ExercisePattern.objects.bulk_create([
+            ExercisePattern(name=f"Bench Pattern {i}") for i in range(options['patterns'])
+        ])
+
+        primary = ExercisePattern.primary_muscles.through
+        secondary = ExercisePattern.secondary_muscles.through
+        primary.objects.bulk_create([
+            primary(exercisepattern=p, muscle=m) for p in patterns for m in self.rng.sample(muscles, 2)
+        ])
+        secondary.objects.bulk_create([
+            secondary(exercisepattern=p, muscle=m) for p in patterns for m in self.rng.sample(muscles, 3)
+        ])
+
+        movements = ExerciseMovement.objects.bulk_create([
+            ExerciseMovement(
+                name=f"Bench Movement {i}",
+                pattern=self.rng.choice(patterns),
+                type=self.rng.choice(ExerciseType.values),
+            )
+            for i in range(options['movements'])
+        ])
+        movement_equipment = ExerciseMovement.equipment.through
+        movement_equipment.objects.bulk_create([
+            movement_equipment(exercisemovement=mv, equipment=eq)
+            for mv in movements for eq in self.rng.sample(equipment, self.rng.randint(1, 3))
+        ])
+
+        split = WorkoutSplitTemplate.objects.create(name="Benchmark Split", days_per_week=options['days'])
+        days = WorkoutDayTemplate.objects.bulk_create([
+            WorkoutDayTemplate(name=f"Bench Day {i}") for i in range(options['days'])
+        ])
+        SplitDayThrough.objects.bulk_create([
+            SplitDayThrough(split=split, day_template=day, day_index=i) for i, day in enumerate(days)
+        ])
+        DayPatternThrough.objects.bulk_create([
+            DayPatternThrough(day_template=day, pattern=pattern, pattern_index=i)
+            for day in days
+            for i, pattern in enumerate(self.rng.sample(patterns, options['patterns_per_day']))
+        ])
+
+        # bulk_create skips the catalog signals
+        bump_catalog_version()
+        return [eq.id for eq in equipment], [m.id for m in muscles]
@@ -0,0 +1,22 @@
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand
+from training.utils.logging_utils import current_week_start, prematerialize_week, PREMATERIALIZE_BATCH_SIZE
+
+class Command(BaseCommand):
+    help = (
+        "Creates next week's workout logs for every active user ahead of time, so the "
+        "first request of the week is a read. Meant for an off-peak schedule; safe to rerun."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--week', type=date.fromisoformat,
+                            help='Monday of the week to create (YYYY-MM-DD). Defaults to next week.')
+        parser.add_argument('--active-weeks', type=int, default=4,
+                            help='Only users who logged or saved a plan within this many weeks.')
+        parser.add_argument('--batch-size', type=int, default=PREMATERIALIZE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        week = options['week'] or current_week_start() + timedelta(weeks=1)
+        active_since = week - timedelta(weeks=options['active_weeks'])
+        created = prematerialize_week(week, active_since, options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Created {created} week logs for {week}."))
@@ -0,0 +1,19 @@
+from datetime import date
+from django.core.management.base import BaseCommand
+from training.utils.logging_utils import current_week_start
+from training.utils.progression_utils import progress_week, PROGRESSION_CHUNK_SIZE
+
+class Command(BaseCommand):
+    help = "Recomputes each user's weekly targets from the previous week's sets. Safe to rerun."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--week', type=date.fromisoformat,
+                            help='Monday of the week to progress (YYYY-MM-DD). Defaults to the current week.')
+        parser.add_argument('--chunk-size', type=int, default=PROGRESSION_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        week = options['week'] or current_week_start()
+        logs, updated = progress_week(week, options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Progressed {logs} week logs for {week}; {updated} exercise targets changed."
+        ))
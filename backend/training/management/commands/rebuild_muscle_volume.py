@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from training.utils.volume_utils import rebuild_muscle_volume, REBUILD_CHUNK_SIZE
+
+class Command(BaseCommand):
+    help = 'Recomputes the weekly per-muscle volume table from logged sets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help='Only rebuild this user id (repeatable). Defaults to every user.')
+        parser.add_argument('--chunk-size', type=int, default=REBUILD_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        count = rebuild_muscle_volume(options['users'], options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} muscle volume rows."))
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.utils.cache import cc_delim_re, patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from training.utils.compression_utils import choose_encoding, compress
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Brotli or gzip for response bodies above RESPONSE_COMPRESSION['MIN_SIZE'],
+    whichever the client accepts (brotli preferred, when installed). Bodies
+    that would not shrink are sent as-is. Works for sync and async views.
+
+    Only RESPONSE_COMPRESSION['CONTENT_TYPES'] (API JSON by default) are
+    touched: HTML pages such as the admin carry CSRF tokens, and compressing
+    them without GZipMiddleware's padding would reopen BREACH. Responses
+    marked Cache-Control: no-transform are left alone.
+    """
+
+    def process_response(self, request, response):
+        config = getattr(settings, "RESPONSE_COMPRESSION", {})
+        if response.streaming or response.has_header("Content-Encoding") or len(response.content) < config.get("MIN_SIZE", 1024):
+            return response
+        content_type = response.get("Content-Type", "").partition(";")[0].strip().lower()
+        if content_type not in config.get("CONTENT_TYPES", ("application/json",)):
+            return response
+        cache_control = {directive.strip().lower() for directive in cc_delim_re.split(response.get("Cache-Control", ""))}
+        if "no-transform" in cache_control:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+        compressed = compress(response.content, encoding, config.get("BROTLI_QUALITY", 5))
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # The representation changed, so a strong validator must become weak (RFC 9110 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
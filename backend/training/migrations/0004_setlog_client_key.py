@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0003_exercisemovement_form_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='setlog',
+            name='client_key',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='setlog',
+            constraint=models.UniqueConstraint(fields=('exercise', 'client_key'), name='unique_setlog_client_key'),
+        ),
+    ]
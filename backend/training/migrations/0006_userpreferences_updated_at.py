@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0005_sync_revisions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userpreferences',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:49
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('training', '0006_userpreferences_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MuscleVolume',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('sets', models.FloatField(default=0)),
+                ('reps', models.FloatField(default=0)),
+                ('tonnage', models.FloatField(default=0)),
+                ('muscle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='training.muscle')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='muscle_volume', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='musclevolume',
+            constraint=models.UniqueConstraint(fields=('user', 'week_start', 'muscle'), name='unique_muscle_volume_week'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('training', '0007_muscle_volume'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExerciseRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('exercise_name', models.CharField(max_length=100)),
+                ('rep_maxes', models.JSONField(default=dict)),
+                ('best_weight', models.FloatField(default=0)),
+                ('best_weight_reps', models.IntegerField(default=0)),
+                ('e1rm_epley', models.FloatField(default=0)),
+                ('e1rm_brzycki', models.FloatField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exercise_records', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='exerciserecord',
+            constraint=models.UniqueConstraint(fields=('user', 'exercise_name'), name='unique_exercise_record'),
+        ),
+    ]
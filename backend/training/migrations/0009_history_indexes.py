@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0008_exercise_record'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exerciselog',
+            index=models.Index(fields=['name'], name='exerciselog_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutlog',
+            index=models.Index(fields=['user', '-start_date', '-id'], name='workoutlog_user_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutplan',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='workoutplan_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:56
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def move_sets(SetLog, source, target):
+    """Re-point `source`'s sets at `target`; a set synced into both copies is kept once."""
+    keyed = {s.client_key: s for s in SetLog.objects.filter(exercise=target, client_key__isnull=False)}
+    for set_log in SetLog.objects.filter(exercise=source).order_by('id'):
+        twin = keyed.get(set_log.client_key) if set_log.client_key else None
+        if twin is None:
+            set_log.exercise = target
+            set_log.save(update_fields=['exercise'])
+        elif (twin.set_number, twin.weight, twin.reps, twin.rpe) != (set_log.set_number, set_log.weight, set_log.reps, set_log.rpe):
+            raise RuntimeError(
+                f"Can't merge duplicate week logs: exercise logs {source.id} and {target.id} both have a set "
+                f"with client_key {set_log.client_key!r} but different values. Resolve it by hand and re-run."
+            )
+
+
+def merge_duplicate_week_logs(apps, schema_editor):
+    """
+    Fold each duplicated week into one copy: the one with the most logged sets
+    (then the oldest). Sets of the other copies move onto the matching exercise
+    (same day order and exercise name); days and exercises the kept copy lacks
+    move over whole. Only the emptied duplicates are deleted, so no logged set
+    is lost.
+    """
+    WorkoutLog = apps.get_model('training', 'WorkoutLog')
+    WorkoutDayLog = apps.get_model('training', 'WorkoutDayLog')
+    ExerciseLog = apps.get_model('training', 'ExerciseLog')
+    SetLog = apps.get_model('training', 'SetLog')
+    duplicated = (
+        WorkoutLog.objects.values('user_id', 'start_date')
+        .annotate(copies=Count('id')).filter(copies__gt=1).order_by()
+    )
+    for week in duplicated:
+        keep, *others = (
+            WorkoutLog.objects.filter(user_id=week['user_id'], start_date=week['start_date'])
+            .annotate(set_count=Count('days__exercises__sets'))
+            .order_by('-set_count', 'id')
+        )
+        days = {day.order: day for day in WorkoutDayLog.objects.filter(workout_log=keep)}
+        for other in others:
+            for day in WorkoutDayLog.objects.filter(workout_log=other).order_by('id'):
+                kept_day = days.get(day.order)
+                if kept_day is None:
+                    day.workout_log = keep
+                    day.save(update_fields=['workout_log'])
+                    days[day.order] = day
+                    continue
+                if day.is_complete and not kept_day.is_complete:
+                    kept_day.is_complete = True
+                    kept_day.save(update_fields=['is_complete'])
+
+                exercises = {ex.name: ex for ex in ExerciseLog.objects.filter(workout_day_log=kept_day)}
+                for exercise in ExerciseLog.objects.filter(workout_day_log=day).order_by('id'):
+                    kept_exercise = exercises.get(exercise.name)
+                    if kept_exercise is None:
+                        exercise.workout_day_log = kept_day
+                        exercise.save(update_fields=['workout_day_log'])
+                        exercises[exercise.name] = exercise
+                    else:
+                        move_sets(SetLog, exercise, kept_exercise)
+
+            if other.is_complete and not keep.is_complete:
+                keep.is_complete = True
+                keep.save(update_fields=['is_complete'])
+            other.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0009_history_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_week_logs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='workoutlog',
+            constraint=models.UniqueConstraint(fields=('user', 'start_date'), name='unique_workoutlog_user_week'),
+        ),
+    ]
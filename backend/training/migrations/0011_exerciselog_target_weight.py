@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0010_unique_week_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exerciselog',
+            name='target_weight',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:00
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def copy_week_to_exercise_logs(apps, schema_editor):
+    """Fill ExerciseLog.user/start_date from each exercise's week log."""
+    ExerciseLog = apps.get_model('training', 'ExerciseLog')
+    WorkoutDayLog = apps.get_model('training', 'WorkoutDayLog')
+    week = WorkoutDayLog.objects.filter(pk=OuterRef('workout_day_log_id'))
+    ExerciseLog.objects.filter(workout_day_log__isnull=False).update(
+        user_id=Subquery(week.values('workout_log__user_id')[:1]),
+        start_date=Subquery(week.values('workout_log__start_date')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('training', '0012_catalog_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exerciselog',
+            name='start_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='exerciselog',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(copy_week_to_exercise_logs, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='exerciselog',
+            index=models.Index(fields=['user', 'name', '-start_date', '-id'], name='exerciselog_history_idx'),
+        ),
+    ]
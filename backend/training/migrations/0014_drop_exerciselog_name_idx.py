@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 19:27
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0013_exerciselog_history'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='exerciselog',
+            name='exerciselog_name_idx',
+        ),
+    ]
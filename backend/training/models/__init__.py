@@ -3,3 +3,5 @@ from .preference_model import *
 from .generation_models import *
 from .plans_models import *
 from .logging_models import *
+from .sync_models import *
+from .analytics_models import *
@@ -0,0 +1,40 @@
+from django.db import models
+from django.contrib.auth import get_user_model
+from training.models.generic_models import Muscle
+
+User = get_user_model()
+
+class MuscleVolume(models.Model):
+    """
+    Weekly training volume per muscle, kept current by every set write.
+    Secondary muscles are credited at half weight, so sets/reps can be fractional.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="muscle_volume")
+    week_start = models.DateField()
+    muscle = models.ForeignKey(Muscle, on_delete=models.CASCADE)
+    sets = models.FloatField(default=0)
+    reps = models.FloatField(default=0)
+    tonnage = models.FloatField(default=0)  # sum of weight * reps
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "week_start", "muscle"], name="unique_muscle_volume_week"),
+        ]
+
+class ExerciseRecord(models.Model):
+    """
+    A user's personal records for one exercise name. rep_maxes maps a rep
+    count to the heaviest weight lifted for it; the other columns derive from it.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="exercise_records")
+    exercise_name = models.CharField(max_length=100)
+    rep_maxes = models.JSONField(default=dict)  # {"5": 100.0, ...}
+    best_weight = models.FloatField(default=0)
+    best_weight_reps = models.IntegerField(default=0)
+    e1rm_epley = models.FloatField(default=0)
+    e1rm_brzycki = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "exercise_name"], name="unique_exercise_record"),
+        ]
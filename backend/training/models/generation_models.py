@@ -64,5 +64,11 @@ class DayPatternThrough(models.Model):
     def __str__(self):
         return f"{self.day_template} - {self.pattern} - {self.pattern_index}"
 
-
-
+class CatalogVersion(models.Model):
+    """
+    Single row holding the catalog's current version token. Bumped whenever a
+    catalog table changes (training/signals.py); lives in the database so every
+    process sees it and it survives restarts.
+    """
+    version = models.CharField(max_length=32)
+    updated_at = models.DateTimeField(auto_now=True)
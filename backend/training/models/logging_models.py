@@ -8,18 +8,37 @@ class WorkoutLog(models.Model):
     start_date = models.DateField()  # Date for the week this log was started
     is_complete = models.BooleanField(default=False)  # for entire week
     created_at = models.DateTimeField(auto_now_add=True)
+    revision = models.BigIntegerField(default=0, db_index=True)  # SyncState revision of the last write
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "-start_date", "-id"], name="workoutlog_user_start_idx")]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "start_date"], name="unique_workoutlog_user_week"),
+        ]
 
 class WorkoutDayLog(models.Model):
     workout_log = models.ForeignKey(WorkoutLog, on_delete=models.CASCADE, related_name='days')
     workout_day = models.ForeignKey("WorkoutDay", on_delete=models.CASCADE)  # e.g., Push
     order = models.IntegerField()  # 0,1,2,... for navigation
     is_complete = models.BooleanField(default=False)
+    revision = models.BigIntegerField(default=0, db_index=True)
 
 class ExerciseLog(models.Model):
     workout_day_log = models.ForeignKey(WorkoutDayLog, on_delete=models.CASCADE, related_name='exercises', null=True, blank=True)
     name = models.CharField(max_length=100)
     target_sets = models.IntegerField()
     target_reps = models.IntegerField()
+    target_weight = models.FloatField(null=True, blank=True)  # set by the progression engine from last week
+    revision = models.BigIntegerField(default=0, db_index=True)
+    # Copied from the week's WorkoutLog when materialized, so per-exercise history
+    # is one index range scan instead of a join through the day and week logs
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    start_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "name", "-start_date", "-id"], name="exerciselog_history_idx"),
+        ]
 
 class SetLog(models.Model):
     exercise = models.ForeignKey(ExerciseLog, on_delete=models.CASCADE, related_name='sets')
@@ -29,3 +48,10 @@ class SetLog(models.Model):
     rpe = models.FloatField(null=True, blank=True)
     notes = models.TextField(blank=True)
     source = models.CharField(max_length=10, choices=[("manual", "Manual"), ("auto", "Auto")], default="manual")
+    client_key = models.CharField(max_length=64, null=True, blank=True)  # client-generated idempotency key
+    revision = models.BigIntegerField(default=0, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["exercise", "client_key"], name="unique_setlog_client_key"),
+        ]
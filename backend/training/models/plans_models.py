@@ -9,6 +9,9 @@ class WorkoutPlan(models.Model):
     days_per_week = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "-created_at", "-id"], name="workoutplan_user_created_idx")]
+
     def __str__(self):
         return f"{self.name} - {self.user.username}"
 
@@ -16,6 +16,7 @@ class UserPreferences(models.Model):
         ("bodyweight", "Bodyweight"), ("weighted", "Weighted"), ("absent", "Absent")
     ])
     equipment = models.ManyToManyField(Equipment)
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return f"{self.user.username}'s Preferences"
\ No newline at end of file
@@ -0,0 +1,19 @@
+from django.db import models
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+class SyncState(models.Model):
+    """Per-user change counter; every write transaction takes the next revision."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="sync_state")
+    revision = models.BigIntegerField(default=0)
+
+class SyncTombstone(models.Model):
+    """Records a deleted log row so clients can drop it on their next sync."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    model = models.CharField(max_length=30)  # e.g. "set"
+    object_id = models.BigIntegerField()
+    revision = models.BigIntegerField()
+
+    class Meta:
+        indexes = [models.Index(fields=["user", "revision"])]
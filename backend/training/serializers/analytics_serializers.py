@@ -0,0 +1,7 @@
+from rest_framework import serializers
+from training.models import ExerciseRecord
+
+class ExerciseRecordSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ExerciseRecord
+        fields = ["exercise_name", "rep_maxes", "best_weight", "best_weight_reps", "e1rm_epley", "e1rm_brzycki"]
@@ -11,7 +11,7 @@ class ExerciseLogSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ExerciseLog
-        fields = '__all__'
+        exclude = ('user', 'start_date')  # denormalized from the week log for history lookups
 
 class WorkoutDayLogSerializer(serializers.ModelSerializer):
     exercises = ExerciseLogSerializer(many=True, required=False)
@@ -27,3 +27,36 @@ class WorkoutLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkoutLog
         fields = '__all__'
+
+class SetLogBatchItemSerializer(serializers.Serializer):
+    client_key = serializers.CharField(max_length=64)
+    exercise = serializers.IntegerField()  # ExerciseLog id; ownership is checked in bulk by the view
+    set_number = serializers.IntegerField(min_value=1)
+    weight = serializers.FloatField(min_value=0)
+    reps = serializers.IntegerField(min_value=0)
+    rpe = serializers.FloatField(required=False, allow_null=True, min_value=0, max_value=10)
+    notes = serializers.CharField(required=False, allow_blank=True, default="")
+    source = serializers.ChoiceField(choices=["manual", "auto"], default="manual")
+
+class SetLogBatchSerializer(serializers.Serializer):
+    sets = SetLogBatchItemSerializer(many=True, allow_empty=False, max_length=500)
+
+class SetKeySerializer(serializers.Serializer):
+    exercise = serializers.IntegerField()
+    client_key = serializers.CharField(max_length=64)
+
+class SyncChangesSerializer(serializers.Serializer):
+    sets = SetLogBatchItemSerializer(many=True, required=False, max_length=500)
+    deleted_sets = SetKeySerializer(many=True, required=False, max_length=500)
+    completed_days = serializers.ListField(child=serializers.IntegerField(), required=False)
+    completed_weeks = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+class SyncRequestSerializer(serializers.Serializer):
+    cursor = serializers.IntegerField(min_value=0, default=0)
+    changes = SyncChangesSerializer(required=False)
+
+class ExerciseHistorySerializer(ExerciseLogSerializer):
+    start_date = serializers.DateField(read_only=True)  # the week's WorkoutLog start
+
+    class Meta(ExerciseLogSerializer.Meta):
+        exclude = ('user',)
@@ -14,6 +14,7 @@ class DayPreviewSerializer(serializers.Serializer):
 class PlanPreviewSerializer(serializers.Serializer):
     name = serializers.CharField()
     days_per_week = serializers.IntegerField()
+    seed = serializers.IntegerField(required=False)
     days = DayPreviewSerializer(many=True)
 
 class PlanRequestSerializer(serializers.Serializer):
@@ -22,3 +23,6 @@ class PlanRequestSerializer(serializers.Serializer):
     volume = serializers.ChoiceField(choices=["low", "moderate", "high"])
     bodyweight_exercises = serializers.ChoiceField(choices=["bodyweight", "weighted", "absent"])
     equipment = serializers.ListField(child=serializers.IntegerField())
+    seed = serializers.IntegerField(required=False, min_value=0)
+    priority_muscles = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+    mode = serializers.ChoiceField(choices=["random", "coverage"], default="random")
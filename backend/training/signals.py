@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from training.models import (
+    Equipment, Muscle, ExercisePattern, ExerciseMovement,
+    WorkoutDayTemplate, WorkoutSplitTemplate, SplitDayThrough, DayPatternThrough,
+)
+from training.utils.catalog_utils import bump_catalog_version
+from training.utils.query_budget_utils import install_query_counter
+
+# Split templates are included because they also determine generated plans
+CATALOG_MODELS = (
+    Equipment, Muscle, ExercisePattern, ExerciseMovement,
+    WorkoutDayTemplate, WorkoutSplitTemplate, SplitDayThrough, DayPatternThrough,
+)
+
+CATALOG_M2M_THROUGH = (
+    ExerciseMovement.equipment.through,
+    ExercisePattern.primary_muscles.through,
+    ExercisePattern.secondary_muscles.through,
+    SplitDayThrough,  # WorkoutSplitTemplate.workouts
+    DayPatternThrough,  # WorkoutDayTemplate.patterns
+)
+
+def invalidate_catalog_on_change(sender, **kwargs):
+    bump_catalog_version()
+
+def invalidate_catalog_on_m2m_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_catalog_version()
+
+for model in CATALOG_MODELS:
+    post_save.connect(invalidate_catalog_on_change, sender=model, dispatch_uid=f"catalog_save_{model.__name__}")
+    post_delete.connect(invalidate_catalog_on_change, sender=model, dispatch_uid=f"catalog_delete_{model.__name__}")
+
+for through in CATALOG_M2M_THROUGH:
+    m2m_changed.connect(invalidate_catalog_on_m2m_change, sender=through, dispatch_uid=f"catalog_m2m_{through.__name__}")
+
+@receiver(connection_created)
+def count_queries_for_budget(sender, connection, **kwargs):
+    install_query_counter(connection)
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    # On the raw sqlite3 connection: connection setup, not queries for debug logs or @query_budget
+    for pragma, value in getattr(settings, "SQLITE_PRAGMAS", {}).items():
+        connection.connection.execute(f"PRAGMA {pragma} = {value}")
@@ -1,2 +1,22 @@
 from .test_api import *
-from .test_plan_generation import *
\ No newline at end of file
+from .test_plan_generation import *
+from .test_catalog import *
+from .test_trace import *
+from .test_preview_cache import *
+from .test_plan_saving import *
+from .test_benchmarks import *
+from .test_coverage import *
+from .test_week_log import *
+from .test_query_budget import *
+from .test_set_logging import *
+from .test_sync import *
+from .test_conditional_get import *
+from .test_muscle_volume import *
+from .test_exercise_records import *
+from .test_history import *
+from .test_week_log_concurrency import *
+from .test_progression import *
+from .test_prematerialize import *
+from .test_async_views import *
+from .test_json_rendering import *
+from .test_projections import *
@@ -0,0 +1,136 @@
+import importlib
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django.test.client import AsyncRequestFactory
+from django.contrib.auth import get_user_model
+from django.urls import clear_url_caches, resolve
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+import accounts.urls
+import backend.urls
+import training.urls
+from accounts.views import async_profile
+from training.models import Muscle, Equipment, UserPreferences, WorkoutLog
+from training.utils.plan_generation_utils import save_generated_plan
+from training.views import async_views
+from .test_plan_saving import make_plan_dict
+
+class AsyncReadViewsTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="async", email="async@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(3, 2))
+        chest = Muscle.objects.create(name="Chest")
+        Equipment.objects.create(name="Barbell")
+        prefs = UserPreferences.objects.create(user=self.user, days_per_week=3, volume="low", bodyweight_exercises="weighted")
+        prefs.priority_muscles.add(chest)
+
+        self.auth = f"Bearer {RefreshToken.for_user(self.user).access_token}"
+        self.factory = AsyncRequestFactory()
+
+    async def call(self, view, auth=None, **headers):
+        request = self.factory.get("/", headers={"Authorization": auth or self.auth, **headers})
+        return await view(request)
+
+    async def test_responses_match_sync_views(self):
+        pairs = [
+            ("/api/plan/get/", async_views.get_saved_plans),
+            ("/api/preferences/get/", async_views.get_preferences),
+            ("/api/muscles/", async_views.get_muscles),
+            ("/api/equipment/", async_views.get_equipment),
+            ("/api/catalog/", async_views.get_catalog_bundle),
+            ("/auth/profile/", async_profile),
+        ]
+        for url, view in pairs:
+            expected = await self.async_get(url)
+            response = await self.call(view)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response.content, expected.content, url)
+            self.assertEqual(response.get("ETag"), expected.get("ETag"), url)
+
+    async def test_week_log_materializes_then_reads(self):
+        created = await self.call(async_views.get_week_log)
+        self.assertEqual(created.status_code, 200)
+        self.assertEqual(await WorkoutLog.objects.acount(), 1)
+        expected = await self.async_get("/api/workout/log/week/")
+        read = await self.call(async_views.get_week_log)
+        self.assertEqual(read.content, expected.content)
+        self.assertEqual(read["ETag"], created["ETag"])
+        self.assertEqual(read["X-Sync-Cursor"], expected["X-Sync-Cursor"])
+        not_modified = await self.call(async_views.get_week_log, **{"If-None-Match": read["ETag"]})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["X-Sync-Cursor"], read["X-Sync-Cursor"])
+
+    async def test_rejects_missing_and_invalid_tokens(self):
+        request = self.factory.get("/")
+        response = await async_views.get_muscles(request)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("WWW-Authenticate", response)
+        response = await self.call(async_views.get_muscles, auth="Bearer not-a-token")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.content, (await self.async_get("/api/muscles/", auth="Bearer not-a-token")).content)
+
+    async def test_head_allowed_other_methods_rejected(self):
+        response = await async_views.get_saved_plans(self.factory.head("/", headers={"Authorization": self.auth}))
+        self.assertEqual(response.status_code, 200)
+        response = await async_views.get_saved_plans(self.factory.post("/", headers={"Authorization": self.auth}))
+        self.assertEqual(response.status_code, 405)
+
+    @override_settings(DEBUG=True)
+    async def test_budget_counts_queries_run_in_threads(self):
+        response = await self.call(async_views.get_saved_plans)
+        expected = await self.async_get("/api/plan/get/")
+        self.assertEqual(response["X-Query-Budget"], "5")
+        self.assertEqual(response["X-Query-Count"], expected["X-Query-Count"])
+        self.assertGreater(int(response["X-Query-Count"]), 0)
+
+    async def test_inactive_user_rejected(self):
+        self.user.is_active = False
+        await self.user.asave()
+        self.assertEqual((await self.call(async_views.get_saved_plans)).status_code, 401)
+
+    async def async_get(self, url, auth=None):
+        """The same request through the sync DRF view."""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=auth or self.auth)
+        return await sync_to_async(client.get)(url)
+
+def reload_urlconfs():
+    # The root URLconf's include() resolvers cache their patterns, so it's rebuilt too
+    for module in (training.urls, accounts.urls, backend.urls):
+        importlib.reload(module)
+    clear_url_caches()
+
+class AsyncUrlconfTestCase(TestCase):
+    """ASYNC_READ_VIEWS swaps the views at import time, so the URLconfs are reloaded around each test."""
+
+    ASYNC_URLS = {
+        "/api/plan/get/": async_views.get_saved_plans,
+        "/api/preferences/get/": async_views.get_preferences,
+        "/api/muscles/": async_views.get_muscles,
+        "/api/equipment/": async_views.get_equipment,
+        "/api/catalog/": async_views.get_catalog_bundle,
+        "/api/workout/log/week/": async_views.get_week_log,
+        "/auth/profile/": async_profile,
+    }
+
+    def setUp(self):
+        with override_settings(ASYNC_READ_VIEWS=True):
+            reload_urlconfs()
+        self.addCleanup(reload_urlconfs)
+        self.user = get_user_model().objects.create_user(username="asgi", email="asgi@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(2, 2))
+        UserPreferences.objects.create(user=self.user, days_per_week=3, volume="low", bodyweight_exercises="weighted")
+        self.headers = {"Authorization": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+
+    async def test_flag_routes_hot_reads_to_async_views(self):
+        for url, view in self.ASYNC_URLS.items():
+            self.assertIs(resolve(url).func, view, url)
+            response = await self.async_client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual((await self.async_client.head(url, headers=self.headers)).status_code, 200, url)
+        self.assertEqual((await self.async_client.get("/api/plan/get/")).status_code, 401)
+
+    def test_flag_off_keeps_sync_views(self):
+        reload_urlconfs()
+        self.assertIsNot(resolve("/api/plan/get/").func, async_views.get_saved_plans)
@@ -0,0 +1,78 @@
+import json
+from io import StringIO
+from unittest import skipUnless
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from training.models import ExerciseMovement, WorkoutLog, WorkoutPlan
+
+class BenchmarkPlanGenerationCommandTestCase(TestCase):
+    def test_small_run_reports_and_rolls_back(self):
+        out = StringIO()
+        call_command(
+            "benchmark_plan_generation", "--patterns", "10", "--movements", "50", "--equipment", "5",
+            "--muscles", "5", "--days", "3", "--patterns-per-day", "4", "--iterations", "3", stdout=out,
+        )
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["catalog"]["movements"], 50)
+        self.assertEqual(
+            set(report["results"]),
+            {"generate_plan", "generate_plan_coverage", "save_generated_plan", "preview_endpoint", "preview_endpoint_cached"},
+        )
+        self.assertIn("p99", report["results"]["generate_plan"]["latency_ms"])
+        self.assertEqual(report["results"]["preview_endpoint_cached"]["queries"]["max"], 0)
+        self.assertFalse(ExerciseMovement.objects.exists())
+        self.assertFalse(WorkoutPlan.objects.exists())
+
+class BenchmarkJsonRenderingCommandTestCase(TestCase):
+    def test_small_run_reports_and_rolls_back(self):
+        out = StringIO()
+        call_command(
+            "benchmark_json_rendering", "--plans", "2", "--days", "2", "--exercises-per-day", "2",
+            "--sets-per-exercise", "2", "--iterations", "3", stdout=out,
+        )
+        report = json.loads(out.getvalue())
+        for payload in ("week_log", "saved_plans"):
+            result = report["results"][payload]
+            self.assertTrue(result["identical_bytes"])
+            self.assertTrue(result["projection_identical_bytes"])
+            self.assertLess(result["bytes"]["gzip"], result["bytes"]["raw"])
+            self.assertIn("p99", result["render_fast"]["latency_ms"])
+        self.assertFalse(WorkoutPlan.objects.exists())
+
+class BenchmarkDbWritesCommandTestCase(TransactionTestCase):
+    def test_small_run_reports_and_cleans_up(self):
+        out = StringIO()
+        call_command("benchmark_db_writes", "--threads", "3", "--requests", "4", "--sets-per-request", "2", stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["database"]["vendor"], connection.vendor)
+        for phase in ("set_logging", "week_log_creation"):
+            self.assertEqual(report["results"][phase]["errors"], 0)
+            self.assertIn("p99", report["results"][phase]["latency_ms"])
+        self.assertEqual(report["results"]["set_logging"]["requests"], 12)
+        self.assertEqual(report["results"]["set_logging"]["rows"], 24)
+        self.assertFalse(get_user_model().objects.exists())
+        self.assertFalse(WorkoutLog.objects.exists())
+
+class BenchmarkAsyncReadsCommandTestCase(TransactionTestCase):
+    def test_small_run_reports_and_cleans_up(self):
+        out = StringIO()
+        call_command(
+            "benchmark_async_reads", "--users", "2", "--requests", "6", "--workers", "2",
+            "--concurrency", "3", "--client-delay-ms", "1", stdout=out,
+        )
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report["results"]), {"week_log", "saved_plans", "muscles"})
+        for models in report["results"].values():
+            self.assertEqual(set(models), {"wsgi_threads", "asgi_event_loop"})
+            self.assertIn("p99", models["asgi_event_loop"]["latency_ms"])
+        self.assertFalse(get_user_model().objects.exists())
+        self.assertFalse(WorkoutLog.objects.exists())
+
+@skipUnless(connection.vendor == "sqlite", "SQLite pragmas")
+class SqliteConnectionTestCase(TestCase):
+    def test_pragmas_applied(self):
+        with connection.cursor() as cursor:
+            self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
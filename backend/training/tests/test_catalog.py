@@ -0,0 +1,245 @@
+import json
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from training.models import (
+    WorkoutDayTemplate, ExercisePattern, ExerciseMovement, Equipment, Muscle,
+    DayPatternThrough, WorkoutSplitTemplate, SplitDayThrough, CatalogVersion,
+)
+from training.utils.catalog_utils import (
+    CATALOG_BODY_KEY, CATALOG_VERSION_KEY, get_catalog, get_catalog_body, get_catalog_version,
+)
+from training.utils.plan_generation_utils import generate_plan
+
+class CatalogSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.barbell = Equipment.objects.create(name="Barbell")
+        self.cable = Equipment.objects.create(name="Cable")
+        self.chest = Muscle.objects.create(name="Chest")
+        self.triceps = Muscle.objects.create(name="Triceps")
+
+        self.push = ExercisePattern.objects.create(name="Horizontal Push")
+        self.push.primary_muscles.add(self.chest)
+        self.push.secondary_muscles.add(self.triceps)
+
+        self.bench = ExerciseMovement.objects.create(name="Bench Press", pattern=self.push)
+        self.bench.equipment.add(self.barbell)
+        self.fly = ExerciseMovement.objects.create(name="Cable Fly", pattern=self.push)
+        self.fly.equipment.add(self.cable)
+
+        day = WorkoutDayTemplate.objects.create(name="Push")
+        DayPatternThrough.objects.create(day_template=day, pattern=self.push, pattern_index=0)
+        split = WorkoutSplitTemplate.objects.create(name="Push Only", days_per_week=2)
+        SplitDayThrough.objects.create(split=split, day_template=day, day_index=0)
+        SplitDayThrough.objects.create(split=split, day_template=day, day_index=1)
+
+    def test_snapshot_contents(self):
+        catalog = get_catalog()
+        self.assertEqual(catalog.movement_equipment[self.bench.id], {self.barbell.id})
+        self.assertEqual(catalog.pattern_primary_muscles[self.push.id], {self.chest.id})
+        self.assertEqual(catalog.pattern_secondary_muscles[self.push.id], {self.triceps.id})
+
+    def test_equipment_mask_filtering(self):
+        catalog = get_catalog()
+        cable_mask = catalog.equipment_mask([self.cable.id])
+        both_mask = catalog.equipment_mask([self.barbell.id, self.cable.id, 999])
+        self.assertEqual([m.name for m in catalog.candidates_for(self.push.id, cable_mask)], ["Cable Fly"])
+        self.assertEqual(
+            [m.name for m in catalog.candidates_for(self.push.id, both_mask, {self.bench.id})],
+            ["Cable Fly"],
+        )
+        self.assertEqual(catalog.candidates_for(self.push.id, 0), [])
+
+    def test_snapshot_reused_between_calls(self):
+        catalog = get_catalog()
+        with self.assertNumQueries(0):
+            self.assertIs(get_catalog(), catalog)
+
+    def test_split_graph_order(self):
+        catalog = get_catalog()
+        split = catalog.split_for(2)
+        self.assertEqual([t.name for t in catalog.split_days[split.id]], ["Push", "Push"])
+        self.assertEqual([p.name for p in catalog.day_patterns(catalog.split_days[split.id][0].id)], ["Horizontal Push"])
+        self.assertIsNone(catalog.split_for(5))
+
+    def test_snapshot_load_query_count_is_constant(self):
+        from training.utils.catalog_utils import CatalogSnapshot
+        with CaptureQueriesContext(connection) as small:
+            CatalogSnapshot(0).load()
+        for index in range(5):
+            day = WorkoutDayTemplate.objects.create(name=f"Extra {index}")
+            DayPatternThrough.objects.create(day_template=day, pattern=self.push, pattern_index=0)
+            split = WorkoutSplitTemplate.objects.create(name=f"Extra {index}", days_per_week=3)
+            SplitDayThrough.objects.create(split=split, day_template=day, day_index=0)
+        with CaptureQueriesContext(connection) as large:
+            CatalogSnapshot(0).load()
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_save_invalidates_snapshot(self):
+        catalog = get_catalog()
+        ExerciseMovement.objects.create(name="Dip", pattern=self.push)
+        refreshed = get_catalog()
+        self.assertIsNot(refreshed, catalog)
+        self.assertIn("Dip", [m.name for m in refreshed.movements.values()])
+
+    def test_m2m_change_invalidates_snapshot(self):
+        get_catalog()
+        self.fly.equipment.add(self.barbell)
+        self.assertEqual(get_catalog().movement_equipment[self.fly.id], {self.barbell.id, self.cable.id})
+
+    def test_through_add_invalidates_snapshot(self):
+        day = WorkoutDayTemplate.objects.create(name="Chest")
+        catalog = get_catalog()
+        day.patterns.add(self.push, through_defaults={"pattern_index": 0})
+        refreshed = get_catalog()
+        self.assertIsNot(refreshed, catalog)
+        self.assertEqual(refreshed.template_patterns[day.id], [self.push.id])
+
+    def test_version_persisted_across_cache_loss(self):
+        version = get_catalog_version()
+        cache.clear()  # e.g. a restarted worker with an empty local cache
+        self.assertEqual(get_catalog_version(), version)
+        Muscle.objects.create(name="Forearms")
+        cache.clear()
+        self.assertNotEqual(get_catalog_version(), version)
+
+    def test_other_process_edit_seen_after_cache_expiry(self):
+        version = get_catalog_version()
+        CatalogVersion.objects.update(version="edited-elsewhere")
+        self.assertEqual(get_catalog_version(), version)  # still cached here
+        cache.delete(CATALOG_VERSION_KEY)  # CATALOG_VERSION_TIMEOUT elapsed
+        self.assertEqual(get_catalog_version(), "edited-elsewhere")
+
+    def test_unrelated_saves_do_not_bump(self):
+        version = get_catalog_version()
+        get_user_model().objects.create_user(username="unrelated", password="pw")
+        self.assertEqual(get_catalog_version(), version)
+
+    def test_generate_plan_makes_no_queries(self):
+        get_catalog()
+        preferences = {"days_per_week": 2, "volume": "moderate", "equipment": [self.barbell.id]}
+        with self.assertNumQueries(0):
+            plan = generate_plan(preferences)
+        self.assertEqual([d["exercises"][0]["exercise_name"] for d in plan["days"]], ["Bench Press", "Bench Press"])
+
+class CatalogEndpointTestCase(TestCase):
+    def setUp(self):
+        barbell = Equipment.objects.create(name="Barbell")
+        self.chest = Muscle.objects.create(name="Chest")
+        push = ExercisePattern.objects.create(name="Horizontal Push")
+        push.primary_muscles.add(self.chest)
+        self.bench = ExerciseMovement.objects.create(name="Bench Press", pattern=push, form_image="exercise_form_images/bench.png")
+        self.bench.equipment.add(barbell)
+        day = WorkoutDayTemplate.objects.create(name="Push")
+        DayPatternThrough.objects.create(day_template=day, pattern=push, pattern_index=0)
+        split = WorkoutSplitTemplate.objects.create(name="Push Only", days_per_week=1)
+        SplitDayThrough.objects.create(split=split, day_template=day, day_index=0)
+
+        user = get_user_model().objects.create_user(username="catalog", email="catalog@example.com", password="pw")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_bundle_contents(self):
+        response = self.client.get("/api/catalog/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["version"], get_catalog_version())
+        self.assertEqual(data["muscles"], [{"id": self.chest.id, "name": "Chest"}])
+        movement = data["movements"][0]
+        self.assertEqual(movement["name"], "Bench Press")
+        self.assertTrue(movement["form_image"].endswith("exercise_form_images/bench.png"))
+        self.assertEqual(data["patterns"][0]["primary_muscles"], [self.chest.id])
+        self.assertEqual(data["splits"][0]["days"][0]["patterns"], [movement["pattern"]])
+
+    def test_warm_requests_make_no_queries(self):
+        self.client.get("/api/catalog/")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/catalog/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(self.client.get("/api/catalog/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_body_shared_through_cache(self):
+        version, body = get_catalog_body()
+        self.assertEqual(cache.get(f"{CATALOG_BODY_KEY}:{version}"), body)
+
+    def test_catalog_change_rebuilds_body(self):
+        etag = self.client.get("/api/catalog/")["ETag"]
+        Muscle.objects.create(name="Forearms")
+        response = self.client.get("/api/catalog/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["muscles"]), 2)
+
+    def test_body_follows_version_bumped_elsewhere(self):
+        self.addCleanup(cache.clear)  # the cached token below never existed outside this test
+        version, body = get_catalog_body()
+        # Another process edits the catalog and bumps the version; no signal fires here
+        Muscle.objects.filter(pk=self.chest.pk).update(name="Pecs")
+        CatalogVersion.objects.update(version="edited-elsewhere")
+        self.assertEqual(get_catalog_body(), (version, body))  # until the cached version expires
+        cache.delete(CATALOG_VERSION_KEY)
+        version, body = get_catalog_body()
+        self.assertEqual(version, "edited-elsewhere")
+        self.assertEqual(json.loads(body)["muscles"], [{"id": self.chest.id, "name": "Pecs"}])
+
+    def test_requires_token(self):
+        self.assertEqual(APIClient().get("/api/catalog/").status_code, 401)
+
+class SeededCatalogMixin:
+    """Three identical full-body days of four patterns with five movements each."""
+
+    def setUp(self):
+        self.barbell = Equipment.objects.create(name="Barbell")
+        day = WorkoutDayTemplate.objects.create(name="Full Body")
+        split = WorkoutSplitTemplate.objects.create(name="Full Body x3", days_per_week=3)
+        for index in range(4):
+            pattern = ExercisePattern.objects.create(name=f"Pattern {index}")
+            DayPatternThrough.objects.create(day_template=day, pattern=pattern, pattern_index=index)
+            for variant in range(5):
+                movement = ExerciseMovement.objects.create(name=f"Movement {index}.{variant}", pattern=pattern)
+                movement.equipment.add(self.barbell)
+        for index in range(3):
+            SplitDayThrough.objects.create(split=split, day_template=day, day_index=index)
+
+    def preferences(self, seed):
+        return {"days_per_week": 3, "volume": "high", "equipment": [self.barbell.id], "seed": seed}
+
+class SeededGenerationTestCase(SeededCatalogMixin, TestCase):
+    def summary(self, plan):
+        return [
+            [(ex["exercise_name"], ex["sets"], ex["start_reps"], ex["end_reps"]) for ex in day["exercises"]]
+            for day in plan["days"]
+        ]
+
+    def test_same_seed_same_plan(self):
+        first = generate_plan(self.preferences(42))
+        second = generate_plan(self.preferences(42))
+        self.assertEqual(first["seed"], 42)
+        self.assertEqual(self.summary(first), self.summary(second))
+
+    def test_seed_generated_when_missing(self):
+        preferences = self.preferences(None)
+        del preferences["seed"]
+        plan = generate_plan(preferences)
+        self.assertIsInstance(plan["seed"], int)
+        self.assertEqual(self.summary(generate_plan(self.preferences(plan["seed"]))), self.summary(plan))
+
+    def test_save_plan_rederives_from_seed(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username="seeded", email="seeded@example.com", password="pw"))
+        payload = {"days_per_week": 3, "training_age": 1, "volume": "high",
+                   "bodyweight_exercises": "weighted", "equipment": [self.barbell.id], "seed": 7}
+
+        preview = client.post("/api/plan/preview/", payload, format="json")
+        self.assertEqual(preview.data["seed"], 7)
+
+        saved = client.post("/api/plan/save/", payload, format="json")
+        self.assertEqual(saved.status_code, 201)
+        self.assertEqual(
+            [[ex["name"] for ex in day["exercises"]] for day in saved.data["days"]],
+            [[ex["exercise_name"] for ex in day["exercises"]] for day in preview.data["days"]],
+        )
@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import Muscle, UserPreferences
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class ConditionalGetTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="etag", email="etag@example.com", password="pw")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        save_generated_plan(self.user, make_plan_dict(2, 3))
+
+    def revalidate(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+        return first["ETag"], self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    def test_saved_plans_not_modified(self):
+        etag, response = self.revalidate("/api/plan/get/")
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+    def test_new_plan_changes_etag(self):
+        etag, _ = self.revalidate("/api/plan/get/")
+        save_generated_plan(self.user, make_plan_dict(2, 3))
+        response = self.client.get("/api/plan/get/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etags_are_per_user(self):
+        etag, _ = self.revalidate("/api/plan/get/")
+        other = get_user_model().objects.create_user(username="other", email="other@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(other)
+        self.assertEqual(client.get("/api/plan/get/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_week_log_changes_after_write(self):
+        etag, response = self.revalidate("/api/workout/log/week/")
+        self.assertEqual(response.status_code, 304)
+        day_id = self.client.get("/api/workout/log/week/").data["days"][0]["id"]
+        self.client.post(f"/api/workout/log/day/{day_id}/submit/")
+        self.assertEqual(self.client.get("/api/workout/log/week/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_week_log_not_modified_keeps_cursor(self):
+        exercise = self.client.get("/api/workout/log/week/").data["days"][0]["exercises"][0]["id"]
+        self.client.post("/api/workout/log/sets/batch/", {"sets": [
+            {"client_key": "a", "exercise": exercise, "set_number": 1, "weight": 100, "reps": 5},
+        ]}, format="json")
+        first = self.client.get("/api/workout/log/week/")
+        response = self.client.get("/api/workout/log/week/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["X-Sync-Cursor"], first["X-Sync-Cursor"])
+        self.assertNotEqual(response["X-Sync-Cursor"], "0")
+
+    def test_catalog_changes_invalidate(self):
+        etag, response = self.revalidate("/api/muscles/")
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get("/api/equipment/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Muscle.objects.create(name="Forearms")
+        self.assertEqual(self.client.get("/api/muscles/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_catalog_etag_stable_across_restarts(self):
+        # The cache outlives each test's rolled-back CatalogVersion row, so start and end empty
+        cache.clear()
+        self.addCleanup(cache.clear)
+        etag, _ = self.revalidate("/api/muscles/")
+        cache.clear()  # what a restarted or different worker starts with
+        self.assertEqual(self.client.get("/api/muscles/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Muscle.objects.create(name="Forearms")
+        cache.clear()
+        response = self.client.get("/api/muscles/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_preferences_update_changes_etag(self):
+        UserPreferences.objects.create(user=self.user, days_per_week=3, volume="low", bodyweight_exercises="weighted")
+        etag, response = self.revalidate("/api/preferences/get/")
+        self.assertEqual(response.status_code, 304)
+        self.client.put("/api/preferences/save/", {
+            "days_per_week": 4, "training_age": 1, "volume": "high", "bodyweight_exercises": "weighted",
+            "equipment": [], "priority_muscles": [],
+        }, format="json")
+        self.assertEqual(self.client.get("/api/preferences/get/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_wildcard_and_list_match(self):
+        etag, _ = self.revalidate("/api/plan/get/")
+        self.assertEqual(self.client.get("/api/plan/get/", HTTP_IF_NONE_MATCH=f'"stale", {etag}').status_code, 304)
+        self.assertEqual(self.client.get("/api/plan/get/", HTTP_IF_NONE_MATCH="*").status_code, 304)
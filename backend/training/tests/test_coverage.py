@@ -0,0 +1,76 @@
+from django.test import TestCase
+from training.models import (
+    WorkoutDayTemplate, ExercisePattern, ExerciseMovement, Equipment, Muscle,
+    DayPatternThrough, WorkoutSplitTemplate, SplitDayThrough, ExerciseType,
+)
+from training.utils.catalog_utils import get_catalog
+from training.utils.coverage_utils import get_muscle_matrix, PRIMARY_WEIGHT, SECONDARY_WEIGHT
+from training.utils.plan_generation_utils import generate_plan
+
+class CoverageGenerationTestCase(TestCase):
+    def setUp(self):
+        self.dumbbell = Equipment.objects.create(name="Dumbbell")
+        self.machine = Equipment.objects.create(name="Machine")
+        self.chest = Muscle.objects.create(name="Chest")
+        self.triceps = Muscle.objects.create(name="Triceps")
+
+        self.fly = ExercisePattern.objects.create(name="Chest Isolation")
+        self.fly.primary_muscles.add(self.chest)
+        self.press = ExercisePattern.objects.create(name="Horizontal Push")
+        self.press.primary_muscles.add(self.chest)
+        self.press.secondary_muscles.add(self.triceps)
+
+        for i in range(3):
+            ExerciseMovement.objects.create(
+                name=f"Dumbbell Fly {i}", pattern=self.fly, type=ExerciseType.ISOLATION
+            ).equipment.add(self.dumbbell)
+        ExerciseMovement.objects.create(name="Machine Press", pattern=self.press).equipment.add(self.machine)
+
+        day = WorkoutDayTemplate.objects.create(name="Chest")
+        DayPatternThrough.objects.create(day_template=day, pattern=self.fly, pattern_index=0)
+        self.press_day = WorkoutDayTemplate.objects.create(name="Press")
+        DayPatternThrough.objects.create(day_template=self.press_day, pattern=self.press, pattern_index=0)
+
+        split = WorkoutSplitTemplate.objects.create(name="Chest x5", days_per_week=5)
+        for index in range(5):
+            SplitDayThrough.objects.create(split=split, day_template=day, day_index=index)
+        press_split = WorkoutSplitTemplate.objects.create(name="Press Only", days_per_week=1)
+        SplitDayThrough.objects.create(split=press_split, day_template=self.press_day, day_index=0)
+
+    def preferences(self, **overrides):
+        preferences = {"days_per_week": 5, "volume": "moderate", "equipment": [self.dumbbell.id],
+                       "seed": 11, "mode": "coverage", "priority_muscles": []}
+        preferences.update(overrides)
+        return preferences
+
+    def weekly_sets(self, plan):
+        return sum(ex["sets"] for day in plan["days"] for ex in day["exercises"])
+
+    def test_muscle_matrix_weights(self):
+        matrix = get_muscle_matrix(get_catalog())
+        press_row = matrix.rows(list(ExerciseMovement.objects.filter(name="Machine Press")))[0]
+        self.assertEqual(press_row[matrix.muscle_index[self.chest.id]], PRIMARY_WEIGHT)
+        self.assertEqual(press_row[matrix.muscle_index[self.triceps.id]], SECONDARY_WEIGHT)
+        self.assertEqual(matrix.related_patterns[self.press.id], [self.fly.id])
+
+    def test_sets_stop_at_weekly_target(self):
+        # Moderate target is 10 chest sets: 3 + 3 + 3, then the cheapest option
+        plan = generate_plan(self.preferences())
+        self.assertEqual([day["exercises"][0]["sets"] for day in plan["days"]], [3, 3, 3, 2, 2])
+
+    def test_priority_muscles_get_more_volume(self):
+        baseline = generate_plan(self.preferences())
+        prioritized = generate_plan(self.preferences(priority_muscles=[self.chest.id]))
+        self.assertGreater(self.weekly_sets(prioritized), self.weekly_sets(baseline))
+
+    def test_substitutes_related_pattern_when_no_equipment(self):
+        plan = generate_plan(self.preferences(days_per_week=1))
+        exercise = plan["days"][0]["exercises"][0]
+        self.assertFalse(exercise["skip"])
+        self.assertTrue(exercise["exercise_name"].startswith("Dumbbell Fly"))
+
+        random_plan = generate_plan(self.preferences(days_per_week=1, mode="random"))
+        self.assertTrue(random_plan["days"][0]["exercises"][0]["skip"])
+
+    def test_coverage_mode_is_deterministic(self):
+        self.assertEqual(generate_plan(self.preferences())["days"], generate_plan(self.preferences())["days"])
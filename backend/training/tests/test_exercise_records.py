@@ -0,0 +1,94 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import ExerciseLog, ExerciseRecord, SetLog
+from training.utils.plan_generation_utils import save_generated_plan
+from training.utils.records_utils import brzycki, epley, get_records
+from .test_plan_saving import make_plan_dict
+
+class ExerciseRecordTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="records", email="records@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(1, 2))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.client.get("/api/workout/log/week/")
+        self.squat, self.bench = ExerciseLog.objects.order_by("id")
+        self.counter = 0
+
+    def log(self, exercise, weight, reps, key=None):
+        self.counter += 1
+        item = {"client_key": key or f"k{self.counter}", "exercise": exercise.id,
+                "set_number": self.counter, "weight": weight, "reps": reps}
+        self.client.post("/api/workout/log/sets/batch/", {"sets": [item]}, format="json")
+
+    def record(self, exercise):
+        return ExerciseRecord.objects.get(user=self.user, exercise_name=exercise.name)
+
+    def test_formulas(self):
+        self.assertEqual(epley(100, 1), 100)
+        self.assertAlmostEqual(epley(100, 10), 133.333, places=2)
+        self.assertAlmostEqual(brzycki(100, 10), 133.333, places=2)
+
+    def test_sets_update_rep_maxes_and_e1rm(self):
+        self.log(self.squat, 100, 5)
+        self.log(self.squat, 90, 5)
+        self.log(self.squat, 110, 1)
+        record = self.record(self.squat)
+        self.assertEqual(record.rep_maxes, {"5": 100, "1": 110})
+        self.assertEqual((record.best_weight, record.best_weight_reps), (110, 1))
+        self.assertEqual(record.e1rm_epley, round(epley(100, 5), 2))
+        self.assertEqual(record.e1rm_brzycki, round(brzycki(100, 5), 2))
+
+    def test_overwriting_a_record_set_falls_back_to_history(self):
+        self.log(self.squat, 100, 5, key="top")
+        self.log(self.squat, 95, 5)
+        self.log(self.squat, 80, 5, key="top")
+        self.assertEqual(self.record(self.squat).rep_maxes, {"5": 95})
+
+    def test_deleting_a_record_set(self):
+        self.log(self.bench, 80, 8, key="top")
+        self.log(self.bench, 70, 8)
+        self.client.post("/api/workout/log/sync/", {
+            "cursor": 0, "changes": {"deleted_sets": [{"exercise": self.bench.id, "client_key": "top"}]},
+        }, format="json")
+        self.assertEqual(self.record(self.bench).rep_maxes, {"8": 70})
+
+    def test_lookup_is_a_single_query(self):
+        self.log(self.squat, 100, 5)
+        self.log(self.bench, 80, 8)
+        with CaptureQueriesContext(connection) as ctx:
+            records = get_records(self.user, [self.squat.name])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual([r.exercise_name for r in records], [self.squat.name])
+
+    def test_rebuild_streams_history(self):
+        self.log(self.squat, 100, 5)
+        self.log(self.bench, 80, 8)
+        SetLog.objects.create(exercise=self.squat, set_number=9, weight=110, reps=3)  # bypasses the hooks
+        ExerciseRecord.objects.all().delete()
+        call_command("rebuild_exercise_records", "--chunk-size", "1", stdout=StringIO())
+        self.assertEqual(self.record(self.squat).rep_maxes, {"5": 100, "3": 110})
+        self.assertEqual(self.record(self.bench).best_weight, 80)
+
+    def test_rebuild_changes_etag(self):
+        self.log(self.squat, 100, 5)
+        etag = self.client.get("/api/analytics/records/")["ETag"]
+        SetLog.objects.create(exercise=self.squat, set_number=9, weight=110, reps=3)  # bypasses the hooks
+        call_command("rebuild_exercise_records", stdout=StringIO())
+        response = self.client.get("/api/analytics/records/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["rep_maxes"], {"5": 100, "3": 110})
+
+    def test_endpoint_filters_by_exercise(self):
+        self.log(self.squat, 100, 5)
+        self.log(self.bench, 80, 8)
+        response = self.client.get("/api/analytics/records/", {"exercise": self.bench.name})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r["exercise_name"] for r in response.data], [self.bench.name])
+        self.assertEqual(len(self.client.get("/api/analytics/records/").data), 2)
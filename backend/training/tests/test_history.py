@@ -0,0 +1,97 @@
+import base64
+import json
+from datetime import date, timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog
+from training.utils.plan_generation_utils import save_generated_plans
+from .test_plan_saving import make_plan_dict
+
+class HistoryPaginationTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="history", email="history@example.com", password="pw")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        plan = save_generated_plans([(self.user, make_plan_dict(1, 1))])[0]
+        day = plan.days.get()
+        monday = date(2026, 1, 5)
+        for week in range(25):
+            log = WorkoutLog.objects.create(user=self.user, start_date=monday + timedelta(weeks=week))
+            day_log = WorkoutDayLog.objects.create(workout_log=log, workout_day=day, order=0)
+            exercise = ExerciseLog.objects.create(
+                workout_day_log=day_log, name="Squat", target_sets=3, target_reps=5,
+                user=self.user, start_date=log.start_date,
+            )
+            SetLog.objects.create(exercise=exercise, set_number=1, weight=100 + week, reps=5)
+
+    def walk(self, url, **params):
+        pages, cursor = [], None
+        while True:
+            query = dict(params, limit=10, **({"cursor": cursor} if cursor else {}))
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url, query)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(any("OFFSET" in q["sql"].upper() for q in ctx.captured_queries))
+            pages.append((response.data["results"], len(ctx.captured_queries)))
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                return pages
+
+    def test_week_history_walks_every_week_once(self):
+        pages = self.walk("/api/workout/log/history/")
+        dates = [log["start_date"] for results, _ in pages for log in results]
+        self.assertEqual(len(dates), 25)
+        self.assertEqual(dates, sorted(set(dates), reverse=True))
+        self.assertEqual(len(pages[0][0][0]["days"][0]["exercises"][0]["sets"]), 1)
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        pages = self.walk("/api/workout/log/history/")
+        self.assertEqual(len({queries for _, queries in pages}), 1)
+
+    def test_exercise_history(self):
+        pages = self.walk("/api/workout/log/exercises/history/", exercise="Squat")
+        sessions = [session for results, _ in pages for session in results]
+        self.assertEqual(len(sessions), 25)
+        self.assertEqual(sessions[0]["sets"][0]["weight"], 124)
+        self.assertEqual(sessions[0]["start_date"], str(date(2026, 1, 5) + timedelta(weeks=24)))
+        self.assertEqual(self.client.get("/api/workout/log/exercises/history/").status_code, 400)
+
+    def test_exercise_history_seeks_without_joins(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/workout/log/exercises/history/", {"exercise": "Squat", "limit": 10})
+        sessions_query = ctx.captured_queries[0]["sql"]
+        self.assertIn("training_exerciselog", sessions_query)
+        self.assertNotIn("JOIN", sessions_query.upper())
+
+    def test_plan_history_ties_on_created_at(self):
+        save_generated_plans([(self.user, make_plan_dict(2, 2))] * 14)  # one bulk insert, near-identical timestamps
+        pages = self.walk("/api/plan/history/")
+        ids = [plan["id"] for results, _ in pages for plan in results]
+        self.assertEqual(len(ids), 15)
+        self.assertEqual(len(set(ids)), 15)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/workout/log/history/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_malformed_cursor_values(self):
+        urls = [
+            ("/api/workout/log/history/", {}),
+            ("/api/plan/history/", {}),
+            ("/api/workout/log/exercises/history/", {"exercise": "Squat"}),
+        ]
+        for parts in (["garbage", 5], [None, 5], [12, 5], ["2026-01-05", "5"], ["2026-01-05"]):
+            cursor = base64.urlsafe_b64encode(json.dumps(parts).encode()).decode()
+            for url, params in urls:
+                response = self.client.get(url, dict(params, cursor=cursor))
+                self.assertEqual(response.status_code, 400, (url, parts))
+
+    def test_history_is_per_user(self):
+        other = get_user_model().objects.create_user(username="other", email="other@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(other)
+        self.assertEqual(client.get("/api/workout/log/history/").data["results"], [])
@@ -0,0 +1,111 @@
+import gzip
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from training.middleware import CompressionMiddleware
+from training.serializers.logging_serializers import WorkoutLogSerializer
+from training.utils import compression_utils, json_utils
+from training.utils.compression_utils import choose_encoding
+from training.utils.json_utils import FastJSONParser, FastJSONRenderer
+from training.utils.logging_utils import current_week_start, get_or_materialize_week_log
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+@skipUnless(json_utils.orjson is not None, "orjson not installed")
+class FastJSONRendererTestCase(TestCase):
+    def assertSameAsDRF(self, data, **kwargs):
+        self.assertEqual(FastJSONRenderer().render(data, **kwargs), JSONRenderer().render(data, **kwargs))
+
+    def test_matches_drf_for_special_values(self):
+        self.assertSameAsDRF({
+            "when": datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc),
+            "day": date(2024, 5, 6),
+            "amount": Decimal("102.50"),
+            "text": "café\u2028line\u2029para",
+            1: [1.5, None, True],
+        })
+
+    def test_matches_drf_for_week_log(self):
+        user = get_user_model().objects.create_user(username="json", email="json@example.com", password="pw")
+        save_generated_plan(user, make_plan_dict(3, 4))
+        log, _ = get_or_materialize_week_log(user, current_week_start())
+        self.assertSameAsDRF(WorkoutLogSerializer(log).data)
+
+    def test_exponent_floats_differ_only_in_formatting(self):
+        data = {"big": 1e16, "small": 1e-7, "plain": 102.5}
+        self.assertEqual(FastJSONRenderer().render(data), b'{"big":1e16,"small":1e-7,"plain":102.5}')
+        self.assertEqual(JSONRenderer().render(data), b'{"big":1e+16,"small":1e-07,"plain":102.5}')
+        self.assertEqual(json.loads(FastJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_indent_uses_stdlib_path(self):
+        self.assertSameAsDRF({"a": [1, 2]}, accepted_media_type="application/json; indent=4")
+
+    def test_parser_errors_are_parse_errors(self):
+        user = get_user_model().objects.create_user(username="parse", email="parse@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.post("/api/workout/log/sync/", b'{"cursor": ', content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["detail"].startswith("JSON parse error"))
+
+    def test_parser_reads_utf8(self):
+        from io import BytesIO
+        self.assertEqual(FastJSONParser().parse(BytesIO('{"n": "café"}'.encode())), {"n": "café"})
+
+class CompressionMiddlewareTestCase(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="gzip", email="gzip@example.com", password="pw")
+        save_generated_plan(user, make_plan_dict(4, 6))
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def test_large_response_gzipped(self):
+        plain = self.client.get("/api/plan/get/")
+        with mock.patch.object(compression_utils, "brotli", None):
+            response = self.client.get("/api/plan/get/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertEqual(response["ETag"], plain["ETag"])
+
+    def test_not_compressed_without_accept_encoding(self):
+        response = self.client.get("/api/plan/get/")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    @override_settings(RESPONSE_COMPRESSION={"MIN_SIZE": 10 ** 6})
+    def test_small_response_left_alone(self):
+        response = self.client.get("/api/plan/get/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_html_left_to_gzip_middleware(self):
+        response = self.client.get("/admin/login/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response["Content-Type"].startswith("text/html"))
+        self.assertGreater(len(response.content), 1024)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_no_transform_respected(self):
+        middleware = CompressionMiddleware(lambda request: None)
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        response = HttpResponse(b"[" + b"1," * 1000 + b"1]", content_type="application/json")
+        response["Cache-Control"] = "private, No-Transform"
+        response = middleware.process_response(request, response)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_choose_encoding(self):
+        with mock.patch.object(compression_utils, "brotli", object()):
+            self.assertEqual(choose_encoding("gzip, deflate, br"), "br")
+            self.assertEqual(choose_encoding("br;q=0, gzip"), "gzip")
+            self.assertEqual(choose_encoding("gzip;q=0.5, br;q=0.8"), "br")
+            self.assertEqual(choose_encoding("*"), "br")
+        with mock.patch.object(compression_utils, "brotli", None):
+            self.assertEqual(choose_encoding("br"), None)
+            self.assertEqual(choose_encoding("br, gzip"), "gzip")
+        self.assertIsNone(choose_encoding(""))
+        self.assertIsNone(choose_encoding("identity"))
@@ -0,0 +1,104 @@
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import ExerciseLog, ExercisePattern, ExerciseMovement, Muscle, MuscleVolume, SetLog
+from training.utils.logging_utils import current_week_start
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class MuscleVolumeTestCase(TestCase):
+    def setUp(self):
+        self.chest = Muscle.objects.create(name="Chest")
+        self.triceps = Muscle.objects.create(name="Triceps")
+        press = ExercisePattern.objects.create(name="Horizontal Push")
+        press.primary_muscles.add(self.chest)
+        press.secondary_muscles.add(self.triceps)
+        fly = ExercisePattern.objects.create(name="Chest Isolation")
+        fly.primary_muscles.add(self.chest)
+        ExerciseMovement.objects.create(name="Exercise 0.0", pattern=press)
+        ExerciseMovement.objects.create(name="Exercise 0.1", pattern=fly)
+        # The cached catalog version outlives this test's rolled-back catalog rows
+        self.addCleanup(cache.clear)
+
+        User = get_user_model()
+        self.user = User.objects.create_user(username="volume", email="volume@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(1, 3))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.client.get("/api/workout/log/week/")
+        self.press, self.fly, self.unknown = ExerciseLog.objects.order_by("id").values_list("id", flat=True)
+
+    def log(self, key, exercise, weight=100, reps=10):
+        item = {"client_key": key, "exercise": exercise, "set_number": 1, "weight": weight, "reps": reps}
+        return self.client.post("/api/workout/log/sets/batch/", {"sets": [item]}, format="json")
+
+    def volume(self):
+        return {
+            row.muscle_id: (row.sets, row.reps, row.tonnage)
+            for row in MuscleVolume.objects.filter(user=self.user, week_start=current_week_start())
+        }
+
+    def test_sets_credit_primary_and_secondary_muscles(self):
+        self.log("a", self.press)
+        self.log("b", self.fly, weight=20, reps=12)
+        self.log("c", self.unknown)
+        self.assertEqual(self.volume(), {
+            self.chest.id: (2, 22, 1240),
+            self.triceps.id: (0.5, 5, 500),
+        })
+
+    def test_overwrite_replaces_previous_values(self):
+        self.log("a", self.press)
+        self.log("a", self.press, weight=110, reps=8)
+        self.assertEqual(self.volume()[self.chest.id], (1, 8, 880))
+
+    def test_delete_removes_volume(self):
+        self.log("a", self.press)
+        self.log("b", self.press)
+        self.client.post("/api/workout/log/sync/", {
+            "cursor": 0, "changes": {"deleted_sets": [{"exercise": self.press, "client_key": "a"}]},
+        }, format="json")
+        self.assertEqual(self.volume()[self.chest.id], (1, 10, 1000))
+
+    def test_rebuild_matches_incremental(self):
+        self.log("a", self.press)
+        self.log("b", self.fly, weight=20, reps=12)
+        self.log("a", self.press, weight=90)
+        incremental = self.volume()
+        SetLog.objects.create(exercise_id=self.fly, set_number=2, weight=25, reps=10)  # bypasses the hooks
+        call_command("rebuild_muscle_volume", stdout=StringIO())
+        rebuilt = self.volume()
+        self.assertEqual(rebuilt[self.triceps.id], incremental[self.triceps.id])
+        self.assertEqual(rebuilt[self.chest.id], (3, 32, 1390))
+
+    def test_rebuild_in_small_chunks(self):
+        self.log("a", self.press)
+        self.log("b", self.fly, weight=20, reps=12)
+        call_command("rebuild_muscle_volume", stdout=StringIO())
+        whole = self.volume()
+        out = StringIO()
+        call_command("rebuild_muscle_volume", "--chunk-size", "1", stdout=out)
+        self.assertEqual(self.volume(), whole)
+        self.assertIn(f"Wrote {len(whole)} muscle volume rows.", out.getvalue())
+
+    def test_rebuild_changes_etag(self):
+        self.log("a", self.press)
+        etag = self.client.get("/api/analytics/volume/?weeks=2")["ETag"]
+        SetLog.objects.create(exercise_id=self.press, set_number=2, weight=50, reps=10)  # bypasses the hooks
+        call_command("rebuild_muscle_volume", stdout=StringIO())
+        response = self.client.get("/api/analytics/volume/?weeks=2", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        rows = {row["muscle_name"]: row for row in response.data["volume"]}
+        self.assertEqual(rows["Chest"]["tonnage"], 1500)
+
+    def test_endpoint_reads_precomputed_rows(self):
+        self.log("a", self.press)
+        response = self.client.get("/api/analytics/volume/?weeks=2")
+        self.assertEqual(response.status_code, 200)
+        rows = {row["muscle_name"]: row for row in response.data["volume"]}
+        self.assertEqual(rows["Chest"]["tonnage"], 1000)
+        self.assertEqual(rows["Triceps"]["sets"], 0.5)
+        self.assertEqual(self.client.get("/api/analytics/volume/?weeks=2", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
@@ -35,11 +35,11 @@ class ManualDBTestCase(TestCase):
         self.rear_delt_iso = ExercisePattern.objects.create(name="Rear Delt Isolation")
         self.bicep = ExercisePattern.objects.create(name="Bicep Curl")
 
-        self.h_push.target_muscles.add(self.chest)
-        self.vert_pull.target_muscles.add(self.back)
-        self.h_pull.target_muscles.add(self.back)
-        self.rear_delt_iso.target_muscles.add(self.rear_delts)
-        self.bicep.target_muscles.add(self.biceps)
+        self.h_push.primary_muscles.add(self.chest)
+        self.vert_pull.primary_muscles.add(self.back)
+        self.h_pull.primary_muscles.add(self.back)
+        self.rear_delt_iso.primary_muscles.add(self.rear_delts)
+        self.bicep.primary_muscles.add(self.biceps)
 
         ExerciseMovement.objects.create(name="Dumbbell Bench Press", pattern=self.h_push).equipment.add(self.dumbbell)
         ExerciseMovement.objects.create(name="Chin Up", pattern=self.vert_pull).equipment.add(self.barbell)
@@ -57,9 +57,9 @@ class ManualDBTestCase(TestCase):
         self.rdl_pattern = ExercisePattern.objects.create(name="Hip Hinge")
         self.calf_pattern = ExercisePattern.objects.create(name="Calf Raise")
 
-        self.squat_pattern.target_muscles.add(self.quad, self.glutes)
-        self.rdl_pattern.target_muscles.add(self.hamstring, self.glutes)
-        self.calf_pattern.target_muscles.add(self.calves)
+        self.squat_pattern.primary_muscles.add(self.quad, self.glutes)
+        self.rdl_pattern.primary_muscles.add(self.hamstring, self.glutes)
+        self.calf_pattern.primary_muscles.add(self.calves)
 
         ExerciseMovement.objects.create(name="Barbell Squat", pattern=self.squat_pattern).equipment.add(self.barbell)
         ExerciseMovement.objects.create(name="Barbell RDL", pattern=self.rdl_pattern).equipment.add(self.barbell)
@@ -118,7 +118,7 @@ class ManualDBTestCase(TestCase):
         self.pref.days_per_week = 6
         self.pref.save()
 
-        result = decide_split(self.pref)
+        result = decide_split(self.pref.days_per_week)
         self.assertIsNotNone(result)
         self.assertEqual(result.name, "PPLPPL")
         self.assertEqual(result.days_per_week, 6)
@@ -141,7 +141,7 @@ class ManualDBTestCase(TestCase):
         self.pref.days_per_week = 2
         self.pref.save()
 
-        result = decide_split(self.pref)
+        result = decide_split(self.pref.days_per_week)
         self.assertIsNotNone(result)
         self.assertEqual(result.name, "2-Day Full Body")
         self.assertEqual(result.days_per_week, 2)
@@ -191,7 +191,7 @@ class GeneratePlanTestCase(TestCase):
         self.barbell = Equipment.objects.create(name="Barbell")
         self.chest = Muscle.objects.create(name="Chest")
         self.push_pattern = ExercisePattern.objects.create(name="Horizontal Push")
-        self.push_pattern.target_muscles.add(self.chest)
+        self.push_pattern.primary_muscles.add(self.chest)
 
         # Exercise with type
         self.push_exercise = ExerciseMovement.objects.create(
@@ -242,4 +242,4 @@ class GeneratePlanTestCase(TestCase):
         self.prefs.save()
 
         plan = generate_plan(self.prefs)
-        self.assertEqual(plan, [])  # Should return an empty list
\ No newline at end of file
+        self.assertIsNone(plan)  # No split for 3 days
\ No newline at end of file
@@ -0,0 +1,58 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from training.models import WorkoutPlan, WorkoutDay, PlannedExercise
+from training.utils.plan_generation_utils import save_generated_plan, save_generated_plans
+
+def make_plan_dict(days, exercises_per_day):
+    return {
+        "name": f"{days}-Day Plan",
+        "days_per_week": days,
+        "days": [
+            {
+                "day_name": f"Day {day}",
+                "exercises": [
+                    {"exercise_name": f"Exercise {day}.{ex}", "sets": 3, "start_reps": 8, "end_reps": 12, "skip": False}
+                    for ex in range(exercises_per_day)
+                ],
+            }
+            for day in range(days)
+        ],
+    }
+
+class SaveGeneratedPlanTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="saver", email="saver@example.com", password="pw")
+        self.other = User.objects.create_user(username="coach", email="coach@example.com", password="pw")
+
+    def count_queries(self, func, *args):
+        with CaptureQueriesContext(connection) as ctx:
+            func(*args)
+        return len(ctx.captured_queries)
+
+    def test_query_count_independent_of_plan_size(self):
+        small = self.count_queries(save_generated_plan, self.user, make_plan_dict(1, 1))
+        large = self.count_queries(save_generated_plan, self.user, make_plan_dict(6, 5))
+        self.assertEqual(small, large)
+
+        plan = WorkoutPlan.objects.filter(user=self.user).last()
+        self.assertEqual(list(plan.days.order_by("order").values_list("order", flat=True)), list(range(6)))
+        self.assertEqual(PlannedExercise.objects.filter(day__plan=plan).count(), 30)
+
+    def test_failure_rolls_back_whole_plan(self):
+        plan_dict = make_plan_dict(3, 2)
+        del plan_dict["days"][2]["exercises"][1]["exercise_name"]
+        with self.assertRaises(KeyError):
+            save_generated_plan(self.user, plan_dict)
+        self.assertFalse(WorkoutPlan.objects.exists())
+        self.assertFalse(WorkoutDay.objects.exists())
+
+    def test_bulk_save_for_many_users(self):
+        entries = [(self.user, make_plan_dict(2, 3)), (self.other, make_plan_dict(4, 1))]
+        one = self.count_queries(save_generated_plans, entries[:1])
+        many = self.count_queries(save_generated_plans, entries * 5)
+        self.assertEqual(one, many)
+        self.assertEqual(WorkoutPlan.objects.filter(user=self.other).count(), 5)
+        self.assertEqual(PlannedExercise.objects.filter(day__plan__user=self.other).count(), 20)
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog
+from training.utils.logging_utils import current_week_start, prematerialize_week
+from training.utils.plan_generation_utils import save_generated_plans
+from .test_plan_saving import make_plan_dict
+
+class PrematerializeWeekTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.week = current_week_start()
+        self.active_since = self.week - timedelta(weeks=4)
+        self.users = [
+            User.objects.create_user(username=f"early{i}", email=f"early{i}@example.com", password="pw")
+            for i in range(5)
+        ]
+        save_generated_plans([(user, make_plan_dict(3, 2)) for user in self.users])
+        self.planless = User.objects.create_user(username="planless", email="planless@example.com", password="pw")
+        self.inactive = User.objects.create_user(username="gone", email="gone@example.com", password="pw", is_active=False)
+        save_generated_plans([(self.inactive, make_plan_dict(3, 2))])
+
+    def test_creates_week_for_active_users_with_plans(self):
+        self.assertEqual(prematerialize_week(self.week, self.active_since, batch_size=2), 5)
+        self.assertEqual(set(WorkoutLog.objects.values_list("user_id", flat=True)), {u.id for u in self.users})
+        self.assertEqual(WorkoutDayLog.objects.count(), 15)
+        self.assertEqual(ExerciseLog.objects.count(), 30)
+
+    def test_rerun_is_a_no_op(self):
+        prematerialize_week(self.week, self.active_since)
+        self.assertEqual(prematerialize_week(self.week, self.active_since), 0)
+        self.assertEqual(WorkoutLog.objects.count(), 5)
+
+    def test_skips_users_who_already_have_the_week(self):
+        client = APIClient()
+        client.force_authenticate(self.users[2])
+        first = client.get("/api/workout/log/week/").data["id"]
+        self.assertEqual(prematerialize_week(self.week, self.active_since), 4)
+        self.assertEqual(WorkoutLog.objects.get(user=self.users[2]).id, first)
+
+    def test_batch_queries_do_not_grow_with_batch_size(self):
+        with CaptureQueriesContext(connection) as small:
+            prematerialize_week(self.week, self.active_since, batch_size=5)
+        WorkoutLog.objects.all().delete()
+        extra = [
+            get_user_model().objects.create_user(username=f"late{i}", email=f"late{i}@example.com", password="pw")
+            for i in range(5)
+        ]
+        save_generated_plans([(user, make_plan_dict(3, 2)) for user in extra])
+        with CaptureQueriesContext(connection) as large:
+            prematerialize_week(self.week, self.active_since, batch_size=10)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_week_log_request_is_then_a_read(self):
+        prematerialize_week(self.week, self.active_since)
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/workout/log/week/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["days"]), 3)
+        self.assertFalse([q for q in ctx.captured_queries if not q["sql"].upper().startswith("SELECT")])
+
+    def test_command_defaults_to_next_week(self):
+        out = StringIO()
+        call_command("prematerialize_week_logs", stdout=out)
+        next_week = self.week + timedelta(weeks=1)
+        self.assertIn(f"Created 5 week logs for {next_week}", out.getvalue())
+        self.assertEqual(WorkoutLog.objects.filter(start_date=next_week).count(), 5)
@@ -0,0 +1,64 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import (
+    WorkoutDayTemplate, ExercisePattern, ExerciseMovement, Equipment,
+    DayPatternThrough, WorkoutSplitTemplate, SplitDayThrough,
+)
+from training.utils.preview_cache_utils import PlanPreviewCache, preview_cache, preview_cache_key
+
+class PlanPreviewCacheTestCase(TestCase):
+    def setUp(self):
+        preview_cache.clear()
+        self.barbell = Equipment.objects.create(name="Barbell")
+        self.dumbbell = Equipment.objects.create(name="Dumbbell")
+        self.pattern = ExercisePattern.objects.create(name="Squat")
+        ExerciseMovement.objects.create(name="Back Squat", pattern=self.pattern).equipment.add(self.barbell)
+        day = WorkoutDayTemplate.objects.create(name="Legs")
+        DayPatternThrough.objects.create(day_template=day, pattern=self.pattern, pattern_index=0)
+        split = WorkoutSplitTemplate.objects.create(name="Legs Only", days_per_week=1)
+        SplitDayThrough.objects.create(split=split, day_template=day, day_index=0)
+
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(username="cache", email="cache@example.com", password="pw"))
+        self.payload = {"days_per_week": 1, "training_age": 1, "volume": "low", "bodyweight_exercises": "weighted",
+                        "equipment": [self.barbell.id, self.dumbbell.id], "seed": 3}
+
+    def test_repeat_preview_hits_cache(self):
+        first = self.client.post("/api/plan/preview/", self.payload, format="json")
+        self.payload["equipment"] = list(reversed(self.payload["equipment"]))
+        with self.assertNumQueries(0):
+            second = self.client.post("/api/plan/preview/", self.payload, format="json")
+        self.assertEqual(first["X-Plan-Cache"], "miss")
+        self.assertEqual(second["X-Plan-Cache"], "hit")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(preview_cache.stats()["hits"], 1)
+
+    def test_unseeded_preview_is_cached_under_echoed_seed(self):
+        del self.payload["seed"]
+        first = self.client.post("/api/plan/preview/", self.payload, format="json")
+        self.payload["seed"] = first.data["seed"]
+        second = self.client.post("/api/plan/preview/", self.payload, format="json")
+        self.assertEqual(second["X-Plan-Cache"], "hit")
+
+    def test_catalog_edit_invalidates(self):
+        self.client.post("/api/plan/preview/", self.payload, format="json")
+        ExerciseMovement.objects.create(name="Front Squat", pattern=self.pattern).equipment.add(self.barbell)
+        response = self.client.post("/api/plan/preview/", self.payload, format="json")
+        self.assertEqual(response["X-Plan-Cache"], "miss")
+
+    def test_key_is_canonical(self):
+        a = {"days_per_week": 3, "volume": "low", "equipment": [2, 1], "bodyweight_exercises": "absent", "seed": 1}
+        b = dict(a, equipment=[1, 2, 2])
+        self.assertEqual(preview_cache_key(a, 5), preview_cache_key(b, 5))
+        self.assertNotEqual(preview_cache_key(a, 5), preview_cache_key(a, 6))
+
+    def test_lru_eviction(self):
+        cache = PlanPreviewCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNot(cache.get("b"), 2)
+        self.assertEqual(cache.stats()["size"], 2)
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from training.models import ExerciseLog, SetLog, SyncState
+from training.utils.logging_utils import current_week_start, get_or_materialize_week_log
+from training.utils.plan_generation_utils import save_generated_plan
+from training.utils.progression_utils import progress_exercise, progress_week
+from .test_plan_saving import make_plan_dict
+
+class ProgressExerciseTestCase(TestCase):
+    def test_no_history_keeps_plan_defaults(self):
+        self.assertEqual(progress_exercise([], 3, 8, 12), (None, 8, 3))
+
+    def test_adds_a_rep_inside_the_range(self):
+        self.assertEqual(progress_exercise([(100, 9, 8)] * 3, 3, 8, 12), (100, 10, 3))
+
+    def test_top_of_range_adds_weight_and_resets_reps(self):
+        self.assertEqual(progress_exercise([(100, 12, 8)] * 3, 3, 8, 12), (102.5, 8, 3))
+
+    def test_easy_top_sets_earn_an_extra_set(self):
+        self.assertEqual(progress_exercise([(100, 12, 6)] * 3, 3, 8, 12), (102.5, 8, 4))
+
+    def test_grinding_holds(self):
+        self.assertEqual(progress_exercise([(100, 12, 10)] * 3, 3, 8, 12), (100, 12, 3))
+
+    def test_missed_reps_deload(self):
+        self.assertEqual(progress_exercise([(100, 6, 10)] * 3, 3, 8, 12), (90, 8, 3))
+
+    def test_only_top_weight_sets_count(self):
+        sets = [(60, 12, 6), (100, 10, 8), (100, 9, 8), (100, 10, 8)]
+        self.assertEqual(progress_exercise(sets, 3, 8, 12), (100, 10, 3))
+
+class WeeklyProgressionTestCase(TestCase):
+    def setUp(self):
+        self.this_week = current_week_start()
+        self.last_week = self.this_week - timedelta(weeks=1)
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(username=f"lifter{i}", email=f"lifter{i}@example.com", password="pw")
+            for i in range(3)
+        ]
+        for user in self.users:
+            save_generated_plan(user, make_plan_dict(1, 2))
+
+    def log_last_week(self, user, weight=100, reps=12, rpe=8):
+        log, _ = get_or_materialize_week_log(user, self.last_week)
+        exercise = log.days.all()[0].exercises.all()[0]
+        SetLog.objects.bulk_create([
+            SetLog(exercise=exercise, set_number=n, weight=weight, reps=reps, rpe=rpe) for n in range(1, 4)
+        ])
+        return exercise.name
+
+    def test_materialization_applies_progression(self):
+        name = self.log_last_week(self.users[0])
+        log, _ = get_or_materialize_week_log(self.users[0], self.this_week)
+        targets = {e.name: (e.target_weight, e.target_reps) for e in log.days.all()[0].exercises.all()}
+        self.assertEqual(targets[name], (102.5, 8))
+        self.assertEqual(list(targets.values()).count((None, 8)), 1)
+
+    def test_batch_updates_untouched_exercises_only(self):
+        names = [self.log_last_week(user, reps=10) for user in self.users]
+        logs = [get_or_materialize_week_log(user, self.this_week)[0] for user in self.users]
+        started = logs[0].days.all()[0].exercises.all()[0]
+        SetLog.objects.create(exercise=started, set_number=1, weight=50, reps=8)
+        ExerciseLog.objects.filter(name__in=names).exclude(workout_day_log__workout_log__start_date=self.last_week).update(
+            target_weight=None, target_reps=8
+        )
+        revisions = dict(SyncState.objects.values_list("user_id", "revision"))
+
+        self.assertEqual(progress_week(self.this_week, chunk_size=2), (3, 2))
+        progressed = ExerciseLog.objects.filter(
+            name__in=names, workout_day_log__workout_log__start_date=self.this_week
+        ).order_by("id")
+        self.assertEqual([(e.target_weight, e.target_reps) for e in progressed], [(None, 8), (100, 11), (100, 11)])
+        self.assertGreater(SyncState.objects.get(user=self.users[1]).revision, revisions[self.users[1].id])
+        self.assertEqual(SyncState.objects.get(user=self.users[0]).revision, revisions[self.users[0].id])
+
+    def test_batch_bumps_users_without_sync_state(self):
+        names = [self.log_last_week(user, reps=10) for user in self.users]
+        for user in self.users:
+            get_or_materialize_week_log(user, self.this_week)
+        ExerciseLog.objects.filter(name__in=names).exclude(workout_day_log__workout_log__start_date=self.last_week).update(
+            target_weight=None, target_reps=8
+        )
+        SyncState.objects.all().delete()  # e.g. accounts that predate delta sync
+
+        self.assertEqual(progress_week(self.this_week), (3, 3))
+        revisions = dict(SyncState.objects.values_list("user_id", "revision"))
+        self.assertEqual(set(revisions), {user.id for user in self.users})
+        for exercise in ExerciseLog.objects.filter(name__in=names, workout_day_log__workout_log__start_date=self.this_week):
+            self.assertEqual(exercise.revision, revisions[exercise.workout_day_log.workout_log.user_id])
+
+    def test_batch_is_idempotent(self):
+        for user in self.users:
+            self.log_last_week(user)
+            get_or_materialize_week_log(user, self.this_week)
+        self.assertEqual(progress_week(self.this_week), (3, 0))
+
+    def test_chunk_queries_do_not_grow_with_users(self):
+        for user in self.users:
+            self.log_last_week(user, reps=10)
+            get_or_materialize_week_log(user, self.this_week)
+        ExerciseLog.objects.filter(workout_day_log__workout_log__start_date=self.this_week).update(target_reps=1)
+        with CaptureQueriesContext(connection) as one_chunk:
+            progress_week(self.this_week, chunk_size=10)
+        self.assertLessEqual(len(one_chunk.captured_queries), 10)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("progress_week_targets", "--week", self.this_week.isoformat(), stdout=out)
+        self.assertIn("Progressed 0 week logs", out.getvalue())
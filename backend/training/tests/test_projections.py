@@ -0,0 +1,74 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from training.models import ExerciseLog, WorkoutPlan
+from training.serializers import WorkoutPlanSerializer
+from training.serializers.logging_serializers import WorkoutLogSerializer
+from training.utils.logging_utils import (
+    current_week_start, get_or_materialize_week_log, tree_revision, upsert_set_logs, week_log_queryset,
+)
+from training.utils.plan_generation_utils import save_generated_plan
+from training.utils.projection_utils import (
+    aproject_saved_plans, aproject_week_log, project_saved_plans, project_week_log,
+)
+from .test_plan_saving import make_plan_dict
+
+def render(data):
+    return JSONRenderer().render(data)
+
+class ProjectionTestCase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="proj", email="proj@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(2, 3))
+        save_generated_plan(self.user, make_plan_dict(3, 2))
+        self.week = current_week_start()
+        get_or_materialize_week_log(self.user, self.week)
+        exercises = list(ExerciseLog.objects.filter(workout_day_log__workout_log__user=self.user).order_by("id"))
+        upsert_set_logs(self.user, [
+            {"exercise": exercises[0].id, "client_key": "b", "set_number": 2, "weight": 100, "reps": 5, "rpe": None},
+            {"exercise": exercises[0].id, "client_key": "a", "set_number": 1, "weight": 102.5, "reps": 5, "rpe": 8.5,
+             "notes": "grind – café"},
+            {"exercise": exercises[3].id, "client_key": "c", "set_number": 1, "weight": 60, "reps": 12, "source": "auto"},
+        ])
+        ExerciseLog.objects.filter(id=exercises[1].id).update(target_weight=82.5)
+
+    def serialized_week(self):
+        log = week_log_queryset().get(user=self.user, start_date=self.week)
+        return render(WorkoutLogSerializer(log).data), tree_revision(log)
+
+    def serialized_plans(self):
+        plans = WorkoutPlan.objects.filter(user=self.user).order_by("id").prefetch_related("days__exercises")
+        return render(WorkoutPlanSerializer(plans, many=True).data)
+
+    def test_week_log_matches_serializer(self):
+        document, cursor = project_week_log(self.user, self.week)
+        self.assertEqual((render(document), cursor), self.serialized_week())
+
+    def test_saved_plans_match_serializer(self):
+        self.assertEqual(render(project_saved_plans(self.user)), self.serialized_plans())
+
+    def test_query_counts(self):
+        with self.assertNumQueries(4):
+            project_week_log(self.user, self.week)
+        with self.assertNumQueries(3):
+            project_saved_plans(self.user)
+
+    def test_missing_week_is_none(self):
+        self.assertIsNone(project_week_log(self.user, self.week.replace(year=self.week.year - 1)))
+
+    def test_endpoints_serve_projections(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        week = client.get("/api/workout/log/week/")
+        body, cursor = self.serialized_week()
+        self.assertEqual(week.content, body)
+        self.assertEqual(week["X-Sync-Cursor"], str(cursor))
+        self.assertEqual(client.get("/api/plan/get/").content, self.serialized_plans())
+
+    async def test_async_projections_match(self):
+        self.assertEqual(
+            await aproject_week_log(self.user, self.week), await sync_to_async(project_week_log)(self.user, self.week)
+        )
+        self.assertEqual(await aproject_saved_plans(self.user), await sync_to_async(project_saved_plans)(self.user))
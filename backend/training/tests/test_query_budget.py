@@ -0,0 +1,62 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from training.models import ExerciseLog, SetLog, WorkoutPlan
+from training.utils.plan_generation_utils import save_generated_plans
+from training.utils.query_budget_utils import query_budget, QueryBudgetExceeded
+from .test_plan_saving import make_plan_dict
+
+@override_settings(QUERY_BUDGET_STRICT=True, DEBUG=True)
+class ReadPathQueryBudgetTestCase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="history", email="history@example.com", password="pw")
+        self.client = APIClient()
+        # Real JWT auth so the budget covers the user lookup too
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+
+    def query_count(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return int(response["X-Query-Count"])
+
+    def test_saved_plans_flat_as_history_grows(self):
+        save_generated_plans([(self.user, make_plan_dict(2, 2))])
+        one_plan = self.query_count("/api/plan/get/")
+        save_generated_plans([(self.user, make_plan_dict(6, 5))] * 20)
+        many_plans = self.query_count("/api/plan/get/")
+        self.assertEqual(one_plan, many_plans)
+        self.assertEqual(len(self.client.get("/api/plan/get/").data), 21)
+
+    def test_week_log_within_budget(self):
+        save_generated_plans([(self.user, make_plan_dict(6, 5))])
+        response = self.client.get("/api/workout/log/week/")
+        self.assertEqual(response["X-Query-Budget"], "19")
+        for exercise in ExerciseLog.objects.all()[:10]:
+            SetLog.objects.create(exercise=exercise, set_number=1, weight=60, reps=10)
+        self.assertLessEqual(self.query_count("/api/workout/log/week/"), 6)
+
+    def test_overrun_names_the_endpoint(self):
+        @query_budget(0)
+        @api_view(["GET"])
+        @permission_classes([AllowAny])
+        def plans_endpoint(request):
+            list(WorkoutPlan.objects.all())
+            return Response([])
+
+        with self.assertRaisesMessage(QueryBudgetExceeded, "plans_endpoint ran 1 queries (budget 0)"):
+            plans_endpoint(APIRequestFactory().get("/"))
+
+    def test_overrun_raises_in_strict_mode(self):
+        User = get_user_model()
+
+        @query_budget(1)
+        def chatty_view(request):
+            list(User.objects.all())
+            list(User.objects.all())
+
+        with self.assertRaises(QueryBudgetExceeded):
+            chatty_view(None)
@@ -0,0 +1,63 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import ExerciseLog, SetLog
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class SetBatchLoggingTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="gym", email="gym@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(2, 3))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.client.get("/api/workout/log/week/")
+        self.exercises = list(ExerciseLog.objects.order_by("id").values_list("id", flat=True))
+
+    def batch(self, count, weight=100):
+        return {"sets": [
+            {"client_key": f"key-{i}", "exercise": self.exercises[i % len(self.exercises)],
+             "set_number": i // len(self.exercises) + 1, "weight": weight, "reps": 8, "rpe": 8.5}
+            for i in range(count)
+        ]}
+
+    def post(self, payload):
+        return self.client.post("/api/workout/log/sets/batch/", payload, format="json")
+
+    def test_batch_creates_sets_across_exercises(self):
+        response = self.post(self.batch(12))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["sets"]), 12)
+        self.assertEqual(SetLog.objects.count(), 12)
+        self.assertEqual(SetLog.objects.filter(exercise_id=self.exercises[0]).count(), 2)
+
+    def test_retry_does_not_duplicate(self):
+        self.post(self.batch(6))
+        response = self.post(self.batch(6, weight=105))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(SetLog.objects.count(), 6)
+        self.assertEqual(set(SetLog.objects.values_list("weight", flat=True)), {105})
+
+    def test_query_count_independent_of_batch_size(self):
+        with CaptureQueriesContext(connection) as small:
+            self.post(self.batch(1))
+        with CaptureQueriesContext(connection) as large:
+            self.post(self.batch(60))
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_rejects_other_users_exercises(self):
+        intruder = get_user_model().objects.create_user(username="intruder", email="intruder@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(intruder)
+        response = client.post("/api/workout/log/sets/batch/", self.batch(2), format="json")
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(SetLog.objects.exists())
+
+    def test_invalid_set_rejects_whole_batch(self):
+        payload = self.batch(3)
+        payload["sets"][2]["reps"] = -1
+        self.assertEqual(self.post(payload).status_code, 400)
+        self.assertFalse(SetLog.objects.exists())
@@ -0,0 +1,86 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import ExerciseLog, SetLog, SyncTombstone, WorkoutDayLog
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class DeltaSyncTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="sync", email="sync@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(3, 4))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        response = self.client.get("/api/workout/log/week/")
+        self.cursor = int(response["X-Sync-Cursor"])
+        self.exercises = list(ExerciseLog.objects.order_by("id").values_list("id", flat=True))
+
+    def sync(self, cursor, **changes):
+        response = self.client.post("/api/workout/log/sync/", {"cursor": cursor, "changes": changes}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def set_item(self, key, exercise_index=0, weight=100):
+        return {"client_key": key, "exercise": self.exercises[exercise_index], "set_number": 1, "weight": weight, "reps": 5}
+
+    def test_week_log_cursor_covers_materialized_tree(self):
+        data = self.sync(self.cursor)
+        self.assertEqual(data["cursor"], self.cursor)
+        self.assertEqual(data["days"], [])
+        self.assertEqual(data["exercises"], [])
+
+    def test_full_pull_from_zero(self):
+        data = self.sync(0)
+        self.assertEqual(len(data["logs"]), 1)
+        self.assertEqual(len(data["days"]), 3)
+        self.assertEqual(len(data["exercises"]), 12)
+
+    def test_pull_returns_only_changes_since_cursor(self):
+        self.sync(self.cursor, sets=[self.set_item("a"), self.set_item("b", 1)])
+        data = self.sync(self.cursor)
+        self.assertEqual({s["client_key"] for s in data["sets"]}, {"a", "b"})
+        self.assertEqual(data["days"], [])
+        self.assertEqual(self.sync(data["cursor"])["sets"], [])
+
+    def test_push_upsert_is_idempotent(self):
+        self.sync(self.cursor, sets=[self.set_item("a")])
+        data = self.sync(self.cursor, sets=[self.set_item("a", weight=110)])
+        self.assertEqual(SetLog.objects.count(), 1)
+        self.assertEqual(data["sets"][0]["weight"], 110)
+
+    def test_deleted_sets_leave_tombstones(self):
+        first = self.sync(self.cursor, sets=[self.set_item("a"), self.set_item("b")])
+        set_id = SetLog.objects.get(client_key="a").id
+        data = self.sync(first["cursor"], deleted_sets=[{"exercise": self.exercises[0], "client_key": "a"}])
+        self.assertFalse(SetLog.objects.filter(id=set_id).exists())
+        self.assertEqual(data["deleted"], [{"model": "set", "object_id": set_id}])
+        self.assertEqual(SyncTombstone.objects.count(), 1)
+
+    def test_completed_days_are_pulled(self):
+        day_id = WorkoutDayLog.objects.order_by("id").values_list("id", flat=True).first()
+        data = self.sync(self.cursor, completed_days=[day_id])
+        self.assertEqual([(d["id"], d["is_complete"]) for d in data["days"]], [(day_id, True)])
+
+    def test_cursor_is_monotonic(self):
+        cursors = [self.cursor]
+        for i in range(3):
+            cursors.append(self.sync(cursors[-1], sets=[self.set_item(f"k{i}")])["cursor"])
+        self.assertEqual(cursors, sorted(set(cursors)))
+
+    def test_payload_scales_with_changes_not_history(self):
+        self.sync(self.cursor, sets=[self.set_item(f"old-{i}", i % 12) for i in range(40)])
+        cursor = self.sync(self.cursor)["cursor"]
+        data = self.sync(cursor, sets=[self.set_item("new")])
+        self.assertEqual(len(data["sets"]), 1)
+
+    def test_rejects_other_users_exercises(self):
+        intruder = get_user_model().objects.create_user(username="intruder", email="intruder@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(intruder)
+        response = client.post(
+            "/api/workout/log/sync/", {"cursor": 0, "changes": {"sets": [self.set_item("x")]}}, format="json"
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(SetLog.objects.exists())
+        self.assertEqual(client.post("/api/workout/log/sync/", {"cursor": 0}, format="json").data["logs"], [])
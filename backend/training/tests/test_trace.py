@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+from training.utils.plan_generation_utils import generate_plan
+from training.utils.trace_utils import GenerationTrace
+from .test_catalog import SeededCatalogMixin
+
+class GenerationTraceTestCase(SeededCatalogMixin, TestCase):
+    def test_trace_records_stages_and_candidates(self):
+        trace = GenerationTrace()
+        generate_plan(self.preferences(1), trace=trace)
+        record = trace.as_dict()
+        self.assertEqual(record["split"], "Full Body x3")
+        self.assertEqual(set(record["timings_ms"]), {"split_lookup", "candidate_filtering", "selection", "set_rep_decision", "total"})
+        self.assertEqual(len(record["patterns"]), 12)
+        self.assertEqual(record["patterns"][0]["candidates"], 5)
+        self.assertEqual(record["patterns"][1]["day"], "Full Body")
+
+    def test_trace_logged_when_logger_enabled(self):
+        with self.assertLogs("training.generation", level="DEBUG") as logs:
+            generate_plan(self.preferences(1))
+        self.assertEqual(logs.records[0].generation_trace["seed"], 1)
+
+    def test_preview_returns_trace_for_staff(self):
+        client = APIClient()
+        user = get_user_model().objects.create_user(username="staff", email="staff@example.com", password="pw", is_staff=True)
+        client.force_authenticate(user)
+        payload = {"days_per_week": 3, "training_age": 1, "volume": "high",
+                   "bodyweight_exercises": "weighted", "equipment": [self.barbell.id], "seed": 7}
+        response = client.post("/api/plan/preview/?trace=1", payload, format="json")
+        self.assertIn("trace", response.data)
+        self.assertEqual(response.data["trace"]["seed"], 7)
@@ -0,0 +1,62 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class WeekLogTestCase(TestCase):
+    def make_client(self, username, days, exercises_per_day):
+        user = get_user_model().objects.create_user(username=username, email=f"{username}@example.com", password="pw")
+        save_generated_plan(user, make_plan_dict(days, exercises_per_day))
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def fetch(self, client):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/workout/log/week/")
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_materializes_plan_into_week_log(self):
+        client = self.make_client("lifter", 3, 2)
+        response, _ = self.fetch(client)
+        self.assertEqual([day["order"] for day in response.data["days"]], [0, 1, 2])
+        self.assertEqual(
+            [ex["name"] for ex in response.data["days"][1]["exercises"]],
+            ["Exercise 1.0", "Exercise 1.1"],
+        )
+        self.assertEqual(response.data["days"][0]["exercises"][0]["target_reps"], 8)
+        self.assertEqual(ExerciseLog.objects.count(), 6)
+
+    def test_create_and_read_responses_match(self):
+        client = self.make_client("lifter", 2, 2)
+        created, _ = self.fetch(client)
+        read, _ = self.fetch(client)
+        self.assertEqual(created.data, read.data)
+
+    def test_query_counts_independent_of_plan_size(self):
+        small = self.make_client("small", 1, 1)
+        large = self.make_client("large", 6, 5)
+        _, small_create = self.fetch(small)
+        _, large_create = self.fetch(large)
+        self.assertEqual(small_create, large_create)
+
+        log = WorkoutLog.objects.get(user__username="large")
+        exercise = ExerciseLog.objects.filter(workout_day_log__workout_log=log).first()
+        SetLog.objects.create(exercise=exercise, set_number=1, weight=100, reps=5)
+        _, small_read = self.fetch(small)
+        _, large_read = self.fetch(large)
+        self.assertEqual(small_read, large_read)
+        self.assertLess(large_read, large_create)
+
+    def test_no_plan_does_not_create_log(self):
+        user = get_user_model().objects.create_user(username="planless", email="planless@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(user)
+        self.assertEqual(client.get("/api/workout/log/week/").status_code, 404)
+        self.assertFalse(WorkoutLog.objects.filter(user=user).exists())
+        self.assertFalse(WorkoutDayLog.objects.exists())
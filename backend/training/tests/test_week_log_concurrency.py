@@ -0,0 +1,78 @@
+import contextvars
+import threading
+from unittest import mock
+from django.db import connections, IntegrityError
+from django.test import TestCase, TransactionTestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from training.models import WorkoutLog, WorkoutDayLog
+from training.utils import logging_utils
+from training.utils.logging_utils import current_week_start, latest_plan_with_tree, materialize_week_log
+from training.utils.plan_generation_utils import save_generated_plan
+from .test_plan_saving import make_plan_dict
+
+class WeekLogRaceTestCase(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="racer", email="racer@example.com", password="pw")
+        save_generated_plan(self.user, make_plan_dict(3, 2))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_constraint_rejects_duplicate_week(self):
+        WorkoutLog.objects.create(user=self.user, start_date=current_week_start())
+        with self.assertRaises(IntegrityError):
+            WorkoutLog.objects.create(user=self.user, start_date=current_week_start())
+
+    def test_losing_the_race_serves_the_winners_log(self):
+        def plan_then_lose_race(user):
+            # Another request materializes the week between our read and our insert
+            plan = latest_plan_with_tree(user)
+            # In a fresh context, so the winner's queries aren't charged to this request's budget
+            self.winner = contextvars.Context().run(
+                materialize_week_log, user, current_week_start(), latest_plan_with_tree(user)
+            )
+            return plan
+
+        with mock.patch.object(logging_utils, "latest_plan_with_tree", side_effect=plan_then_lose_race):
+            response = self.client.get("/api/workout/log/week/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["id"], self.winner.id)
+        self.assertEqual(WorkoutLog.objects.count(), 1)
+        self.assertEqual(WorkoutDayLog.objects.count(), 3)
+
+class WeekLogStressTestCase(TransactionTestCase):
+    THREADS = 12
+
+    def test_parallel_first_requests_create_one_week(self):
+        User = get_user_model()
+        user = User.objects.create_user(username="launch", email="launch@example.com", password="pw")
+        save_generated_plan(user, make_plan_dict(4, 3))
+
+        barrier = threading.Barrier(self.THREADS)
+        responses = []
+        errors = []
+
+        def hit():
+            client = APIClient()
+            client.force_authenticate(user)
+            try:
+                barrier.wait()
+                responses.append(client.get("/api/workout/log/week/"))
+            except Exception as exc:  # surfaced through `errors` below
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=hit) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual([r.status_code for r in responses], [200] * self.THREADS)
+        self.assertEqual(len({r.data["id"] for r in responses}), 1)
+        self.assertEqual(WorkoutLog.objects.filter(user=user).count(), 1)
+        self.assertEqual(WorkoutDayLog.objects.filter(workout_log__user=user).count(), 4)
@@ -1,18 +1,37 @@
+from django.conf import settings
 from django.urls import path
-from .views.plan_views import preview_plan, save_plan, get_saved_plans
+from .views.plan_views import preview_plan, save_plan, get_saved_plans, get_plan_history
 from .views.preferences_views import save_preferences, get_preferences
-from .views.generic_views import get_muscles, get_equipment
-from .views.logging_views import get_week_log, submit_week_log, submit_day_log
+from .views.generic_views import get_muscles, get_equipment, get_catalog_bundle
+from .views.analytics_views import get_muscle_volume, get_exercise_records
+from .views.logging_views import (
+    get_week_log, submit_week_log, submit_day_log, log_sets_batch, sync_workout_logs,
+    get_week_log_history, get_exercise_history,
+)
+
+if settings.ASYNC_READ_VIEWS:
+    # Under ASGI the hot read endpoints run as async views (same URLs and payloads)
+    from .views.async_views import (
+        get_saved_plans, get_preferences, get_muscles, get_equipment, get_catalog_bundle, get_week_log,
+    )
 
 urlpatterns = [
     path("plan/preview/", preview_plan, name="plan-preview"),
     path("plan/save/", save_plan, name="plan-save"),
     path("plan/get/", get_saved_plans, name="plan-get"),
+    path("plan/history/", get_plan_history, name="plan-history"),
     path("preferences/save/", save_preferences, name="preferences-save"),
     path("preferences/get/", get_preferences, name="preferences-get"),
     path("muscles/", get_muscles, name="muscles-get"),
     path("equipment/", get_equipment, name="equipment-get"),
+    path("catalog/", get_catalog_bundle, name="catalog-get"),
     path("workout/log/week/", get_week_log, name="workout-log-week"),
     path("workout/log/week/submit/", submit_week_log, name="workout-log-week-submit"),
     path("workout/log/day/<int:day_log_id>/submit/", submit_day_log, name="workout-log-day-submit"),
+    path("workout/log/sets/batch/", log_sets_batch, name="workout-log-sets-batch"),
+    path("workout/log/sync/", sync_workout_logs, name="workout-log-sync"),
+    path("workout/log/history/", get_week_log_history, name="workout-log-history"),
+    path("workout/log/exercises/history/", get_exercise_history, name="workout-log-exercise-history"),
+    path("analytics/volume/", get_muscle_volume, name="analytics-volume"),
+    path("analytics/records/", get_exercise_records, name="analytics-records"),
 ]
@@ -0,0 +1,98 @@
+import functools
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from rest_framework import exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from training.utils.etag_utils import etag_matches
+from training.utils.json_utils import FastJSONRenderer
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication for async views. Token parsing and signature checks are
+    pure CPU and reused as-is; only the user lookup touches the database, and
+    it goes through the async ORM instead of a thread.
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        try:
+            user = await get_user_model().objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except get_user_model().DoesNotExist:
+            raise exceptions.AuthenticationFailed("User not found", code="user_not_found")
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+class AsyncJWTStatelessUserAuthentication(JWTStatelessUserAuthentication):
+    """The user comes from the token's claims, so there is nothing to await."""
+
+    async def aauthenticate(self, request):
+        return self.authenticate(request)
+
+authenticator = AsyncJWTAuthentication()
+stateless_authenticator = AsyncJWTStatelessUserAuthentication()
+
+def json_response(data, status=200):
+    """Rendered with FastJSONRenderer, the sync views' default renderer, so bodies match theirs."""
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type="application/json")
+
+def error_response(exc):
+    data = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+    response = json_response(data, status=exc.status_code)
+    if exc.status_code == 401:
+        response["WWW-Authenticate"] = authenticator.authenticate_header(None)
+    return response
+
+def async_read_view(etag_func=None, authentication=authenticator, not_modified_headers=None):
+    """
+    Async counterpart of @api_view(["GET"]) + IsAuthenticated + @conditional
+    for read endpoints: JWT-authenticates without a thread, answers 304 when
+    `await etag_func(request)` matches If-None-Match, and otherwise stamps the
+    view's 200 response with that ETag. GET and HEAD are allowed, as for the
+    sync views. Pass `authentication=stateless_authenticator` for endpoints
+    that don't need the user row, and `not_modified_headers` (awaited) for
+    headers a 304 must repeat, as with @conditional. Views return an HttpResponse.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return error_response(exceptions.MethodNotAllowed(request.method))
+            try:
+                authenticated = await authentication.aauthenticate(request)
+            except exceptions.APIException as exc:
+                return error_response(exc)
+            if authenticated is None:
+                return error_response(exceptions.NotAuthenticated())
+            request.user, request.auth = authenticated
+
+            etag = await etag_func(request) if etag_func is not None else None
+            if etag is not None and etag_matches(request, etag):
+                response = HttpResponse(status=304)
+                response["ETag"] = etag
+                if not_modified_headers is not None:
+                    for header, value in (await not_modified_headers(request)).items():
+                        response[header] = value
+                return response
+
+            response = await view(request, *args, **kwargs)
+            if etag is not None and response.status_code == 200 and not response.has_header("ETag"):
+                response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
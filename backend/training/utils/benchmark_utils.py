@@ -0,0 +1,54 @@
+import json
+import statistics
+from contextlib import contextmanager
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+class Rollback(Exception):
+    pass
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is always rolled back, keeping what it computed."""
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback()
+    except Rollback:
+        pass
+
+@contextmanager
+def deleted_afterwards(prefix):
+    """
+    Delete the users whose username starts with `prefix` (and their data) when
+    the block exits. For benchmarks whose worker threads use their own
+    connections, where nothing can be rolled back.
+    """
+    try:
+        yield
+    finally:
+        get_user_model().objects.filter(username__startswith=prefix).delete()
+
+def add_output_argument(parser):
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout.')
+
+def write_report(command, report, output=None):
+    body = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(body)
+        command.stdout.write(command.style.SUCCESS(f"Benchmark report written to {output}"))
+    else:
+        command.stdout.write(body)
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "p50": round(pick(0.50), 3),
+        "p90": round(pick(0.90), 3),
+        "p99": round(pick(0.99), 3),
+        "max": round(ordered[-1], 3),
+        "mean": round(statistics.fmean(ordered), 3),
+    }
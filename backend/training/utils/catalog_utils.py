@@ -0,0 +1,229 @@
+import uuid
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from training.models import (
+    CatalogVersion, ExercisePattern, ExerciseMovement, Equipment, Muscle,
+    WorkoutSplitTemplate, WorkoutDayTemplate, SplitDayThrough, DayPatternThrough,
+)
+from training.utils.json_utils import FastJSONRenderer
+
+CATALOG_VERSION_KEY = "training:catalog_version"
+CATALOG_VERSION_TIMEOUT = 30
+CATALOG_BODY_KEY = "training:catalog_body"
+CATALOG_BODY_TIMEOUT = 24 * 3600
+
+_snapshot = None
+_body = None
+
+class CatalogSnapshot:
+    """Read-only, in-memory copy of the exercise catalog used by plan generation."""
+
+    def __init__(self, version):
+        self.version = version
+        self.equipment = {}
+        self.muscles = {}
+        self.patterns = {}
+        self.movements = {}
+        self.movements_by_pattern = {}
+        self.movement_equipment = {}
+        self.equipment_bits = {}
+        self.pattern_movement_masks = {}
+        self.pattern_primary_muscles = {}
+        self.pattern_secondary_muscles = {}
+        self.splits = []
+        self.day_templates = {}
+        self.split_days = {}
+        self.template_patterns = {}
+        self._derived = {}
+
+    def derived(self, name, builder):
+        """Memoize structures computed from this snapshot (they die with it)."""
+        if name not in self._derived:
+            self._derived[name] = builder(self)
+        return self._derived[name]
+
+    def load(self):
+        self.equipment = {eq.id: eq for eq in Equipment.objects.order_by("id")}
+        self.equipment_bits = {eq_id: 1 << bit for bit, eq_id in enumerate(self.equipment)}
+        self.muscles = {m.id: m for m in Muscle.objects.all()}
+        self.patterns = {p.id: p for p in ExercisePattern.objects.all()}
+
+        for pattern_id in self.patterns:
+            self.movements_by_pattern[pattern_id] = []
+            self.pattern_primary_muscles[pattern_id] = set()
+            self.pattern_secondary_muscles[pattern_id] = set()
+
+        for movement in ExerciseMovement.objects.order_by("id"):
+            self.movements[movement.id] = movement
+            self.movements_by_pattern.setdefault(movement.pattern_id, []).append(movement)
+            self.movement_equipment[movement.id] = set()
+
+        equipment_through = ExerciseMovement.equipment.through.objects.values_list(
+            "exercisemovement_id", "equipment_id"
+        )
+        for movement_id, equipment_id in equipment_through:
+            self.movement_equipment[movement_id].add(equipment_id)
+
+        primary_through = ExercisePattern.primary_muscles.through.objects.values_list(
+            "exercisepattern_id", "muscle_id"
+        )
+        for pattern_id, muscle_id in primary_through:
+            self.pattern_primary_muscles[pattern_id].add(muscle_id)
+
+        secondary_through = ExercisePattern.secondary_muscles.through.objects.values_list(
+            "exercisepattern_id", "muscle_id"
+        )
+        for pattern_id, muscle_id in secondary_through:
+            self.pattern_secondary_muscles[pattern_id].add(muscle_id)
+
+        self.movement_equipment = {k: frozenset(v) for k, v in self.movement_equipment.items()}
+        self.load_split_graph()
+
+        # Parallel to movements_by_pattern: one equipment bitmask per movement
+        for pattern_id, movements in self.movements_by_pattern.items():
+            self.pattern_movement_masks[pattern_id] = [
+                self.equipment_mask(self.movement_equipment[movement.id]) for movement in movements
+            ]
+        return self
+
+    def load_split_graph(self):
+        """Split -> ordered day templates -> ordered pattern ids, via two prefetches."""
+        templates = WorkoutDayTemplate.objects.prefetch_related(
+            Prefetch("daypatternthrough_set", queryset=DayPatternThrough.objects.order_by("pattern_index"))
+        )
+        for template in templates:
+            self.day_templates[template.id] = template
+            self.template_patterns[template.id] = [dp.pattern_id for dp in template.daypatternthrough_set.all()]
+
+        splits = WorkoutSplitTemplate.objects.order_by("id").prefetch_related(
+            Prefetch("splitdaythrough_set", queryset=SplitDayThrough.objects.order_by("day_index"))
+        )
+        for split in splits:
+            self.splits.append(split)
+            self.split_days[split.id] = [
+                self.day_templates[through.day_template_id] for through in split.splitdaythrough_set.all()
+            ]
+
+    def split_for(self, days_per_week):
+        return next((split for split in self.splits if split.days_per_week == days_per_week), None)
+
+    def equipment_mask(self, equipment_ids):
+        """Encode equipment ids as an integer bitmask; unknown ids are ignored."""
+        mask = 0
+        for eq_id in equipment_ids:
+            mask |= self.equipment_bits.get(eq_id, 0)
+        return mask
+
+    def day_patterns(self, template_id):
+        return [self.patterns[p_id] for p_id in self.template_patterns.get(template_id, [])]
+
+    def candidates_for(self, pattern_id, equipment_mask, exclude_ids=()):
+        """Movements of a pattern usable with any equipment in the mask."""
+        movements = self.movements_by_pattern.get(pattern_id, [])
+        masks = self.pattern_movement_masks.get(pattern_id, [])
+        return [
+            movement for movement, mask in zip(movements, masks)
+            if mask & equipment_mask and movement.id not in exclude_ids
+        ]
+
+def get_catalog_version():
+    """
+    The catalog's version token. The database row is the source of truth; the
+    cache only spares a query per request, and its short timeout bounds how long
+    a process without a shared cache can lag behind an edit made elsewhere.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = CatalogVersion.objects.values_list("version", flat=True).first()
+        if version is None:
+            version = bump_catalog_version()
+        cache.set(CATALOG_VERSION_KEY, version, CATALOG_VERSION_TIMEOUT)
+    return version
+
+def bump_catalog_version():
+    """
+    Give the catalog a new random version token, so every process's snapshot
+    is rebuilt lazily and stale copies can never match again (not even after
+    a restart). Returns the new token.
+    """
+    version = uuid.uuid4().hex
+    CatalogVersion.objects.update_or_create(pk=1, defaults={"version": version})
+    # Dropped again on commit: a reader between now and then may cache the old token
+    cache.delete(CATALOG_VERSION_KEY)
+    transaction.on_commit(lambda: cache.delete(CATALOG_VERSION_KEY))
+    return version
+
+def get_catalog():
+    global _snapshot
+    version = get_catalog_version()
+    if _snapshot is None or _snapshot.version != version:
+        _snapshot = CatalogSnapshot(version).load()
+    return _snapshot
+
+def catalog_document(snapshot):
+    """The /api/catalog/ payload, built from a loaded snapshot without further queries."""
+    return {
+        "version": snapshot.version,
+        "muscles": [{"id": m.id, "name": m.name} for m in sorted(snapshot.muscles.values(), key=lambda m: m.id)],
+        "equipment": [{"id": eq.id, "name": eq.name} for eq in snapshot.equipment.values()],
+        "patterns": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "primary_muscles": sorted(snapshot.pattern_primary_muscles[p.id]),
+                "secondary_muscles": sorted(snapshot.pattern_secondary_muscles[p.id]),
+            }
+            for p in sorted(snapshot.patterns.values(), key=lambda p: p.id)
+        ],
+        "movements": [
+            {
+                "id": mv.id,
+                "name": mv.name,
+                "pattern": mv.pattern_id,
+                "type": mv.type,
+                "equipment": sorted(snapshot.movement_equipment[mv.id]),
+                "form_image": mv.form_image.url if mv.form_image else None,
+            }
+            for mv in snapshot.movements.values()
+        ],
+        "splits": [
+            {
+                "id": split.id,
+                "name": split.name,
+                "days_per_week": split.days_per_week,
+                "days": [
+                    {
+                        "id": day.id,
+                        "name": day.name,
+                        "description": day.description,
+                        "patterns": snapshot.template_patterns[day.id],
+                    }
+                    for day in snapshot.split_days[split.id]
+                ],
+            }
+            for split in snapshot.splits
+        ],
+    }
+
+def get_catalog_body():
+    """
+    (version, JSON bytes) of the catalog document. Kept per process and in the
+    shared cache under the catalog version, so steady-state reads run no
+    queries and no serialization; only the first process after a bump builds it.
+    The version is the random token persisted in CatalogVersion, so neither
+    copy can be matched again once it is bumped, in this process or any other.
+    """
+    global _body
+    version = get_catalog_version()
+    if _body is not None and _body[0] == version:
+        return _body
+
+    body = cache.get(f"{CATALOG_BODY_KEY}:{version}")
+    if body is None:
+        snapshot = get_catalog()
+        version = snapshot.version
+        body = FastJSONRenderer().render(catalog_document(snapshot))
+        cache.set(f"{CATALOG_BODY_KEY}:{version}", body, CATALOG_BODY_TIMEOUT)
+    _body = (version, body)
+    return _body
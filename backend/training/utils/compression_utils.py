@@ -0,0 +1,40 @@
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+def accepted_encodings(header):
+    """{coding: q} from an Accept-Encoding header, lowercased."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+def choose_encoding(header):
+    """'br', 'gzip' or None for a request's Accept-Encoding; brotli wins ties."""
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get("*", 0.0)
+    options = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for coding in options:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+def compress(body, encoding, brotli_quality=5):
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return compress_string(body)
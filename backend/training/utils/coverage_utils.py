@@ -0,0 +1,128 @@
+from time import perf_counter
+import numpy as np
+from training.utils.plan_generation_utils import set_rep_options, day_patterns, exercise_entry
+
+PRIMARY_WEIGHT = 1.0
+SECONDARY_WEIGHT = 0.5
+PRIORITY_WEIGHT = 2.0
+PRIORITY_TARGET_MULTIPLIER = 1.5
+SET_COST = 0.01  # makes extra sets past a muscle's target a net loss
+WEEKLY_SET_TARGETS = {"low": 6, "moderate": 10, "high": 14}
+
+class MuscleMatrix:
+    """Movement x muscle weights, derived from each movement's pattern."""
+
+    def __init__(self, catalog):
+        self.muscle_ids = sorted(catalog.muscles)
+        self.muscle_index = {m_id: i for i, m_id in enumerate(self.muscle_ids)}
+        pattern_ids = list(catalog.patterns)
+        pattern_row = {p_id: i for i, p_id in enumerate(pattern_ids)}
+
+        patterns = np.zeros((len(pattern_ids), len(self.muscle_ids)), dtype=np.float64)
+        for p_id, row in pattern_row.items():
+            for m_id in catalog.pattern_secondary_muscles[p_id]:
+                patterns[row, self.muscle_index[m_id]] = SECONDARY_WEIGHT
+            for m_id in catalog.pattern_primary_muscles[p_id]:
+                patterns[row, self.muscle_index[m_id]] = PRIMARY_WEIGHT
+
+        movement_ids = list(catalog.movements)
+        self.movement_index = {mv_id: i for i, mv_id in enumerate(movement_ids)}
+        movement_patterns = np.array(
+            [pattern_row[catalog.movements[mv_id].pattern_id] for mv_id in movement_ids], dtype=np.intp
+        )
+        self.matrix = patterns[movement_patterns] if movement_ids else np.zeros((0, len(self.muscle_ids)))
+
+        # Patterns sharing a primary muscle can stand in for each other
+        primary = (patterns == PRIMARY_WEIGHT).astype(np.int32)
+        related = (primary @ primary.T) > 0
+        self.related_patterns = {
+            p_id: [pattern_ids[j] for j in np.flatnonzero(related[row]) if j != row]
+            for p_id, row in pattern_row.items()
+        }
+
+    def rows(self, movements):
+        return self.matrix[[self.movement_index[mv.id] for mv in movements]]
+
+def get_muscle_matrix(catalog):
+    return catalog.derived("muscle_matrix", MuscleMatrix)
+
+class CoverageSelector:
+    """
+    Greedy whole-week selection: each slot takes the (movement, set option)
+    with the best marginal gain in priority-weighted weekly muscle coverage,
+    capped at a per-muscle target. Ties are broken with the request's rng.
+    """
+
+    def __init__(self, catalog, equipment_mask, volume, priority_muscles, rng):
+        self.catalog = catalog
+        self.muscles = get_muscle_matrix(catalog)
+        self.equipment_mask = equipment_mask
+        self.volume = volume
+        self.rng = rng
+
+        n_muscles = len(self.muscles.muscle_ids)
+        self.weights = np.ones(n_muscles)
+        self.targets = np.full(n_muscles, float(WEEKLY_SET_TARGETS.get(volume, WEEKLY_SET_TARGETS["moderate"])))
+        for m_id in priority_muscles:
+            if m_id in self.muscles.muscle_index:
+                self.weights[self.muscles.muscle_index[m_id]] = PRIORITY_WEIGHT
+                self.targets[self.muscles.muscle_index[m_id]] *= PRIORITY_TARGET_MULTIPLIER
+        self.coverage = np.zeros(n_muscles)
+        self.last_candidate_count = 0
+
+    def candidates(self, pattern, used_ids):
+        candidates = self.catalog.candidates_for(pattern.id, self.equipment_mask, used_ids)
+        if candidates:
+            return candidates
+        substitutes = []
+        for p_id in self.muscles.related_patterns.get(pattern.id, []):
+            substitutes.extend(self.catalog.candidates_for(p_id, self.equipment_mask, used_ids))
+        return substitutes
+
+    def select(self, pattern, used_ids):
+        """Return (movement, (sets, start_reps, end_reps)), or (None, None)."""
+        candidates = self.candidates(pattern, used_ids)
+        self.last_candidate_count = len(candidates)
+        if not candidates:
+            return None, None
+
+        options = [set_rep_options(mv, self.volume) for mv in candidates]
+        width = max(len(opts) for opts in options)
+        options = [opts + [opts[-1]] * (width - len(opts)) for opts in options]
+        sets = np.array([[opt[0] for opt in opts] for opts in options], dtype=np.float64)  # (k, o)
+
+        rows = self.muscles.rows(candidates)  # (k, m)
+        capped = np.minimum(self.coverage + sets[:, :, None] * rows[:, None, :], self.targets)  # (k, o, m)
+        base = np.minimum(self.coverage, self.targets) @ self.weights
+        gains = capped @ self.weights - base - SET_COST * sets
+
+        best = np.flatnonzero(np.isclose(gains.ravel(), gains.max()))
+        pick = int(best[self.rng.randrange(len(best))])
+        k, o = divmod(pick, width)
+
+        self.coverage += sets[k, o] * rows[k]
+        return candidates[k], options[k][o]
+
+    def weekly_coverage(self):
+        return {
+            self.catalog.muscles[m_id].name: float(self.coverage[i])
+            for i, m_id in enumerate(self.muscles.muscle_ids) if self.coverage[i]
+        }
+
+def generate_coverage_day(selector, workout_day_template, trace=None):
+    used_ids = set()
+    day_plan = []
+    for pattern in day_patterns(workout_day_template, selector.catalog):
+        if trace is not None:
+            started = perf_counter()
+        exercise, scheme = selector.select(pattern, used_ids)
+        if trace is not None:
+            trace.add_time("selection", started)
+            trace.record_pattern(workout_day_template.name, pattern, selector.last_candidate_count, exercise)
+
+        if exercise:
+            used_ids.add(exercise.id)
+            day_plan.append(exercise_entry(exercise, *scheme))
+        else:
+            day_plan.append(exercise_entry(None, 0, 0, 0))
+    return day_plan
@@ -0,0 +1,121 @@
+import functools
+import hashlib
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.response import Response
+from training.models import SyncState, UserPreferences, WorkoutPlan
+from training.utils.catalog_utils import get_catalog_version
+from training.utils.logging_utils import aweek_log_cursor, current_week_start, week_log_cursor
+
+def make_etag(*parts):
+    """Weak ETag from the values a response body is derived from."""
+    digest = hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()[:32]
+    return f"W/{quote_etag(digest)}"
+
+def etag_matches(request, etag):
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = {tag.removeprefix("W/") for tag in parse_etags(header)}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+def conditional(etag_func, not_modified_headers=None):
+    """
+    Answer GETs with 304 Not Modified when If-None-Match matches the ETag
+    from `etag_func(request)`, without running the view; otherwise run the
+    view and stamp its 200 response with the ETag.
+
+    Goes beneath @api_view/@permission_classes so request.user is already
+    authenticated. `etag_func` may return None to skip validation. Views whose
+    200 carries state in headers (X-Sync-Cursor) pass `not_modified_headers(request)`
+    to repeat them on the 304.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            etag = etag_func(request)
+            if etag is not None and etag_matches(request, etag):
+                headers = {"ETag": etag}
+                if not_modified_headers is not None:
+                    headers.update(not_modified_headers(request))
+                return Response(status=304, headers=headers)
+
+            response = view(request, *args, **kwargs)
+            # Views that write while answering set their own, post-write ETag
+            if etag is not None and response.status_code == 200 and not response.has_header("ETag"):
+                response["ETag"] = etag
+            return response
+        return wrapper
+    return decorator
+
+# Each validator has an async twin (a-prefixed) for the async read views
+
+PLAN_STATS = {"count": Count("id"), "last": Max("id")}
+
+def catalog_etag(request):
+    # The version token is a random value persisted in CatalogVersion, so it
+    # never repeats across restarts and is the same in every worker
+    return make_etag("catalog", get_catalog_version())
+
+async def acatalog_etag(request):
+    # Usually a cache hit, but a miss reads CatalogVersion
+    return make_etag("catalog", await sync_to_async(get_catalog_version)())
+
+def saved_plans_etag(request):
+    # Saved plans are never edited in place, so adds/removes are the only changes
+    stats = WorkoutPlan.objects.filter(user=request.user).aggregate(**PLAN_STATS)
+    return make_etag("plans", request.user.pk, stats["count"], stats["last"])
+
+async def asaved_plans_etag(request):
+    stats = await WorkoutPlan.objects.filter(user=request.user).aaggregate(**PLAN_STATS)
+    return make_etag("plans", request.user.pk, stats["count"], stats["last"])
+
+def preferences_etag(request):
+    stamp = UserPreferences.objects.filter(user=request.user).values_list("id", "updated_at").first()
+    if stamp is None:
+        return None
+    return make_etag("preferences", request.user.pk, *stamp)
+
+async def apreferences_etag(request):
+    stamp = await UserPreferences.objects.filter(user=request.user).values_list("id", "updated_at").afirst()
+    if stamp is None:
+        return None
+    return make_etag("preferences", request.user.pk, *stamp)
+
+def sync_revision(request):
+    return SyncState.objects.filter(user=request.user).values_list("revision", flat=True).first() or 0
+
+async def async_revision(request):
+    return await SyncState.objects.filter(user=request.user).values_list("revision", flat=True).afirst() or 0
+
+def week_log_etag(request, revision=None):
+    # Every log write bumps the user's sync revision
+    if revision is None:
+        revision = sync_revision(request)
+    return make_etag("week", request.user.pk, current_week_start(), revision)
+
+async def aweek_log_etag(request):
+    return week_log_etag(request, await async_revision(request))
+
+def week_log_headers(request):
+    # A 304 must not leave the client without its sync cursor
+    cursor = week_log_cursor(request.user, current_week_start())
+    return {} if cursor is None else {"X-Sync-Cursor": str(cursor)}
+
+async def aweek_log_headers(request):
+    cursor = await aweek_log_cursor(request.user, current_week_start())
+    return {} if cursor is None else {"X-Sync-Cursor": str(cursor)}
+
+def muscle_volume_etag(request):
+    # Volume only changes with set writes and rebuild_muscle_volume, which all bump the sync revision
+    return make_etag(
+        "volume", request.user.pk, current_week_start(), request.query_params.get("weeks"), sync_revision(request)
+    )
+
+def records_etag(request):
+    # Likewise set writes and rebuild_exercise_records
+    return make_etag(
+        "records", request.user.pk, *sorted(request.query_params.getlist("exercise")), sync_revision(request)
+    )
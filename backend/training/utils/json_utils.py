@@ -0,0 +1,54 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to DRF's stdlib json
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson, for compact responses: datetimes, Decimals
+    and lazy strings still go through DRF's encoder, and U+2028/U+2029 are
+    escaped the same way. Indented output (browsable API, ?indent) and
+    anything orjson refuses use the stdlib path. The same JSON values either
+    way, but not always the same bytes:
+    - NaN and infinities render as null instead of raising;
+    - floats written with an exponent drop the sign and zero padding
+      (1e16 and 1e-7, where the stdlib writes 1e+16 and 1e-07).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # orjson only writes compact UTF-8, so other output settings keep the stdlib path
+        if orjson is None or data is None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson; same errors (ParseError -> 400) and strictness."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        body = stream.read()
+        try:
+            if encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
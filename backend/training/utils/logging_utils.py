@@ -0,0 +1,253 @@
+from datetime import date, timedelta
+from django.db import IntegrityError, transaction
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, Max, OuterRef, Prefetch, Q
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog, WorkoutDay, WorkoutPlan, PlannedExercise
+from training.utils.sync_utils import next_revision, next_revisions
+from training.utils.volume_utils import record_set_changes
+from training.utils.records_utils import update_records
+from training.utils.progression_utils import apply_targets, previous_week_sets
+
+SET_UPSERT_FIELDS = ["set_number", "weight", "reps", "rpe", "notes", "source", "revision"]
+
+def current_week_start():
+    today = date.today()
+    return today - timedelta(days=today.weekday())  # Monday as start
+
+def week_log_queryset():
+    """WorkoutLog with the whole day -> exercise -> set tree prefetched (4 queries)."""
+    return WorkoutLog.objects.prefetch_related(
+        Prefetch("days", queryset=WorkoutDayLog.objects.select_related("workout_day").order_by("id")),
+        Prefetch("days__exercises", queryset=ExerciseLog.objects.order_by("id")),
+        Prefetch("days__exercises__sets", queryset=SetLog.objects.order_by("id")),
+    )
+
+def plan_tree_queryset():
+    return WorkoutPlan.objects.prefetch_related(
+        Prefetch("days", queryset=WorkoutDay.objects.order_by("order")),
+        Prefetch("days__exercises", queryset=PlannedExercise.objects.order_by("id")),
+    )
+
+def latest_plan_with_tree(user):
+    """The user's latest saved plan with its days and planned exercises prefetched."""
+    return plan_tree_queryset().filter(user=user).order_by("-id").first()
+
+def latest_plans_with_tree(user_ids):
+    """{user_id: latest plan} for many users, trees prefetched, in three queries."""
+    latest = WorkoutPlan.objects.filter(user_id__in=user_ids).values("user_id").annotate(last=Max("id")).values("last")
+    return {plan.user_id: plan for plan in plan_tree_queryset().filter(id__in=latest)}
+
+def attach_prefetched(instance, **related):
+    """Seed a model's prefetch cache so serializers read in-memory children."""
+    cache = getattr(instance, "_prefetched_objects_cache", None)
+    if cache is None:
+        cache = instance._prefetched_objects_cache = {}
+    cache.update(related)
+
+def tree_revision(log):
+    """Highest revision in a week log's in-memory tree: a safe sync cursor for it."""
+    revision = log.revision
+    for day_log in log.days.all():
+        revision = max(revision, day_log.revision)
+        for exercise_log in day_log.exercises.all():
+            revision = max(revision, exercise_log.revision, *(s.revision for s in exercise_log.sets.all()))
+    return revision
+
+TREE_REVISIONS = {
+    "log_revision": Max("revision"),
+    "day_revision": Max("days__revision"),
+    "exercise_revision": Max("days__exercises__revision"),
+    "set_revision": Max("days__exercises__sets__revision"),
+}
+
+def week_log_cursor(user, start_date):
+    """tree_revision of the user's log for a week in one aggregate query, or None without a log."""
+    revisions = WorkoutLog.objects.filter(user=user, start_date=start_date).aggregate(**TREE_REVISIONS)
+    return max((r for r in revisions.values() if r is not None), default=None)
+
+async def aweek_log_cursor(user, start_date):
+    revisions = await WorkoutLog.objects.filter(user=user, start_date=start_date).aaggregate(**TREE_REVISIONS)
+    return max((r for r in revisions.values() if r is not None), default=None)
+
+def build_week_log_rows(log, plan, history=None):
+    """
+    Unsaved WorkoutDayLog rows and, per day, unsaved ExerciseLog rows for a
+    plan. Targets progress from last week's sets in `history` (see
+    previous_week_sets); exercises without history start at the plan's defaults.
+    """
+    history = history or {}
+    day_logs = []
+    exercise_logs = []
+    for idx, day in enumerate(plan.days.all()):
+        day_log = WorkoutDayLog(workout_log=log, workout_day=day, order=idx, revision=log.revision)
+        day_logs.append(day_log)
+        day_exercises = []
+        for planned_ex in day.exercises.all():
+            exercise_log = ExerciseLog(
+                workout_day_log=day_log, name=planned_ex.name, revision=log.revision,
+                user_id=log.user_id, start_date=log.start_date,
+            )
+            apply_targets(
+                exercise_log, history.get((log.user_id, planned_ex.name)),
+                planned_ex.sets, planned_ex.start_reps, planned_ex.end_reps,
+            )
+            day_exercises.append(exercise_log)
+        exercise_logs.append(day_exercises)
+    return day_logs, exercise_logs
+
+def materialize_week_log(user, start_date, plan):
+    """
+    Create a week's WorkoutLog and all of its day/exercise logs from a plan
+    fetched with latest_plan_with_tree, using one transaction and two bulk
+    INSERTs. Targets progress from the previous week's sets. The returned log
+    carries its children in memory, so serializing it issues no further queries.
+    """
+    history = previous_week_sets([user.pk], start_date)
+    with transaction.atomic():
+        log = WorkoutLog.objects.create(user=user, start_date=start_date, revision=next_revision(user))
+        day_logs, exercise_logs = build_week_log_rows(log, plan, history)
+        WorkoutDayLog.objects.bulk_create(day_logs)
+        ExerciseLog.objects.bulk_create([ex for day_exercises in exercise_logs for ex in day_exercises])
+
+    attach_prefetched(log, days=day_logs)
+    for day_log, day_exercises in zip(day_logs, exercise_logs):
+        attach_prefetched(day_log, exercises=day_exercises)
+        for exercise_log in day_exercises:
+            attach_prefetched(exercise_log, sets=[])
+    return log
+
+def get_or_materialize_week_log(user, start_date):
+    """
+    The user's log for the week starting `start_date`, materialized from their
+    latest plan on first access. Returns (log, created); log is None without a plan.
+
+    Parallel first requests may both miss the read and both try to insert;
+    the (user, start_date) constraint rejects all but one, and the losers
+    serve the winner's log instead of raising.
+    """
+    log = week_log_queryset().filter(user=user, start_date=start_date).first()
+    if log is not None:
+        return log, False
+    return create_week_log(user, start_date)
+
+def create_week_log(user, start_date):
+    """
+    The write half of get_or_materialize_week_log, for callers that have
+    already found the week missing. Returns (log, created) the same way.
+    """
+    plan = latest_plan_with_tree(user)
+    if plan is None:
+        return None, False
+    try:
+        return materialize_week_log(user, start_date, plan), True
+    except IntegrityError:
+        return week_log_queryset().get(user=user, start_date=start_date), False
+
+PREMATERIALIZE_BATCH_SIZE = 200
+
+def materialize_week_logs(plans, start_date):
+    """
+    materialize_week_log for many users at once: {user_id: plan} becomes one
+    transaction of three bulk INSERTs. Raises IntegrityError, and writes
+    nothing, if any of those users already has the week.
+    """
+    user_ids = list(plans)
+    history = previous_week_sets(user_ids, start_date)
+    with transaction.atomic():
+        revisions = next_revisions(user_ids)
+        logs = WorkoutLog.objects.bulk_create([
+            WorkoutLog(user_id=user_id, start_date=start_date, revision=revisions[user_id]) for user_id in user_ids
+        ])
+        rows = [build_week_log_rows(log, plans[log.user_id], history) for log in logs]
+        WorkoutDayLog.objects.bulk_create([day_log for day_logs, _ in rows for day_log in day_logs])
+        ExerciseLog.objects.bulk_create([
+            exercise_log for _, exercise_logs in rows for day_exercises in exercise_logs for exercise_log in day_exercises
+        ])
+    return logs
+
+def users_missing_week(start_date, active_since):
+    """Active users with a saved plan but no log yet for the week of `start_date`."""
+    User = get_user_model()
+    recent_log = WorkoutLog.objects.filter(user=OuterRef("pk"), start_date__gte=active_since)
+    recent_plan = WorkoutPlan.objects.filter(user=OuterRef("pk"), created_at__date__gte=active_since)
+    return User.objects.filter(
+        Q(Exists(recent_log)) | Q(Exists(recent_plan)),
+        Exists(WorkoutPlan.objects.filter(user=OuterRef("pk"))),
+        is_active=True,
+    ).exclude(Exists(WorkoutLog.objects.filter(user=OuterRef("pk"), start_date=start_date)))
+
+def prematerialize_week(start_date, active_since, batch_size=PREMATERIALIZE_BATCH_SIZE):
+    """
+    Create the week of `start_date` ahead of time for every active user,
+    walking users in id order one bounded batch at a time. A batch that races
+    with users' own first requests falls back to the per-user safe path.
+    Returns the number of logs created.
+    """
+    created = 0
+    last_id = 0
+    users = users_missing_week(start_date, active_since)
+    while True:
+        batch = list(users.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+        if not batch:
+            return created
+        last_id = batch[-1]
+        try:
+            created += len(materialize_week_logs(latest_plans_with_tree(batch), start_date))
+        except IntegrityError:
+            for user in get_user_model().objects.filter(id__in=batch):
+                created += get_or_materialize_week_log(user, start_date)[1]
+
+def owned_exercise_ids(user, exercise_ids):
+    return set(
+        ExerciseLog.objects.filter(id__in=set(exercise_ids), workout_day_log__workout_log__user=user)
+        .values_list("id", flat=True)
+    )
+
+def upsert_set_logs(user, items, revision=None):
+    """
+    Insert-or-update SetLogs keyed by (exercise, client_key) in one transaction.
+    Replaying the same batch is a no-op apart from rewriting identical values.
+    Within a batch, the last item for a key wins. Exercise ownership must
+    already have been checked with owned_exercise_ids.
+    """
+    latest = {}
+    for item in items:
+        latest[(item["exercise"], item["client_key"])] = item
+
+    rows = [
+        SetLog(
+            exercise_id=item["exercise"],
+            client_key=item["client_key"],
+            set_number=item["set_number"],
+            weight=item["weight"],
+            reps=item["reps"],
+            rpe=item.get("rpe"),
+            notes=item.get("notes", ""),
+            source=item.get("source", "manual"),
+        )
+        for item in latest.values()
+    ]
+    with transaction.atomic():
+        if revision is None:
+            revision = next_revision(user)
+        replaced = SetLog.objects.filter(
+            exercise_id__in={exercise_id for exercise_id, _ in latest},
+            client_key__in={client_key for _, client_key in latest},
+        ).values_list("exercise_id", "client_key", "reps", "weight")
+        before = [(exercise_id, reps, weight) for exercise_id, key, reps, weight in replaced if (exercise_id, key) in latest]
+        for row in rows:
+            row.revision = revision
+        SetLog.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["exercise", "client_key"],
+            update_fields=SET_UPSERT_FIELDS,
+        )
+        after = [(row.exercise_id, row.reps, row.weight) for row in rows]
+        record_set_changes(user, before, after)
+        update_records(user, before, after)
+    saved = SetLog.objects.filter(
+        exercise_id__in={exercise_id for exercise_id, _ in latest},
+        client_key__in={client_key for _, client_key in latest},
+    ).order_by("exercise_id", "set_number")
+    return [row for row in saved if (row.exercise_id, row.client_key) in latest]
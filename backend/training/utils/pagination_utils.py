@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from django.db.models import DateTimeField, Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(value, last_id):
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, last_id]).encode()).decode()
+
+def decode_cursor(token, field):
+    """(value, last_id) from a cursor, the value parsed for `field` (a date or datetime field)."""
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursor(token) from exc
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or not isinstance(value, str):
+        raise InvalidCursor(token)
+    parse = datetime.fromisoformat if isinstance(field, DateTimeField) else date.fromisoformat
+    try:
+        return parse(value), last_id
+    except ValueError as exc:
+        raise InvalidCursor(token) from exc
+
+def page_size(request):
+    try:
+        size = int(request.query_params.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        size = DEFAULT_PAGE_SIZE
+    return min(max(size, 1), MAX_PAGE_SIZE)
+
+def keyset_page(queryset, request, key):
+    """
+    One page of `queryset`, newest first by (`key`, id), resuming after the
+    request's ?cursor=. `key` is a date or datetime field. Seeking from
+    the last row seen instead of using OFFSET makes every page cost the same.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    size = page_size(request)
+    token = request.query_params.get("cursor")
+    if token:
+        value, last_id = decode_cursor(token, queryset.model._meta.get_field(key))
+        queryset = queryset.filter(Q(**{f"{key}__lt": value}) | Q(**{key: value, "id__lt": last_id}))
+
+    rows = list(queryset.order_by(f"-{key}", "-id")[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, encode_cursor(getattr(rows[-1], key), rows[-1].id)
@@ -1,169 +1,248 @@
 import random
-from training.models import ExerciseMovement, WorkoutSplitTemplate, ExerciseType, WorkoutPlan, WorkoutDay, PlannedExercise
-
-import random
-from training.models import ExerciseMovement, Equipment
-
-def attach_exercise(preferences, pattern, used_exercises=None):
+from time import perf_counter
+from django.db import transaction
+from training.models import ExerciseType, WorkoutPlan, WorkoutDay, PlannedExercise, UserPreferences
+from training.utils.catalog_utils import get_catalog
+from training.utils.trace_utils import trace_if_enabled
+
+def normalize_preferences(preferences):
+    """Accept validated PlanRequestSerializer data or a saved UserPreferences row."""
+    if isinstance(preferences, UserPreferences):
+        return {
+            "days_per_week": preferences.days_per_week,
+            "training_age": preferences.training_age,
+            "volume": preferences.volume,
+            "bodyweight_exercises": preferences.bodyweight_exercises,
+            "equipment": list(preferences.equipment.values_list("id", flat=True)),
+            "priority_muscles": list(preferences.priority_muscles.values_list("id", flat=True)),
+        }
+    return preferences
+
+def attach_exercise(preferences, pattern, used_exercises=None, catalog=None, equipment_mask=None, rng=random, trace=None, day_name=None, pool=None):
+    """
+    Pick a movement for a pattern. `pool` is the pattern's equipment-filtered
+    candidate list when the caller already has it memoized.
+    """
     if used_exercises is None:
         used_exercises = set()
-
-    print(f"\n=== DEBUG attach_exercise for pattern: {pattern} ===")
-    print(f"Pattern ID: {pattern.id}")
-    print(f"Pattern name: {pattern.name}")
-
-    # Retrieve equipment IDs from preferences
-    equipment_ids = preferences.get("equipment", [])
-    print(f"Equipment IDs: {equipment_ids}")
-
-    # Get equipment names from IDs
-    available_equipment = list(
-        Equipment.objects.filter(id__in=equipment_ids).values_list("name", flat=True)
-    )
-    print(f"Available equipment names from IDs: {available_equipment}")
-
-    # Debug: Check all exercises for this pattern
-    all_pattern_exercises = ExerciseMovement.objects.filter(pattern=pattern)
-    print(f"All exercises for pattern {pattern.name}: {all_pattern_exercises.count()}")
-    for ex in all_pattern_exercises:
-        ex_equipment = [eq.name for eq in ex.equipment.all()]
-        print(f"  - {ex.name}: equipment={ex_equipment}")
-
-    # Filter exercises by pattern and equipment
-    candidates = ExerciseMovement.objects.filter(pattern=pattern)
-    print(f"Candidates after pattern filter: {candidates.count()}")
-
-    equipment_filtered = candidates.filter(equipment__name__in=available_equipment).distinct()
-    print(f"Candidates after equipment filter: {equipment_filtered.count()}")
-
-    used_exercise_ids = [ex.id for ex in used_exercises]
-    print(f"Used exercise IDs: {used_exercise_ids}")
-
-    final_candidates = equipment_filtered.exclude(id__in=used_exercise_ids)
-    print(f"Final candidates: {final_candidates.count()}")
-
-    if not final_candidates.exists():
-        print("No suitable exercises found!")
-        return None
-
-    selected = final_candidates.order_by('?').first()
-    print(f"Selected exercise: {selected}")
-    print("=== END DEBUG ===\n")
-
+    if catalog is None:
+        catalog = get_catalog()
+    if equipment_mask is None:
+        equipment_mask = catalog.equipment_mask(preferences.get("equipment", []))
+
+    if trace is not None:
+        started = perf_counter()
+    used_exercise_ids = {ex.id for ex in used_exercises}
+    if pool is None:
+        final_candidates = catalog.candidates_for(pattern.id, equipment_mask, used_exercise_ids)
+    else:
+        final_candidates = [movement for movement in pool if movement.id not in used_exercise_ids]
+    if trace is not None:
+        trace.add_time("candidate_filtering", started)
+        started = perf_counter()
+
+    selected = rng.choice(final_candidates) if final_candidates else None
+
+    if trace is not None:
+        trace.add_time("selection", started)
+        trace.record_pattern(day_name, pattern, len(final_candidates), selected)
     return selected
 
-def decide_sets_and_reps(exercise, volume):
+def set_rep_options(exercise, volume):
+    """Every (sets, start_reps, end_reps) choice for an exercise at a volume level."""
     if not exercise or not hasattr(exercise, "type"):
-        return (2, 8, 10)  # fallback if exercise or type is missing
-
-    roll = random.randint(1, 2)
+        return [(2, 8, 10)]  # fallback if exercise or type is missing
 
     if volume == "low":
         if exercise.type == ExerciseType.COMPOUND:
-            return (2, 4, 6) if roll == 1 else (2, 6, 8)
+            return [(2, 4, 6), (2, 6, 8)]
         else:  # ISOLATION
-            return (2, 6, 8) if roll == 1 else (1, 8, 10)
+            return [(2, 6, 8), (1, 8, 10)]
 
     elif volume == "moderate":
         if exercise.type == ExerciseType.COMPOUND:
-            return (3, 6, 10) if roll == 1 else (3, 8, 12)
+            return [(3, 6, 10), (3, 8, 12)]
         else:
-            return (2, 8, 10) if roll == 1 else (3, 8, 12)
+            return [(2, 8, 10), (3, 8, 12)]
 
     elif volume == "high":
         if exercise.type == ExerciseType.COMPOUND:
-            return (4, 8, 12) if roll == 1 else (3, 10, 15)
+            return [(4, 8, 12), (3, 10, 15)]
         else:
-            return (3, 8, 12) if roll == 1 else (3, 10, 15)
-
-    return (2, 8, 10)  # final fallback
+            return [(3, 8, 12), (3, 10, 15)]
+
+    return [(2, 8, 10)]  # final fallback
+
+def decide_sets_and_reps(exercise, volume, rng=random):
+    options = set_rep_options(exercise, volume)
+    if len(options) == 1:
+        return options[0]
+    roll = rng.randint(1, 2)
+    return options[roll - 1]
+
+def day_patterns(workout_day_template, catalog):
+    return catalog.day_patterns(workout_day_template.id)
+
+def exercise_entry(exercise, sets, start_reps, end_reps):
+    if exercise is None:
+        return {
+            "exercise": None,
+            "exercise_name": "No Suitable Exercises",
+            "sets": 0,
+            "start_reps": 0,
+            "end_reps": 0,
+            "skip": True,
+        }
+    return {
+        "exercise": exercise,
+        "exercise_name": exercise.name,
+        "sets": sets,
+        "start_reps": start_reps,
+        "end_reps": end_reps,
+        "skip": False,
+    }
 
-def generate_day(preferences, workout_day_template):
-    patterns = workout_day_template.patterns.all()
+def generate_day(preferences, workout_day_template, catalog=None, equipment_mask=None, rng=random, trace=None, candidate_pools=None):
+    preferences = normalize_preferences(preferences)
+    if catalog is None:
+        catalog = get_catalog()
+    if equipment_mask is None:
+        equipment_mask = catalog.equipment_mask(preferences.get("equipment", []))
+    patterns = day_patterns(workout_day_template, catalog)
     used_exercises = set()
     day_plan = []
 
-    print(f"\n=== Generating day: {workout_day_template.name} ===")
-    print(f"Patterns for this day: {[p.name for p in patterns]}")
+    # Repeated templates in a split (e.g. Push on days 1 and 4) share their pools
+    pools = None
+    if candidate_pools is not None:
+        pool_key = (workout_day_template.id, equipment_mask)
+        if pool_key not in candidate_pools:
+            if trace is not None:
+                started = perf_counter()
+            candidate_pools[pool_key] = [catalog.candidates_for(p.id, equipment_mask) for p in patterns]
+            if trace is not None:
+                trace.add_time("candidate_filtering", started)
+        pools = candidate_pools[pool_key]
+
+    for index, pattern in enumerate(patterns):
+        exercise = attach_exercise(
+            preferences, pattern, used_exercises, catalog, equipment_mask, rng,
+            trace=trace, day_name=workout_day_template.name,
+            pool=pools[index] if pools is not None else None,
+        )
 
-    for pattern in patterns:
-        exercise = attach_exercise(preferences, pattern, used_exercises)
-        print(f"Exercise for pattern {pattern}: {exercise}")
-        
         if exercise:
             used_exercises.add(exercise)
-            sets, start_reps, end_reps = decide_sets_and_reps(exercise, preferences.get("volume", "moderate"))
-            day_plan.append({
-                "exercise": exercise,
-                "exercise_name": exercise.name,
-                "sets": sets,
-                "start_reps": start_reps,
-                "end_reps": end_reps,
-                "skip": False,
-            })
+            if trace is not None:
+                started = perf_counter()
+            sets, start_reps, end_reps = decide_sets_and_reps(exercise, preferences.get("volume", "moderate"), rng)
+            if trace is not None:
+                trace.add_time("set_rep_decision", started)
+            day_plan.append(exercise_entry(exercise, sets, start_reps, end_reps))
         else:
-            day_plan.append({
-                "exercise": None,
-                "exercise_name": "No Suitable Exercises",
-                "sets": 0,
-                "start_reps": 0,
-                "end_reps": 0,
-                "skip": True,
-            })
-
-    print(f"Day plan generated: {len(day_plan)} exercises")
+            day_plan.append(exercise_entry(None, 0, 0, 0))
+
     return day_plan
 
-def decide_split(days_per_week):
-    return WorkoutSplitTemplate.objects.filter(days_per_week=days_per_week).first()
+def decide_split(days_per_week, catalog=None):
+    if catalog is None:
+        catalog = get_catalog()
+    return catalog.split_for(days_per_week)
+
+def new_seed():
+    return random.SystemRandom().randrange(2 ** 31)
+
+def generate_plan(preferences, trace=None):
+    """
+    Build a plan dict from preferences. The same preferences and seed always
+    produce the same plan for a given catalog version.
+
+    mode "random" picks any suitable movement per pattern; mode "coverage"
+    optimizes weekly muscle coverage weighted by priority_muscles.
+
+    Pass a GenerationTrace to collect stage timings; otherwise one is only
+    created when the "training.generation" logger is enabled for DEBUG.
+    """
+    preferences = normalize_preferences(preferences)
+    seed = preferences.get("seed")
+    if seed is None:
+        seed = new_seed()
+    rng = random.Random(seed)
+    if trace is None:
+        trace = trace_if_enabled()
+
+    catalog = get_catalog()
+    if trace is not None:
+        trace.seed = seed
+        started = perf_counter()
+    workout_split = decide_split(preferences["days_per_week"], catalog)
+    if trace is not None:
+        trace.add_time("split_lookup", started)
 
-def generate_plan(preferences):
-    print(f"\n=== Generating plan ===")
-    print(f"Preferences: {preferences}")
-    
-    days_per_week = preferences["days_per_week"]
-    workout_split = decide_split(days_per_week)
     if not workout_split:
-        print(f"No workout split found for {days_per_week} days per week")
+        if trace is not None:
+            trace.emit()
         return None
 
-    print(f"Using workout split: {workout_split.name}")
-
     plan = {
         "name": workout_split.name,
         "days_per_week": workout_split.days_per_week,
+        "seed": seed,
         "days": []
     }
 
-    ordered_days = workout_split.workouts.order_by("splitdaythrough__day_index")
-    print(f"Ordered days: {[d.name for d in ordered_days]}")
-    
+    equipment_mask = catalog.equipment_mask(preferences.get("equipment", []))
+    if trace is not None:
+        trace.split = workout_split.name
+        trace.catalog_version = catalog.version
+    ordered_days = catalog.split_days[workout_split.id]
+    candidate_pools = {}
+
+    selector = None
+    if preferences.get("mode") == "coverage":
+        from training.utils.coverage_utils import CoverageSelector, generate_coverage_day
+        selector = CoverageSelector(
+            catalog, equipment_mask, preferences.get("volume", "moderate"),
+            preferences.get("priority_muscles", []), rng,
+        )
+
     for day_template in ordered_days:
-        day_plan = generate_day(preferences, day_template)
+        if selector is not None:
+            day_plan = generate_coverage_day(selector, day_template, trace)
+        else:
+            day_plan = generate_day(preferences, day_template, catalog, equipment_mask, rng, trace, candidate_pools)
         plan["days"].append({
             "day_name": day_template.name,
             "exercises": day_plan
         })
 
+    if trace is not None:
+        trace.emit()
     return plan
 
-def save_generated_plan(user, plan_dict):
-    """Save a generated plan to the database"""
-    plan = WorkoutPlan.objects.create(
-        user=user,
-        name=plan_dict["name"],
-        days_per_week=plan_dict["days_per_week"]
-    )
-
-    for index, day in enumerate(plan_dict["days"]):
-        workout_day = WorkoutDay.objects.create(
-            plan=plan,
-            day_name=day["day_name"],
-            order=index
-        )
-
-        for ex in day["exercises"]:
-            PlannedExercise.objects.create(
+def save_generated_plans(entries):
+    """
+    Save many generated plans, possibly for different users, in one transaction.
+    `entries` is an iterable of (user, plan_dict) pairs. Costs three INSERTs
+    regardless of how many plans, days or exercises are written.
+    """
+    entries = list(entries)
+    with transaction.atomic():
+        plans = WorkoutPlan.objects.bulk_create([
+            WorkoutPlan(user=user, name=plan_dict["name"], days_per_week=plan_dict["days_per_week"])
+            for user, plan_dict in entries
+        ])
+
+        workout_days = []
+        day_exercises = []
+        for plan, (_, plan_dict) in zip(plans, entries):
+            for index, day in enumerate(plan_dict["days"]):
+                workout_days.append(WorkoutDay(plan=plan, day_name=day["day_name"], order=index))
+                day_exercises.append(day["exercises"])
+        WorkoutDay.objects.bulk_create(workout_days)
+
+        PlannedExercise.objects.bulk_create([
+            PlannedExercise(
                 day=workout_day,
                 name=ex["exercise_name"],
                 sets=ex.get("sets", 0),
@@ -171,5 +250,12 @@ def save_generated_plan(user, plan_dict):
                 end_reps=ex.get("end_reps", 0),
                 skip=ex.get("skip", False)
             )
+            for workout_day, exercises in zip(workout_days, day_exercises)
+            for ex in exercises
+        ])
 
-    return plan
\ No newline at end of file
+    return plans
+
+def save_generated_plan(user, plan_dict):
+    """Save a generated plan to the database"""
+    return save_generated_plans([(user, plan_dict)])[0]
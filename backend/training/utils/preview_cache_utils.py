@@ -0,0 +1,122 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from training.serializers import PlanPreviewSerializer
+from training.utils.catalog_utils import get_catalog_version
+from training.utils.plan_generation_utils import generate_plan, normalize_preferences, new_seed
+
+PREVIEW_KEY_PREFIX = "training:plan_preview"
+
+_MISSING = object()
+
+def preview_cache_key(preferences, catalog_version):
+    """Canonical hash of everything that determines a generated plan."""
+    canonical = {
+        "days_per_week": preferences.get("days_per_week"),
+        "volume": preferences.get("volume"),
+        "equipment": sorted(set(preferences.get("equipment", []))),
+        "bodyweight_exercises": preferences.get("bodyweight_exercises"),
+        "seed": preferences.get("seed"),
+        "mode": preferences.get("mode", "random"),
+        "priority_muscles": sorted(set(preferences.get("priority_muscles", []))),
+        "catalog_version": catalog_version,
+    }
+    digest = hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+    return f"{PREVIEW_KEY_PREFIX}:{digest}"
+
+class PlanPreviewCache:
+    """
+    Bounded in-process LRU, optionally backed by a shared Django cache alias.
+    Entries are never deleted on catalog edits; the catalog version is part of
+    the key, so stale entries simply stop being looked up and age out.
+    """
+
+    def __init__(self, max_entries=256, backend=None, timeout=3600):
+        self.max_entries = max_entries
+        self.backend = backend
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _shared(self):
+        return caches[self.backend] if self.backend else None
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        shared = self._shared()
+        value = shared.get(key, _MISSING) if shared else _MISSING
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+                return _MISSING
+            self.hits += 1
+        self._store_local(key, value)
+        return value
+
+    def set(self, key, value):
+        self._store_local(key, value)
+        shared = self._shared()
+        if shared:
+            shared.set(key, value, self.timeout)
+
+    def _store_local(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+def _build_preview_cache():
+    config = getattr(settings, "PLAN_PREVIEW_CACHE", {})
+    return PlanPreviewCache(
+        max_entries=config.get("MAX_ENTRIES", 256),
+        backend=config.get("BACKEND"),
+        timeout=config.get("TIMEOUT", 3600),
+    )
+
+preview_cache = _build_preview_cache()
+
+def get_plan_preview(preferences):
+    """
+    Return (preview_data, cache_hit). A seed is drawn up front when the client
+    did not send one, so the result is still cacheable under the echoed seed.
+    """
+    preferences = dict(normalize_preferences(preferences))
+    if preferences.get("seed") is None:
+        preferences["seed"] = new_seed()
+
+    key = preview_cache_key(preferences, get_catalog_version())
+    data = preview_cache.get(key)
+    if data is not _MISSING:
+        return data, True
+
+    plan_dict = generate_plan(preferences)
+    # Round-trip through JSON to detach the payload from the serializer before caching
+    data = json.loads(json.dumps(PlanPreviewSerializer(plan_dict).data))
+    preview_cache.set(key, data)
+    return data, False
@@ -0,0 +1,135 @@
+from collections import defaultdict
+from datetime import timedelta
+from statistics import fmean
+from django.db import transaction
+from django.db.models import F
+from training.models import ExerciseLog, PlannedExercise, SetLog, WorkoutLog
+from training.utils.sync_utils import next_revisions
+
+WEIGHT_STEP = 2.5  # smallest plate jump; targets are rounded to it
+WEIGHT_INCREASE = 0.025
+DELOAD = 0.9
+HARD_RPE = 9.5  # at or above this a set was a grind, so hold or back off
+EASY_RPE = 7.0  # at or below this on every set, earn an extra set
+MAX_EXTRA_SETS = 1
+PROGRESSION_CHUNK_SIZE = 500
+TARGET_FIELDS = ["target_weight", "target_reps", "target_sets", "revision"]
+
+def round_weight(weight):
+    return round(weight / WEIGHT_STEP) * WEIGHT_STEP
+
+def progress_exercise(sets, planned_sets, start_reps, end_reps):
+    """
+    Next week's (weight, reps, sets) for one exercise by double progression:
+    add reps at the same weight until every working set reaches the top of
+    the range, then add weight and drop back to the bottom. `sets` holds last
+    week's (weight, reps, rpe); without any, the plan's defaults stand.
+    """
+    if not sets:
+        return None, start_reps, planned_sets
+
+    top_weight = max(weight for weight, _, _ in sets)
+    working = [(reps, rpe) for weight, reps, rpe in sets if weight == top_weight]
+    reps_done = min(reps for reps, _ in working)
+    rpes = [rpe for _, rpe in working if rpe is not None]
+    effort = fmean(rpes) if rpes else None
+    grinding = effort is not None and effort >= HARD_RPE
+
+    if reps_done < start_reps and (grinding or len(working) < planned_sets):
+        return round_weight(top_weight * DELOAD), start_reps, planned_sets
+    if len(working) >= planned_sets and reps_done >= end_reps and not grinding:
+        step = max(WEIGHT_STEP, round_weight(top_weight * WEIGHT_INCREASE))
+        extra = MAX_EXTRA_SETS if effort is not None and effort <= EASY_RPE else 0
+        return top_weight + step, start_reps, planned_sets + extra
+    if grinding:
+        return top_weight, max(start_reps, min(reps_done, end_reps)), planned_sets
+    return top_weight, min(end_reps, max(start_reps, reps_done + 1)), planned_sets
+
+def previous_week_sets(user_ids, start_date):
+    """(user_id, exercise name) -> [(weight, reps, rpe)] logged in the week before start_date."""
+    rows = SetLog.objects.filter(
+        exercise__workout_day_log__workout_log__user_id__in=user_ids,
+        exercise__workout_day_log__workout_log__start_date=start_date - timedelta(weeks=1),
+    ).values_list("exercise__workout_day_log__workout_log__user_id", "exercise__name", "weight", "reps", "rpe")
+    history = defaultdict(list)
+    for user_id, name, weight, reps, rpe in rows:
+        history[(user_id, name)].append((weight, reps, rpe))
+    return history
+
+def apply_targets(exercise_log, sets, planned_sets, start_reps, end_reps):
+    weight, reps, target_sets = progress_exercise(sets, planned_sets, start_reps, end_reps)
+    exercise_log.target_weight = weight
+    exercise_log.target_reps = reps
+    exercise_log.target_sets = target_sets
+
+def progress_logs(logs, start_date):
+    """
+    Recompute targets for the not-yet-started exercises of week logs given as
+    (log_id, user_id) pairs, with a fixed number of queries for the whole chunk:
+    previous week's sets, this week's untouched exercise logs, their planned
+    ranges, the users' sync revisions and one bulk UPDATE.
+    Returns the number of exercise logs updated.
+    """
+    log_users = dict(logs)
+    if not log_users:
+        return 0
+    user_ids = set(log_users.values())
+    history = previous_week_sets(user_ids, start_date)
+
+    exercise_logs = list(
+        ExerciseLog.objects.filter(workout_day_log__workout_log_id__in=log_users, sets__isnull=True)
+        .annotate(log_id=F("workout_day_log__workout_log_id"), day_id=F("workout_day_log__workout_day_id"))
+    )
+    ranges = {
+        (day_id, name): (sets, start_reps, end_reps)
+        for day_id, name, sets, start_reps, end_reps in PlannedExercise.objects.filter(
+            day_id__in={exercise_log.day_id for exercise_log in exercise_logs}
+        ).values_list("day_id", "name", "sets", "start_reps", "end_reps")
+    }
+
+    changed = []
+    for exercise_log in exercise_logs:
+        planned = ranges.get((exercise_log.day_id, exercise_log.name))
+        if planned is None:
+            continue
+        before = (exercise_log.target_weight, exercise_log.target_reps, exercise_log.target_sets)
+        apply_targets(exercise_log, history.get((log_users[exercise_log.log_id], exercise_log.name)), *planned)
+        if (exercise_log.target_weight, exercise_log.target_reps, exercise_log.target_sets) != before:
+            changed.append(exercise_log)
+    if not changed:
+        return 0
+
+    with transaction.atomic():
+        # One revision bump per user so delta sync picks up the new targets
+        revisions = next_revisions({log_users[exercise_log.log_id] for exercise_log in changed})
+        for exercise_log in changed:
+            exercise_log.revision = revisions[log_users[exercise_log.log_id]]
+        ExerciseLog.objects.bulk_update(changed, TARGET_FIELDS, batch_size=PROGRESSION_CHUNK_SIZE)
+    return len(changed)
+
+def progress_week(start_date, chunk_size=PROGRESSION_CHUNK_SIZE):
+    """
+    Nightly batch: progress every user's log for the week starting
+    `start_date`. Logs are walked in id order one keyset chunk at a time,
+    so memory stays flat and no cursor is held open between chunks.
+    Returns (logs, exercise_logs_updated).
+    """
+    logs = updated = 0
+    last_id = 0
+    while True:
+        chunk = list(
+            WorkoutLog.objects.filter(start_date=start_date, id__gt=last_id)
+            .order_by("id").values_list("id", "user_id")[:chunk_size]
+        )
+        if not chunk:
+            return logs, updated
+        updated += progress_logs(chunk, start_date)
+        logs += len(chunk)
+        last_id = chunk[-1][0]
+
+def progress_user_week(user, start_date):
+    """Online path: re-progress one user's week log, e.g. after editing last week."""
+    log_id = WorkoutLog.objects.filter(user=user, start_date=start_date).values_list("id", flat=True).first()
+    if log_id is None:
+        return 0
+    return progress_logs([(log_id, user.pk)], start_date)
@@ -0,0 +1,109 @@
+from collections import defaultdict
+from rest_framework import serializers
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog, WorkoutDay, WorkoutPlan, PlannedExercise
+
+# Read-only fast paths for the hottest GETs. Rows come from values_list()
+# projections and are assembled into exactly what WorkoutLogSerializer /
+# WorkoutPlanSerializer would return (same keys, order and value formats),
+# without instantiating models or serializer fields per row.
+# test_projections renders both with the same renderer and compares the bytes.
+
+date_repr = serializers.DateField().to_representation
+datetime_repr = serializers.DateTimeField().to_representation
+
+LOG_COLUMNS = ("id", "start_date", "is_complete", "created_at", "revision", "user_id")
+DAY_COLUMNS = ("id", "workout_day_id", "order", "is_complete", "revision", "workout_log_id")
+EXERCISE_COLUMNS = ("id", "name", "target_sets", "target_reps", "target_weight", "revision", "workout_day_log_id")
+SET_COLUMNS = ("id", "set_number", "weight", "reps", "rpe", "notes", "source", "client_key", "revision", "exercise_id")
+
+PLAN_COLUMNS = ("id", "name", "days_per_week", "created_at")
+PLAN_DAY_COLUMNS = ("id", "plan_id", "day_name", "order")
+PLANNED_EXERCISE_COLUMNS = ("day_id", "name", "sets", "start_reps", "end_reps", "skip")
+
+def week_log_rows(log_id):
+    """The three child projections of a week log, in serializer (id) order."""
+    return (
+        WorkoutDayLog.objects.filter(workout_log_id=log_id).order_by("id").values_list(*DAY_COLUMNS),
+        ExerciseLog.objects.filter(workout_day_log__workout_log_id=log_id).order_by("id").values_list(*EXERCISE_COLUMNS),
+        SetLog.objects.filter(exercise__workout_day_log__workout_log_id=log_id).order_by("id").values_list(*SET_COLUMNS),
+    )
+
+def assemble_week_log(log_row, day_rows, exercise_rows, set_rows):
+    """
+    WorkoutLogSerializer(log).data from projected rows, plus the tree's highest
+    revision (what tree_revision returns for the same log).
+    """
+    revision = log_row[4]
+    sets = defaultdict(list)
+    for id, set_number, weight, reps, rpe, notes, source, client_key, set_revision, exercise_id in set_rows:
+        sets[exercise_id].append({
+            "id": id, "set_number": set_number, "weight": weight, "reps": reps, "rpe": rpe, "notes": notes,
+            "source": source, "client_key": client_key, "revision": set_revision, "exercise": exercise_id,
+        })
+        revision = max(revision, set_revision)
+
+    exercises = defaultdict(list)
+    for id, name, target_sets, target_reps, target_weight, exercise_revision, day_log_id in exercise_rows:
+        exercises[day_log_id].append({
+            "id": id, "sets": sets.get(id, []), "name": name, "target_sets": target_sets, "target_reps": target_reps,
+            "target_weight": target_weight, "revision": exercise_revision, "workout_day_log": day_log_id,
+        })
+        revision = max(revision, exercise_revision)
+
+    days = []
+    for id, workout_day_id, order, is_complete, day_revision, log_id in day_rows:
+        days.append({
+            # StringRelatedField output; WorkoutDay's str() only needs the pk
+            "id": id, "exercises": exercises.get(id, []), "workout_day": str(WorkoutDay(pk=workout_day_id)),
+            "order": order, "is_complete": is_complete, "revision": day_revision, "workout_log": log_id,
+        })
+        revision = max(revision, day_revision)
+
+    id, start_date, is_complete, created_at, log_revision, user_id = log_row
+    document = {
+        "id": id, "days": days, "start_date": date_repr(start_date), "is_complete": is_complete,
+        "created_at": datetime_repr(created_at), "revision": log_revision, "user": user_id,
+    }
+    return document, revision
+
+def project_week_log(user, start_date):
+    """(document, sync cursor) for an existing week log in four queries, or None."""
+    log_row = WorkoutLog.objects.filter(user=user, start_date=start_date).values_list(*LOG_COLUMNS).first()
+    if log_row is None:
+        return None
+    return assemble_week_log(log_row, *(list(rows) for rows in week_log_rows(log_row[0])))
+
+async def aproject_week_log(user, start_date):
+    log_row = await WorkoutLog.objects.filter(user=user, start_date=start_date).values_list(*LOG_COLUMNS).afirst()
+    if log_row is None:
+        return None
+    return assemble_week_log(log_row, *[[row async for row in rows] for rows in week_log_rows(log_row[0])])
+
+def saved_plans_rows(user):
+    return (
+        WorkoutPlan.objects.filter(user=user).order_by("id").values_list(*PLAN_COLUMNS),
+        WorkoutDay.objects.filter(plan__user=user).order_by("id").values_list(*PLAN_DAY_COLUMNS),
+        PlannedExercise.objects.filter(day__plan__user=user).order_by("id").values_list(*PLANNED_EXERCISE_COLUMNS),
+    )
+
+def assemble_saved_plans(plan_rows, day_rows, exercise_rows):
+    """WorkoutPlanSerializer(plans, many=True).data from projected rows."""
+    exercises = defaultdict(list)
+    for day_id, name, sets, start_reps, end_reps, skip in exercise_rows:
+        exercises[day_id].append({"name": name, "sets": sets, "start_reps": start_reps, "end_reps": end_reps, "skip": skip})
+
+    days = defaultdict(list)
+    for id, plan_id, day_name, order in day_rows:
+        days[plan_id].append({"day_name": day_name, "order": order, "exercises": exercises.get(id, [])})
+
+    return [
+        {"id": id, "name": name, "days_per_week": days_per_week, "created_at": datetime_repr(created_at), "days": days.get(id, [])}
+        for id, name, days_per_week, created_at in plan_rows
+    ]
+
+def project_saved_plans(user):
+    """Every saved plan of the user with days and exercises, in three queries."""
+    return assemble_saved_plans(*(list(rows) for rows in saved_plans_rows(user)))
+
+async def aproject_saved_plans(user):
+    return assemble_saved_plans(*[[row async for row in rows] for rows in saved_plans_rows(user)])
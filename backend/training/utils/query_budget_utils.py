@@ -0,0 +1,79 @@
+import asyncio
+import functools
+import logging
+from contextvars import ContextVar
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+# The counter of the request being handled. A context variable rather than a
+# wrapper on one connection, so queries are charged to the request that ran
+# them whichever thread's connection they went through.
+current_counter = ContextVar("query_budget_counter", default=None)
+
+def count_query(execute, sql, params, many, context):
+    counter = current_counter.get()
+    if counter is not None:
+        counter.count += 1
+    return execute(sql, params, many, context)
+
+def install_query_counter(connection):
+    """Add count_query to a connection's execute wrappers (training/signals.py, on connect)."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+def query_budget(budget):
+    """
+    Cap the number of SQL queries a view may issue, authentication included.
+
+    Overruns are logged, or raised when settings.QUERY_BUDGET_STRICT is set
+    (the default under `manage.py test`). With DEBUG on, the count and budget
+    are sent back as X-Query-Count / X-Query-Budget headers. Works on async
+    views too: queries their ORM calls run in worker threads are counted.
+    """
+    def decorator(view):
+        # DRF's @api_view hands back a generic `view` function; its class carries the endpoint's name
+        endpoint = getattr(view, "cls", view).__name__
+
+        def check(counter, response):
+            if counter.count > budget:
+                message = f"{endpoint} ran {counter.count} queries (budget {budget})"
+                if getattr(settings, "QUERY_BUDGET_STRICT", False):
+                    raise QueryBudgetExceeded(message)
+                logger.warning(message)
+
+            if settings.DEBUG:
+                response["X-Query-Count"] = str(counter.count)
+                response["X-Query-Budget"] = str(budget)
+            return response
+
+        if asyncio.iscoroutinefunction(view):
+            @functools.wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                counter = QueryCounter()
+                token = current_counter.set(counter)
+                try:
+                    response = await view(request, *args, **kwargs)
+                finally:
+                    current_counter.reset(token)
+                return check(counter, response)
+        else:
+            @functools.wraps(view)
+            def wrapper(request, *args, **kwargs):
+                counter = QueryCounter()
+                token = current_counter.set(counter)
+                try:
+                    response = view(request, *args, **kwargs)
+                finally:
+                    current_counter.reset(token)
+                return check(counter, response)
+        wrapper.query_budget = budget
+        return wrapper
+    return decorator
@@ -0,0 +1,141 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Max
+from training.models import ExerciseLog, ExerciseRecord, SetLog
+
+RECORD_FIELDS = ["rep_maxes", "best_weight", "best_weight_reps", "e1rm_epley", "e1rm_brzycki"]
+REBUILD_CHUNK_SIZE = 2000
+BRZYCKI_MAX_REPS = 36  # the formula diverges at 37 reps
+
+def epley(weight, reps):
+    return weight if reps == 1 else weight * (1 + reps / 30)
+
+def brzycki(weight, reps):
+    return weight * 36 / (37 - reps)
+
+def record_row(user_id, name, rep_maxes):
+    """Unsaved ExerciseRecord with every column derived from rep_maxes."""
+    record = ExerciseRecord(user_id=user_id, exercise_name=name, rep_maxes=rep_maxes)
+    for reps_key, weight in rep_maxes.items():
+        reps = int(reps_key)
+        if (weight, reps) > (record.best_weight, record.best_weight_reps):
+            record.best_weight, record.best_weight_reps = weight, reps
+        record.e1rm_epley = max(record.e1rm_epley, round(epley(weight, reps), 2))
+        if reps <= BRZYCKI_MAX_REPS:
+            record.e1rm_brzycki = max(record.e1rm_brzycki, round(brzycki(weight, reps), 2))
+    return record
+
+def merge_set(rep_maxes, reps, weight):
+    if reps > 0 and weight > rep_maxes.get(str(reps), float("-inf")):
+        rep_maxes[str(reps)] = weight
+
+def save_records(rows):
+    ExerciseRecord.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["user", "exercise_name"],
+        update_fields=RECORD_FIELDS,
+    )
+
+def update_records(user, before=(), after=()):
+    """
+    Fold set writes into the user's records; sets are (exercise_id, reps, weight)
+    and `before` holds the replaced or deleted values. Call after the write.
+    New sets only ever raise a rep max, so they merge in place; only losing a
+    set that held a rep max makes its exercise fall back to a grouped query.
+    Returns the updated records by exercise name.
+    """
+    before, after = list(before), list(after)
+    names = dict(
+        ExerciseLog.objects.filter(id__in={row[0] for row in before + after}).values_list("id", "name")
+    )
+    touched = {names[row[0]] for row in before + after if row[0] in names}
+    if not touched:
+        return {}
+
+    current = {record.exercise_name: record for record in ExerciseRecord.objects.filter(user=user, exercise_name__in=touched)}
+    rep_maxes = {name: dict(current[name].rep_maxes) if name in current else {} for name in touched}
+
+    # A removed rep max is only lost if this batch doesn't match or beat it (e.g. retries)
+    replacements = defaultdict(float)
+    for exercise_id, reps, weight in after:
+        if exercise_id in names:
+            key = (names[exercise_id], reps)
+            replacements[key] = max(replacements[key], weight)
+    stale = {
+        names[exercise_id]
+        for exercise_id, reps, weight in before
+        if exercise_id in names
+        and weight >= rep_maxes[names[exercise_id]].get(str(reps), float("inf"))
+        and replacements[(names[exercise_id], reps)] < weight
+    }
+    if stale:
+        history = SetLog.objects.filter(
+            exercise__workout_day_log__workout_log__user=user, exercise__name__in=stale, reps__gt=0
+        ).values_list("exercise__name", "reps").annotate(best=Max("weight")).order_by()
+        for name in stale:
+            rep_maxes[name] = {}
+        for name, reps, best in history:
+            rep_maxes[name][str(reps)] = best
+
+    for exercise_id, reps, weight in after:
+        if exercise_id in names:
+            merge_set(rep_maxes[names[exercise_id]], reps, weight)
+
+    rows = [record_row(user.pk, name, maxes) for name, maxes in rep_maxes.items()]
+    save_records(rows)
+    return {row.exercise_name: row for row in rows}
+
+def get_records(user, names=None):
+    """Records by exercise name: one indexed lookup, no set history scan."""
+    records = ExerciseRecord.objects.filter(user=user).order_by("exercise_name")
+    if names:
+        records = records.filter(exercise_name__in=names)
+    return list(records)
+
+def rebuild_exercise_records(user_ids=None, chunk_size=REBUILD_CHUNK_SIZE):
+    """
+    Recompute ExerciseRecord from SetLog history. Rep maxes come from one
+    grouped query streamed in chunks, ordered by user and exercise so each
+    record is written as soon as its group ends. Returns the number of records.
+
+    Bumps the sync revision of every user whose records were rewritten, which
+    is what the records endpoint's ETag is derived from.
+    """
+    from training.utils.sync_utils import next_revisions
+
+    sets = SetLog.objects.filter(exercise__workout_day_log__isnull=False, reps__gt=0)
+    records = ExerciseRecord.objects.all()
+    if user_ids is not None:
+        sets = sets.filter(exercise__workout_day_log__workout_log__user_id__in=user_ids)
+        records = records.filter(user_id__in=user_ids)
+
+    grouped = sets.values_list(
+        "exercise__workout_day_log__workout_log__user_id", "exercise__name", "reps"
+    ).annotate(best=Max("weight")).order_by(
+        "exercise__workout_day_log__workout_log__user_id", "exercise__name"
+    )
+
+    count = 0
+    pending = []
+    key, rep_maxes = None, {}
+    with transaction.atomic():
+        affected = set(records.values_list("user_id", flat=True).distinct())
+        records.delete()
+        for user_id, name, reps, best in grouped.iterator(chunk_size=chunk_size):
+            if (user_id, name) != key:
+                affected.add(user_id)
+                if key is not None:
+                    pending.append(record_row(*key, rep_maxes))
+                key, rep_maxes = (user_id, name), {}
+            rep_maxes[str(reps)] = best
+            if len(pending) >= chunk_size:
+                save_records(pending)
+                count += len(pending)
+                pending = []
+        if key is not None:
+            pending.append(record_row(*key, rep_maxes))
+        save_records(pending)
+        if affected:
+            next_revisions(affected)
+    return count + len(pending)
@@ -0,0 +1,103 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog, SyncState, SyncTombstone
+from training.utils.volume_utils import record_set_changes
+from training.utils.records_utils import update_records
+
+LOG_FIELDS = ("id", "start_date", "is_complete", "created_at", "revision")
+DAY_FIELDS = ("id", "workout_log_id", "workout_day_id", "order", "is_complete", "revision")
+EXERCISE_FIELDS = ("id", "workout_day_log_id", "name", "target_sets", "target_reps", "target_weight", "revision")
+SET_FIELDS = ("id", "exercise_id", "set_number", "weight", "reps", "rpe", "notes", "source", "client_key", "revision")
+
+def next_revision(user):
+    """
+    Take the user's next revision. Call inside the writing transaction: the
+    UPDATE holds the SyncState row lock until commit, so a user's writes
+    commit in revision order and a cursor never skips a late commit.
+    """
+    if not SyncState.objects.filter(user=user).update(revision=F("revision") + 1):
+        try:
+            with transaction.atomic():
+                SyncState.objects.create(user=user, revision=1)
+            return 1
+        except IntegrityError:
+            SyncState.objects.filter(user=user).update(revision=F("revision") + 1)
+    return SyncState.objects.filter(user=user).values_list("revision", flat=True).get()
+
+def next_revisions(user_ids):
+    """
+    next_revision for many users at once, for batch jobs: one UPDATE, one
+    INSERT for users without a SyncState yet, one read. Returns {user_id: revision}.
+    """
+    user_ids = set(user_ids)
+    SyncState.objects.filter(user_id__in=user_ids).update(revision=F("revision") + 1)
+    revisions = dict(SyncState.objects.filter(user_id__in=user_ids).values_list("user_id", "revision"))
+    missing = user_ids - revisions.keys()
+    if missing:
+        SyncState.objects.bulk_create([SyncState(user_id=user_id, revision=1) for user_id in missing])
+        revisions.update(dict.fromkeys(missing, 1))
+    return revisions
+
+def current_revision(user):
+    return SyncState.objects.filter(user=user).values_list("revision", flat=True).first() or 0
+
+def pull_changes(user, cursor):
+    """Rows written or deleted after `cursor`, as flat lists, plus the new cursor."""
+    head = current_revision(user)
+    window = {"revision__gt": cursor, "revision__lte": head}
+    return {
+        "cursor": head,
+        "logs": list(WorkoutLog.objects.filter(user=user, **window).values(*LOG_FIELDS)),
+        "days": list(WorkoutDayLog.objects.filter(workout_log__user=user, **window).values(*DAY_FIELDS)),
+        "exercises": list(
+            ExerciseLog.objects.filter(workout_day_log__workout_log__user=user, **window).values(*EXERCISE_FIELDS)
+        ),
+        "sets": list(
+            SetLog.objects.filter(exercise__workout_day_log__workout_log__user=user, **window).values(*SET_FIELDS)
+        ),
+        "deleted": list(SyncTombstone.objects.filter(user=user, **window).values("model", "object_id")),
+    }
+
+def delete_sets(user, keys, revision):
+    """
+    Delete sets by (exercise, client_key), take them out of the weekly muscle
+    volume and personal records, and leave tombstones for other devices.
+    """
+    keys = {(key["exercise"], key["client_key"]) for key in keys}
+    if not keys:
+        return 0
+    candidates = SetLog.objects.filter(
+        exercise__workout_day_log__workout_log__user=user,
+        exercise_id__in={exercise_id for exercise_id, _ in keys},
+        client_key__in={client_key for _, client_key in keys},
+    ).values_list("id", "exercise_id", "client_key", "reps", "weight")
+    deleted = [row for row in candidates if (row[1], row[2]) in keys]
+    ids = [row[0] for row in deleted]
+    SetLog.objects.filter(id__in=ids).delete()
+    removed = [(exercise_id, reps, weight) for _, exercise_id, _, reps, weight in deleted]
+    record_set_changes(user, before=removed)
+    update_records(user, before=removed)
+    SyncTombstone.objects.bulk_create([
+        SyncTombstone(user=user, model="set", object_id=set_id, revision=revision) for set_id in ids
+    ])
+    return len(ids)
+
+def apply_push(user, changes):
+    """Apply a client's offline changes under a single new revision."""
+    # Imported here: logging_utils stamps its own writes with next_revision
+    from training.utils.logging_utils import upsert_set_logs
+
+    with transaction.atomic():
+        revision = next_revision(user)
+        if changes.get("sets"):
+            upsert_set_logs(user, changes["sets"], revision)
+        delete_sets(user, changes.get("deleted_sets", []), revision)
+        if changes.get("completed_days"):
+            WorkoutDayLog.objects.filter(
+                id__in=changes["completed_days"], workout_log__user=user
+            ).update(is_complete=True, revision=revision)
+        if changes.get("completed_weeks"):
+            WorkoutLog.objects.filter(
+                id__in=changes["completed_weeks"], user=user
+            ).update(is_complete=True, revision=revision)
+    return revision
@@ -0,0 +1,53 @@
+import logging
+from time import perf_counter
+
+logger = logging.getLogger("training.generation")
+
+STAGES = ("split_lookup", "candidate_filtering", "selection", "set_rep_decision")
+
+class GenerationTrace:
+    """
+    Per-plan timings and candidate counts. Generator code only touches a trace
+    behind an `if trace is not None` check, so disabled tracing costs nothing.
+    """
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.timings = dict.fromkeys(STAGES, 0.0)
+        self.patterns = []
+        self.split = None
+        self.seed = None
+        self.catalog_version = None
+
+    def add_time(self, stage, started):
+        self.timings[stage] += perf_counter() - started
+
+    def record_pattern(self, day_name, pattern, candidate_count, selected):
+        self.patterns.append({
+            "day": day_name,
+            "pattern": pattern.name,
+            "candidates": candidate_count,
+            "selected": selected.name if selected else None,
+        })
+
+    def as_dict(self):
+        timings_ms = {stage: round(seconds * 1000, 3) for stage, seconds in self.timings.items()}
+        timings_ms["total"] = round((perf_counter() - self.started) * 1000, 3)
+        return {
+            "split": self.split,
+            "seed": self.seed,
+            "catalog_version": self.catalog_version,
+            "timings_ms": timings_ms,
+            "patterns": self.patterns,
+        }
+
+    def emit(self):
+        record = self.as_dict()
+        logger.debug("plan generated", extra={"generation_trace": record})
+        return record
+
+def trace_if_enabled():
+    """Start a trace only when the generation logger would actually record it."""
+    if logger.isEnabledFor(logging.DEBUG):
+        return GenerationTrace()
+    return None
@@ -0,0 +1,161 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from training.models import ExerciseLog, MuscleVolume, SetLog
+from training.utils.catalog_utils import get_catalog
+from training.utils.coverage_utils import PRIMARY_WEIGHT, SECONDARY_WEIGHT
+
+VOLUME_FIELDS = ["sets", "reps", "tonnage"]
+REBUILD_CHUNK_SIZE = 2000
+
+def build_muscle_weights_by_name(catalog):
+    """Movement name -> {muscle_id: weight}; ExerciseLog only keeps the name."""
+    weights = {}
+    for movement in catalog.movements.values():
+        if movement.name in weights:
+            continue
+        muscles = dict.fromkeys(catalog.pattern_secondary_muscles.get(movement.pattern_id, ()), SECONDARY_WEIGHT)
+        muscles.update(dict.fromkeys(catalog.pattern_primary_muscles.get(movement.pattern_id, ()), PRIMARY_WEIGHT))
+        weights[movement.name] = muscles
+    return weights
+
+def add_volume(totals, week_start, muscle_weights, sets, reps, tonnage):
+    for muscle_id, weight in muscle_weights.items():
+        row = totals[(week_start, muscle_id)]
+        row[0] += weight * sets
+        row[1] += weight * reps
+        row[2] += weight * tonnage
+
+def volume_delta(before, after):
+    """
+    Per (week_start, muscle) change in [sets, reps, tonnage] when the sets in
+    `before` are replaced by those in `after`; both are (exercise_id, reps, weight).
+    """
+    before, after = list(before), list(after)
+    exercise_ids = {row[0] for row in before} | {row[0] for row in after}
+    context = {
+        exercise_id: (name, week_start)
+        for exercise_id, name, week_start in ExerciseLog.objects.filter(id__in=exercise_ids).values_list(
+            "id", "name", "workout_day_log__workout_log__start_date"
+        )
+    }
+    weights_by_name = get_catalog().derived("muscle_weights_by_name", build_muscle_weights_by_name)
+
+    totals = defaultdict(lambda: [0.0, 0.0, 0.0])
+    for sign, rows in ((-1, before), (1, after)):
+        for exercise_id, reps, weight in rows:
+            name, week_start = context.get(exercise_id, (None, None))
+            muscle_weights = weights_by_name.get(name)
+            if week_start is None or not muscle_weights:
+                continue
+            add_volume(totals, week_start, muscle_weights, sign, sign * reps, sign * reps * weight)
+    return {key: values for key, values in totals.items() if any(values)}
+
+def apply_volume_delta(user, delta):
+    """
+    Add a volume_delta to the user's MuscleVolume rows with one read and one
+    upsert. Call inside the writing transaction after next_revision(user): the
+    SyncState row lock serializes a user's writers, so read-modify-write is safe.
+    """
+    if not delta:
+        return
+    current = {
+        (row.week_start, row.muscle_id): row
+        for row in MuscleVolume.objects.filter(
+            user=user,
+            week_start__in={week_start for week_start, _ in delta},
+            muscle_id__in={muscle_id for _, muscle_id in delta},
+        )
+    }
+    rows = []
+    for (week_start, muscle_id), (sets, reps, tonnage) in delta.items():
+        old = current.get((week_start, muscle_id))
+        rows.append(MuscleVolume(
+            user=user,
+            week_start=week_start,
+            muscle_id=muscle_id,
+            # Rounding keeps repeated +/- of half-weight credits from drifting
+            sets=round((old.sets if old else 0) + sets, 6),
+            reps=round((old.reps if old else 0) + reps, 6),
+            tonnage=round((old.tonnage if old else 0) + tonnage, 6),
+        ))
+    MuscleVolume.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["user", "week_start", "muscle"],
+        update_fields=VOLUME_FIELDS,
+    )
+
+def record_set_changes(user, before=(), after=()):
+    apply_volume_delta(user, volume_delta(before, after))
+
+def rebuild_muscle_volume(user_ids=None, chunk_size=REBUILD_CHUNK_SIZE):
+    """
+    Recompute MuscleVolume from SetLog history, for every user or only
+    `user_ids`. Per-exercise totals come from one grouped query streamed in
+    chunks, ordered by user and week so each week's rows are written as soon
+    as its group ends. Returns the number of rows written.
+
+    Bumps the sync revision of every user whose rows were rewritten, which
+    is what the volume endpoint's ETag is derived from.
+    """
+    from training.utils.sync_utils import next_revisions
+
+    sets = SetLog.objects.filter(exercise__workout_day_log__isnull=False)
+    volume = MuscleVolume.objects.all()
+    if user_ids is not None:
+        sets = sets.filter(exercise__workout_day_log__workout_log__user_id__in=user_ids)
+        volume = volume.filter(user_id__in=user_ids)
+
+    grouped = sets.values(
+        owner_id=F("exercise__workout_day_log__workout_log__user_id"),
+        week=F("exercise__workout_day_log__workout_log__start_date"),
+        exercise_name=F("exercise__name"),
+    ).annotate(
+        set_count=Count("id"), rep_total=Sum("reps"), tonnage_total=Sum(F("reps") * F("weight"))
+    ).order_by("owner_id", "week")
+
+    weights_by_name = get_catalog().derived("muscle_weights_by_name", build_muscle_weights_by_name)
+
+    def week_rows(owner_id, totals):
+        return [
+            MuscleVolume(
+                user_id=owner_id, week_start=week_start, muscle_id=muscle_id,
+                sets=round(sets, 6), reps=round(reps, 6), tonnage=round(tonnage, 6),
+            )
+            for (week_start, muscle_id), (sets, reps, tonnage) in totals.items()
+        ]
+
+    count = 0
+    pending = []
+    key, totals = None, defaultdict(lambda: [0.0, 0.0, 0.0])
+    with transaction.atomic():
+        affected = set(volume.values_list("user_id", flat=True).distinct())
+        volume.delete()
+        for row in grouped.iterator(chunk_size=chunk_size):
+            if (row["owner_id"], row["week"]) != key:
+                affected.add(row["owner_id"])
+                if key is not None:
+                    pending.extend(week_rows(key[0], totals))
+                key, totals = (row["owner_id"], row["week"]), defaultdict(lambda: [0.0, 0.0, 0.0])
+            muscle_weights = weights_by_name.get(row["exercise_name"])
+            if muscle_weights:
+                add_volume(totals, row["week"], muscle_weights, row["set_count"], row["rep_total"], row["tonnage_total"])
+            if len(pending) >= chunk_size:
+                MuscleVolume.objects.bulk_create(pending)
+                count += len(pending)
+                pending = []
+        if key is not None:
+            pending.extend(week_rows(key[0], totals))
+        MuscleVolume.objects.bulk_create(pending)
+        if affected:
+            next_revisions(affected)
+    return count + len(pending)
+
+def weekly_volume(user, since):
+    """The user's MuscleVolume rows for weeks starting on or after `since`, newest first."""
+    return list(
+        MuscleVolume.objects.filter(user=user, week_start__gte=since)
+        .order_by("-week_start", "muscle_id")
+        .values("week_start", "muscle_id", "sets", "reps", "tonnage", muscle_name=F("muscle__name"))
+    )
@@ -0,0 +1,38 @@
+from datetime import timedelta
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from training.serializers.analytics_serializers import ExerciseRecordSerializer
+from training.utils.etag_utils import conditional, muscle_volume_etag, records_etag
+from training.utils.logging_utils import current_week_start
+from training.utils.query_budget_utils import query_budget
+from training.utils.records_utils import get_records
+from training.utils.volume_utils import weekly_volume
+
+MAX_VOLUME_WEEKS = 52
+
+def volume_weeks(request):
+    try:
+        weeks = int(request.query_params.get("weeks", 4))
+    except ValueError:
+        weeks = 4
+    return min(max(weeks, 1), MAX_VOLUME_WEEKS)
+
+@query_budget(3)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@conditional(muscle_volume_etag)
+def get_muscle_volume(request):
+    """Sets, reps and tonnage per muscle for the last ?weeks= weeks (default 4)."""
+    weeks = volume_weeks(request)
+    since = current_week_start() - timedelta(weeks=weeks - 1)
+    return Response({"weeks": weeks, "volume": weekly_volume(request.user, since)})
+
+@query_budget(3)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@conditional(records_etag)
+def get_exercise_records(request):
+    """Personal records, optionally limited to ?exercise=<name> (repeatable)."""
+    records = get_records(request.user, request.query_params.getlist("exercise"))
+    return Response(ExerciseRecordSerializer(records, many=True).data)
@@ -0,0 +1,66 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from training.models import Muscle, Equipment, UserPreferences
+from training.serializers import MuscleSerializer, EquipmentSerializer, UserPreferencesSerializer
+from training.serializers.logging_serializers import WorkoutLogSerializer
+from training.utils.async_utils import async_read_view, json_response, stateless_authenticator
+from training.utils.catalog_utils import get_catalog_body
+from training.utils.etag_utils import (
+    acatalog_etag, apreferences_etag, asaved_plans_etag, aweek_log_etag, aweek_log_headers, week_log_etag,
+)
+from training.utils.logging_utils import create_week_log, current_week_start, tree_revision
+from training.utils.projection_utils import aproject_saved_plans, aproject_week_log
+from training.utils.query_budget_utils import query_budget
+
+# Async twins of the hot read endpoints, selected in urls.py by settings.ASYNC_READ_VIEWS.
+# Responses match the sync views byte for byte; both render with FastJSONRenderer.
+
+@query_budget(19)
+@async_read_view(aweek_log_etag, not_modified_headers=aweek_log_headers)
+async def get_week_log(request):
+    start_of_week = current_week_start()
+    projected = await aproject_week_log(request.user, start_of_week)
+    if projected is not None:
+        document, cursor = projected
+        response = json_response(document)
+        response["X-Sync-Cursor"] = str(cursor)
+        return response
+
+    # Rare once weeks are pre-materialized; the write path stays sync and race-safe
+    log, created = await sync_to_async(create_week_log)(request.user, start_of_week)
+    if log is None:
+        return json_response({"error": "No saved plan found."}, status=404)
+
+    response = json_response(WorkoutLogSerializer(log).data)
+    response["X-Sync-Cursor"] = str(tree_revision(log))
+    if created:
+        response["ETag"] = week_log_etag(request, log.revision)
+    return response
+
+@query_budget(5)
+@async_read_view(asaved_plans_etag)
+async def get_saved_plans(request):
+    return json_response(await aproject_saved_plans(request.user))
+
+@async_read_view(apreferences_etag)
+async def get_preferences(request):
+    prefs = await UserPreferences.objects.filter(user=request.user).prefetch_related(
+        "priority_muscles", "equipment"
+    ).afirst()
+    if prefs is None:
+        return json_response({"message": "No preferences set yet."}, status=204)
+    return json_response(UserPreferencesSerializer(prefs).data)
+
+@async_read_view(acatalog_etag)
+async def get_muscles(request):
+    return json_response(MuscleSerializer([m async for m in Muscle.objects.all()], many=True).data)
+
+@async_read_view(acatalog_etag)
+async def get_equipment(request):
+    return json_response(EquipmentSerializer([eq async for eq in Equipment.objects.all()], many=True).data)
+
+@async_read_view(acatalog_etag, authentication=stateless_authenticator)
+async def get_catalog_bundle(request):
+    # Warm, this is a cache read; cold, it builds the snapshot (sync ORM)
+    _, body = await sync_to_async(get_catalog_body)()
+    return HttpResponse(body, content_type="application/json")
@@ -3,28 +3,41 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from training.models.generic_models import Muscle, Equipment
 from training.serializers.generic_serializers import MuscleSerializer, EquipmentSerializer
-from rest_framework.decorators import api_view, permission_classes
+from django.http import HttpResponse
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from training.utils.catalog_utils import get_catalog_body
+from training.utils.etag_utils import conditional, catalog_etag
 import logging
 
 logger = logging.getLogger(__name__)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
-def get_muscles(request):    
-    if not request.user.is_authenticated:
-        return Response({'error': 'Not authenticated'}, status=401)
-    
+@conditional(catalog_etag)
+def get_muscles(request):
     muscles = Muscle.objects.all()
     serializer = MuscleSerializer(muscles, many=True)
     return Response(serializer.data)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional(catalog_etag)
 def get_equipment(request):
-    if not request.user.is_authenticated:
-        return Response({'error': 'Not authenticated'}, status=401)
-    
     equipment = Equipment.objects.all()
     serializer = EquipmentSerializer(equipment, many=True)
-    return Response(serializer.data)
\ No newline at end of file
+    return Response(serializer.data)
+
+@api_view(['GET'])
+@authentication_classes([JWTStatelessUserAuthentication])
+@permission_classes([IsAuthenticated])
+@conditional(catalog_etag)
+def get_catalog_bundle(request):
+    """
+    Muscles, equipment, patterns, movements and split templates in one response.
+    The catalog is the same for every user, so a valid token is enough (no user
+    lookup) and the pre-encoded body is served as-is: zero queries once warm.
+    """
+    _, body = get_catalog_body()
+    return HttpResponse(body, content_type='application/json')
@@ -2,45 +2,49 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from datetime import date
-from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog, SetLog, WorkoutDay, WorkoutPlan
-from training.serializers.logging_serializers import WorkoutLogSerializer
-from datetime import timedelta
+from django.db import transaction
+from training.models import WorkoutLog, WorkoutDayLog, ExerciseLog
+from training.serializers.logging_serializers import (
+    WorkoutLogSerializer, SetLogSerializer, SetLogBatchSerializer, SyncRequestSerializer, ExerciseHistorySerializer,
+)
+from training.utils.pagination_utils import InvalidCursor, keyset_page
+from training.utils.query_budget_utils import query_budget
+from training.utils.etag_utils import conditional, week_log_etag, week_log_headers
+from training.utils.logging_utils import (
+    current_week_start, tree_revision, week_log_queryset, create_week_log, owned_exercise_ids,
+    upsert_set_logs,
+)
+from training.utils.projection_utils import project_week_log
+from training.utils.sync_utils import next_revision, pull_changes, apply_push
 
+# Worst case is losing the first-of-week materialization race: a failed insert, then the winner's log
+@query_budget(19)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional(week_log_etag, week_log_headers)
 def get_week_log(request):
     user = request.user
-    today = date.today()
-    start_of_week = today - timedelta(days=today.weekday())  # Monday as start
+    start_of_week = current_week_start()
 
-    log, created = WorkoutLog.objects.get_or_create(user=user, start_date=start_of_week)
+    projected = project_week_log(user, start_of_week)
+    if projected is not None:
+        # Same payload as WorkoutLogSerializer, from column projections
+        document, cursor = projected
+        response = Response(document)
+        response["X-Sync-Cursor"] = str(cursor)
+        return response
 
-    if created:
-        # Get latest saved plan
-        plan = WorkoutPlan.objects.filter(user=user).last()
-        if not plan:
-            return Response({"error": "No saved plan found."}, status=404)
-
-        workout_days = plan.days.all().order_by("order")
-
-        for idx, day in enumerate(workout_days):
-            day_log = WorkoutDayLog.objects.create(
-                workout_log=log,
-                workout_day=day,
-                order=idx
-            )
-
-            for planned_ex in day.exercises.all():
-                ExerciseLog.objects.create(
-                    workout_day_log=day_log,
-                    name=planned_ex.name,
-                    target_sets=planned_ex.sets,
-                    target_reps=planned_ex.start_reps
-                )
+    log, created = create_week_log(user, start_of_week)
+    if log is None:
+        return Response({"error": "No saved plan found."}, status=404)
 
     serializer = WorkoutLogSerializer(log)
-    return Response(serializer.data)
+    response = Response(serializer.data)
+    response["X-Sync-Cursor"] = str(tree_revision(log))
+    if created:
+        # Materializing took the user's newest revision, which the request's ETag predates
+        response["ETag"] = week_log_etag(request, log.revision)
+    return response
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -51,18 +55,90 @@ def submit_week_log(request):
     except WorkoutLog.DoesNotExist:
         return Response({"error": "Workout log not found"}, status=404)
 
-    log.is_complete = True
-    log.save()
+    with transaction.atomic():
+        log.is_complete = True
+        log.revision = next_revision(user)
+        log.save(update_fields=["is_complete", "revision"])
     return Response({"message": "Workout week submitted!"})
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def submit_day_log(request, day_log_id):
     try:
-        day_log = WorkoutDayLog.objects.get(id=day_log_id, workout_log__user=request.user)
+        day_log = WorkoutDayLog.objects.select_related("workout_day").get(id=day_log_id, workout_log__user=request.user)
     except WorkoutDayLog.DoesNotExist:
         return Response({"error": "Workout day log not found"}, status=404)
 
-    day_log.is_complete = True
-    day_log.save()
-    return Response({"message": f"{day_log.workout_day.day_name} marked complete."})
\ No newline at end of file
+    with transaction.atomic():
+        day_log.is_complete = True
+        day_log.revision = next_revision(request.user)
+        day_log.save(update_fields=["is_complete", "revision"])
+    return Response({"message": f"{day_log.workout_day.day_name} marked complete."})
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def log_sets_batch(request):
+    """
+    Upsert many sets across many exercise logs in one request. Each set carries
+    a client-generated client_key, so retried requests never duplicate rows.
+    """
+    serializer = SetLogBatchSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    items = serializer.validated_data["sets"]
+
+    requested = {item["exercise"] for item in items}
+    missing = requested - owned_exercise_ids(request.user, requested)
+    if missing:
+        return Response({"error": "Exercise log not found", "exercises": sorted(missing)}, status=404)
+
+    sets = upsert_set_logs(request.user, items)
+    return Response({"sets": SetLogSerializer(sets, many=True).data}, status=status.HTTP_200_OK)
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def sync_workout_logs(request):
+    """
+    Delta sync: apply the client's offline changes, then return every log row
+    written or deleted since the client's cursor along with a new cursor.
+    """
+    serializer = SyncRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    cursor = serializer.validated_data["cursor"]
+    changes = serializer.validated_data.get("changes") or {}
+
+    touched = {item["exercise"] for item in changes.get("sets", [])}
+    missing = touched - owned_exercise_ids(request.user, touched) if touched else set()
+    if missing:
+        return Response({"error": "Exercise log not found", "exercises": sorted(missing)}, status=404)
+
+    if any(changes.get(key) for key in ("sets", "deleted_sets", "completed_days", "completed_weeks")):
+        apply_push(request.user, changes)
+    return Response(pull_changes(request.user, cursor))
+
+@query_budget(6)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_week_log_history(request):
+    """Past and current week logs, newest first, paged with ?cursor= and ?limit=."""
+    try:
+        logs, next_cursor = keyset_page(week_log_queryset().filter(user=request.user), request, "start_date")
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=400)
+    return Response({"results": WorkoutLogSerializer(logs, many=True).data, "next_cursor": next_cursor})
+
+@query_budget(4)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_exercise_history(request):
+    """Every logged session of ?exercise=<name> with its sets, newest week first."""
+    name = request.query_params.get("exercise")
+    if not name:
+        return Response({"error": "exercise is required"}, status=400)
+
+    # Seeks on exerciselog_history_idx (user, name, -start_date, -id) without joining the week logs
+    sessions = ExerciseLog.objects.filter(user=request.user, name=name).prefetch_related("sets")
+    try:
+        sessions, next_cursor = keyset_page(sessions, request, "start_date")
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=400)
+    return Response({"results": ExerciseHistorySerializer(sessions, many=True).data, "next_cursor": next_cursor})
\ No newline at end of file
@@ -2,7 +2,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from training.models.plans_models import WorkoutPlan
+from django.conf import settings
+from django.db.models import Prefetch
+from training.models.plans_models import WorkoutPlan, WorkoutDay, PlannedExercise
 
 from training.serializers import (
     PlanRequestSerializer,
@@ -10,39 +12,80 @@ from training.serializers import (
     WorkoutPlanSerializer,
 )
 from training.utils.plan_generation_utils import generate_plan, save_generated_plan
+from training.utils.preview_cache_utils import get_plan_preview
+from training.utils.trace_utils import GenerationTrace
+from training.utils.query_budget_utils import query_budget
+from training.utils.pagination_utils import InvalidCursor, keyset_page
+from training.utils.etag_utils import conditional, saved_plans_etag
+from training.utils.projection_utils import project_saved_plans
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def preview_plan(request):
     """
     Generate a plan in-memory from user preferences (no DB writes).
+    Staff users (or anyone in DEBUG) can pass ?trace=1 to bypass the cache and
+    get the generation trace back alongside the plan.
     """
     serializer = PlanRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
 
-    plan_dict = generate_plan(serializer.validated_data)
-    preview = PlanPreviewSerializer(plan_dict)
-    return Response(preview.data, status=status.HTTP_200_OK)
+    if request.query_params.get("trace") and (settings.DEBUG or request.user.is_staff):
+        trace = GenerationTrace()
+        plan_dict = generate_plan(serializer.validated_data, trace=trace)
+        preview_data = dict(PlanPreviewSerializer(plan_dict).data)
+        preview_data["trace"] = trace.as_dict()
+        return Response(preview_data, status=status.HTTP_200_OK)
+
+    preview_data, cache_hit = get_plan_preview(serializer.validated_data)
+    response = Response(preview_data, status=status.HTTP_200_OK)
+    response["X-Plan-Cache"] = "hit" if cache_hit else "miss"
+    return response
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def save_plan(request):
     """
-    Persist a previously generated plan (client sends the full plan JSON).
+    Persist a previously generated plan. The client either sends the full plan
+    JSON, or the original preferences plus the preview's seed, in which case
+    the plan is re-derived server-side.
     """
-    preview_serializer = PlanPreviewSerializer(data=request.data)
-    preview_serializer.is_valid(raise_exception=True)
-    plan_dict = preview_serializer.validated_data
+    if "days" not in request.data and "seed" in request.data:
+        request_serializer = PlanRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        plan_dict = generate_plan(request_serializer.validated_data)
+        if plan_dict is None:
+            return Response({"error": "No workout split found for these preferences."}, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        preview_serializer = PlanPreviewSerializer(data=request.data)
+        preview_serializer.is_valid(raise_exception=True)
+        plan_dict = preview_serializer.validated_data
 
     plan = save_generated_plan(request.user, plan_dict)
 
     output = WorkoutPlanSerializer(plan)
     return Response(output.data, status=status.HTTP_201_CREATED)
 
+@query_budget(5)
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional(saved_plans_etag)
 def get_saved_plans(request):
-    plans = WorkoutPlan.objects.filter(user=request.user)
-    serializer = WorkoutPlanSerializer(plans, many=True)
-    return Response(serializer.data)
\ No newline at end of file
+    # Same payload as WorkoutPlanSerializer(plans, many=True), from column projections
+    return Response(project_saved_plans(request.user))
+
+@query_budget(5)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def get_plan_history(request):
+    """Saved plans newest first, paged with ?cursor= and ?limit=."""
+    plans = WorkoutPlan.objects.filter(user=request.user).prefetch_related(
+        Prefetch("days", queryset=WorkoutDay.objects.order_by("id")),
+        Prefetch("days__exercises", queryset=PlannedExercise.objects.order_by("id")),
+    )
+    try:
+        plans, next_cursor = keyset_page(plans, request, "created_at")
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=400)
+    return Response({"results": WorkoutPlanSerializer(plans, many=True).data, "next_cursor": next_cursor})
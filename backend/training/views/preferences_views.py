@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from training.models.preference_model import UserPreferences
 from training.serializers.preferences_serializers import UserPreferencesSerializer
+from training.utils.etag_utils import conditional, preferences_etag
 
 @api_view(["POST", "PUT"])
 @permission_classes([IsAuthenticated])
@@ -20,6 +21,7 @@ def save_preferences(request):
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional(preferences_etag)
 def get_preferences(request):
     try:
         prefs = request.user.userpreferences
@@ -1,11 +1,17 @@
 // api/api.ts - Add debugging
-import axios from 'axios';
+import axios, { RawAxiosResponseHeaders } from 'axios';
 import * as SecureStore from 'expo-secure-store';
 
 const api = axios.create({
   baseURL: process.env.EXPO_PUBLIC_API_URL || 'http://localhost:8000',
 });
 
+// Last ETag, body and headers per GET url, so unchanged resources come back as an empty 304.
+// Headers are kept because some carry state with the body (X-Sync-Cursor on the week log).
+const etagCache = new Map<string, { etag: string; data: unknown; headers: RawAxiosResponseHeaders }>();
+
+export const clearEtagCache = () => etagCache.clear();
+
 // Request interceptor to add auth token
 api.interceptors.request.use(
   async (config) => {
@@ -15,6 +21,12 @@ api.interceptors.request.use(
       if (token) {
         config.headers.Authorization = `Bearer ${token}`;
       }
+
+      const cached = config.method === 'get' && config.url ? etagCache.get(config.url) : undefined;
+      if (cached) {
+        config.headers['If-None-Match'] = cached.etag;
+        config.validateStatus = (status) => (status >= 200 && status < 300) || status === 304;
+      }
       
       return config;
     } catch (error) {
@@ -29,6 +41,20 @@ api.interceptors.request.use(
 // Response interceptor to handle token refresh
 api.interceptors.response.use(
   (response) => {
+    const url = response.config.url;
+    if (response.config.method !== 'get' || !url) {
+      return response;
+    }
+    if (response.status === 304 && etagCache.has(url)) {
+      const cached = etagCache.get(url)!;
+      // The 304's own headers win; anything it omits comes from the cached 200
+      const headers: RawAxiosResponseHeaders = { ...cached.headers, ...response.headers };
+      return { ...response, status: 200, data: cached.data, headers };
+    }
+    const etag = response.headers['etag'];
+    if (response.status === 200 && etag) {
+      etagCache.set(url, { etag, data: response.data, headers: { ...response.headers } });
+    }
     return response;
   },
   async (error) => {
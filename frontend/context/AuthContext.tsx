@@ -1,6 +1,7 @@
 import { createContext, useContext, useEffect, useState, useCallback } from "react";
 import axios from "axios";
 import * as SecureStore from "expo-secure-store";
+import { clearEtagCache } from "@/api/api";
 
 interface AuthState {
     accessToken: string | null;
@@ -366,6 +367,7 @@ export const AuthProvider = ({ children }: { children: React.ReactNode }) => {
             await SecureStore.deleteItemAsync(ACCESS_TOKEN_KEY);
             await SecureStore.deleteItemAsync(REFRESH_TOKEN_KEY);
             delete axios.defaults.headers.common['Authorization'];
+            clearEtagCache();
             
             setAuthState({
                 accessToken: null,
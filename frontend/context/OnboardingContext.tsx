@@ -30,11 +30,10 @@ interface OnboardingContextType {
   nextStep: () => void;
   prevStep: () => void;
   goToStep: (step: number) => void;
-  generatePlan: () => Promise<boolean>;
+  generatePlan: (options?: { reseed?: boolean }) => Promise<boolean>;
   savePlan: () => Promise<boolean>;
   resetOnboarding: () => void;
-  fetchMuscles: () => Promise<void>;
-  fetchEquipment: () => Promise<void>;
+  fetchCatalog: () => Promise<void>;
   setLoading: (loading: boolean) => void;
   setError: (error: string | null) => void;
 }
@@ -62,33 +61,21 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
     equipmentOptions: [],
   });
 
-  // Fetch muscles from API
-  const fetchMuscles = useCallback(async () => {
+  // Fetch muscles and equipment in one request from the catalog bundle
+  const fetchCatalog = useCallback(async () => {
     try {
       setState(prev => ({ ...prev, loading: true }));
-      
-      // Debug: Check token before making request
-      const token = await SecureStore.getItemAsync('access_token');
-      console.log('Token exists:', !!token);
-      
-      const response = await api.get('/api/muscles/');
-      setState(prev => ({ ...prev, muscles: response.data, loading: false }));
-    } catch (error: any) {
-      console.error('Error fetching muscles:', error.response?.data || error.message);
-      setState(prev => ({ ...prev, error: 'Failed to fetch muscles', loading: false }));
-    }
-  }, []);
 
-  // Fetch equipment from API
-  const fetchEquipment = useCallback(async () => {
-    try {
-      setState(prev => ({ ...prev, loading: true }));
-      
-      const response = await api.get('/api/equipment/');
-      setState(prev => ({ ...prev, equipmentOptions: response.data, loading: false }));
-    } catch (error) {
-      console.error('Error fetching equipment:', error);
-      setState(prev => ({ ...prev, error: 'Failed to fetch equipment', loading: false }));
+      const response = await api.get('/api/catalog/');
+      setState(prev => ({
+        ...prev,
+        muscles: response.data.muscles,
+        equipmentOptions: response.data.equipment,
+        loading: false,
+      }));
+    } catch (error: any) {
+      console.error('Error fetching catalog:', error.response?.data || error.message);
+      setState(prev => ({ ...prev, error: 'Failed to fetch catalog', loading: false }));
     }
   }, []);
 
@@ -104,10 +91,7 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
           
           // Only update state if component is still mounted
           if (isMounted) {
-            await Promise.all([
-              fetchMuscles(),
-              fetchEquipment()
-            ]);
+            await fetchCatalog();
           }
         }
       } catch (error) {
@@ -126,7 +110,7 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
     return () => {
       isMounted = false;
     };
-  }, [authState.authenticated, authState.user, fetchMuscles, fetchEquipment]);
+  }, [authState.authenticated, authState.user, fetchCatalog]);
   
   const updatePreferences = useCallback((preferences: Partial<OnboardingPreferences>) => {
     setState(prev => ({
@@ -207,7 +191,7 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
     }, 0);
   }, []);
 
-  const generatePlan = useCallback(async (): Promise<boolean> => {
+  const generatePlan = useCallback(async (options?: { reseed?: boolean }): Promise<boolean> => {
     try {
       setState(prev => ({ ...prev, loading: true, error: null }));
       
@@ -219,12 +203,16 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
         return false;
       }
 
+      // Reuse the last preview's seed so repeat requests are served from the server cache
+      const seed = options?.reseed ? undefined : state.generatedPlan?.seed;
+
       const response = await api.post('/api/plan/preview/', {
         days_per_week: preferences.days_per_week,
         training_age: preferences.training_age,
         volume: preferences.volume,
         bodyweight_exercises: preferences.bodyweight_exercises,
         equipment: preferences.equipment || [],
+        ...(seed !== undefined && seed !== null ? { seed } : {}),
       });
 
       setState(prev => ({ 
@@ -244,7 +232,7 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
       }));
       return false;
     }
-  }, [state.preferences]);
+  }, [state.preferences, state.generatedPlan]);
 
   const savePlan = useCallback(async (): Promise<boolean> => {
     try {
@@ -308,8 +296,7 @@ export const OnboardingProvider = ({ children }: { children: React.ReactNode })
         generatePlan,
         savePlan,
         resetOnboarding,
-        fetchMuscles,
-        fetchEquipment,
+        fetchCatalog,
         setLoading,
         setError,
       }}
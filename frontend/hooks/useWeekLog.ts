@@ -1,5 +1,5 @@
-import { useEffect, useState } from 'react';
-import { WeekDay } from '@/types/logging';
+import { useEffect, useRef, useState } from 'react';
+import { SetLog, SyncChanges, SyncResponse, WeekDay } from '@/types/logging';
 import api from '@/api/api';
 
 export const useWeekLog = () => {
@@ -7,6 +7,7 @@ export const useWeekLog = () => {
   const [selectedDayIndex, setSelectedDayIndex] = useState<number>(0);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const syncCursor = useRef(0);
 
   useEffect(() => {
     initializeWeekView();
@@ -49,6 +50,10 @@ export const useWeekLog = () => {
       setLoading(true);
       const response = await api.get('/api/workout/log/week/');
       const log = response.data;
+      const cursor = response.headers['x-sync-cursor'];
+      if (cursor !== undefined) {
+        syncCursor.current = Number(cursor);
+      }
 
       const today = new Date();
       const weekStart = new Date(today);
@@ -82,6 +87,47 @@ export const useWeekLog = () => {
     }
   };
 
+  // Sends every pending set in one request; client_key makes retries safe
+  const logSets = async (sets: (SetLog & { exercise: number; client_key: string })[]) => {
+    const response = await api.post('/api/workout/log/sets/batch/', { sets });
+    return response.data.sets as SetLog[];
+  };
+
+  // Pushes offline changes and merges back only what changed since the last cursor
+  const syncLog = async (changes: SyncChanges = {}) => {
+    const response = await api.post('/api/workout/log/sync/', { cursor: syncCursor.current, changes });
+    const delta: SyncResponse = response.data;
+    syncCursor.current = delta.cursor;
+
+    const deletedSets = new Set(delta.deleted.filter((d) => d.model === 'set').map((d) => d.object_id));
+    const completedDays = new Map(delta.days.map((d) => [d.id, d.is_complete]));
+
+    setWeekDays((days) =>
+      days.map((day) => {
+        const log = day.workoutLog;
+        if (!log) return day;
+        return {
+          ...day,
+          workoutLog: {
+            ...log,
+            is_complete: completedDays.get(log.id!) ?? log.is_complete,
+            exercises: log.exercises.map((exercise) => {
+              const changed = delta.sets.filter((s) => s.exercise_id === exercise.id);
+              const kept = exercise.sets.filter(
+                (s) => !deletedSets.has(s.id!) && !changed.some((c) => c.id === s.id)
+              );
+              return {
+                ...exercise,
+                sets: [...kept, ...changed].sort((a, b) => a.set_number - b.set_number),
+              };
+            }),
+          },
+        };
+      })
+    );
+    return delta;
+  };
+
   return {
     weekDays,
     selectedDayIndex,
@@ -89,5 +135,7 @@ export const useWeekLog = () => {
     loading,
     error,
     reload: initializeWeekView,
+    logSets,
+    syncLog,
   };
 };
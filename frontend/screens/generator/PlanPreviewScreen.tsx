@@ -31,9 +31,9 @@ export default function PlanPreviewScreen() {
     }
   }, [state.loading]); // Removed state.generatedPlan from dependencies
 
-  const handleGeneratePlan = async () => {
+  const handleGeneratePlan = async (reseed: boolean = false) => {
     setIsGenerating(true);
-    const success = await generatePlan();
+    const success = await generatePlan({ reseed });
     setIsGenerating(false);
     
     if (!success) {
@@ -65,7 +65,7 @@ export default function PlanPreviewScreen() {
       'Are you sure you want to generate a new plan? This will replace your current plan.',
       [
         { text: 'Cancel', style: 'cancel' },
-        { text: 'Yes', onPress: handleGeneratePlan },
+        { text: 'Yes', onPress: () => handleGeneratePlan(true) },
       ]
     );
   };
@@ -143,7 +143,7 @@ export default function PlanPreviewScreen() {
           <View className="w-full max-w-sm space-y-3">
             <Button
               title="Try Again"
-              onPress={handleGeneratePlan}
+              onPress={() => handleGeneratePlan()}
               disabled={isGenerating}
             />
             <Button
@@ -165,7 +165,7 @@ export default function PlanPreviewScreen() {
         </Text>
         <Button
           title="Generate Plan"
-          onPress={handleGeneratePlan}
+          onPress={() => handleGeneratePlan()}
           disabled={isGenerating}
         />
       </View>
@@ -20,15 +20,13 @@ export default function PreferencesScreen() {
     nextStep, 
     prevStep, 
     setError, 
-    fetchMuscles, 
-    fetchEquipment 
+    fetchCatalog 
   } = useOnboarding();
   
   const { authState } = useAuth();
 
   useEffect(() => {
-    if (state.muscles.length === 0) fetchMuscles();
-    if (state.equipmentOptions.length === 0) fetchEquipment();
+    if (state.muscles.length === 0 || state.equipmentOptions.length === 0) fetchCatalog();
   }, []);
 
   const [formData, setFormData] = useState({
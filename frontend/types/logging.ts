@@ -6,6 +6,7 @@ export interface SetLog {
     rpe?: number;
     notes?: string;
     source: 'manual' | 'auto';
+    client_key?: string;
   }
   
   export interface ExerciseLog {
@@ -13,6 +14,7 @@ export interface SetLog {
     name: string;
     target_sets: number;
     target_reps: number;
+    target_weight?: number | null;
     sets: SetLog[];
   }
   
@@ -35,4 +37,19 @@ export interface SetLog {
     isFuture: boolean;
     workoutLog?: WorkoutLog;
   }
-  
\ No newline at end of file
+  
+  export interface SyncChanges {
+    sets?: (SetLog & { exercise: number; client_key: string })[];
+    deleted_sets?: { exercise: number; client_key: string }[];
+    completed_days?: number[];
+    completed_weeks?: number[];
+  }
+
+  export interface SyncResponse {
+    cursor: number;
+    logs: { id: number; start_date: string; is_complete: boolean; revision: number }[];
+    days: { id: number; workout_log_id: number; order: number; is_complete: boolean; revision: number }[];
+    exercises: { id: number; workout_day_log_id: number; name: string; target_sets: number; target_reps: number; target_weight: number | null; revision: number }[];
+    sets: (SetLog & { exercise_id: number; revision: number })[];
+    deleted: { model: string; object_id: number }[];
+  }